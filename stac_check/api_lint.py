@@ -1,12 +1,196 @@
+import contextlib
+import importlib.metadata
+import itertools
+import multiprocessing
+import queue
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, Generator, List, Optional, Tuple
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 from urllib.parse import urlparse, urlunparse
 
-from stac_validator.utilities import fetch_and_parse_file
-
-from stac_check.fast_validator_wrapper import validate_collection_fast
+from stac_validator.utilities import is_valid_url
+
+from stac_check import json_backend
+from stac_check.compression import strip_compression_suffix
+from stac_check.document import StacDocument
+from stac_check.fast_validator_wrapper import (
+    RefResolutionError,
+    validate_collection_fast,
+    validate_item_fast,
+)
+from stac_check.geometry import GeometrySummary, summarize_geometries
+from stac_check.geoparquet import is_geoparquet, iter_geoparquet_objects
+from stac_check.http_client import fetch_and_parse_file
 from stac_check.lint import Linter
+from stac_check.result_store import ResultStore
+from stac_check.schema_bundle import bundle_identity, use_schema_bundle
+from stac_check.schema_cache import active_cache_dir, init_worker
+from stac_check.streaming import is_ndjson, iter_features, iter_ndjson_lines
+
+# Number of objects sent to a worker process in one task when linting with --workers
+DEFAULT_CHUNK_SIZE = 16
+
+# Number of objects whose geometries are checked in one vectorized call with --batch-geometry
+DEFAULT_GEOMETRY_BATCH_SIZE = 1000
+
+
+def _lint_object(
+    obj: Dict,
+    obj_url: str,
+    geometry: Optional[GeometrySummary] = None,
+    verbose: bool = False,
+    fast: bool = False,
+    config: Optional[Dict] = None,
+    schema_bundle: Optional[str] = None,
+) -> Dict:
+    """Lint a single object from an endpoint.
+
+    This is a module level function so it can be sent to worker processes.
+
+    Args:
+        obj (Dict): The STAC object to lint.
+        obj_url (str): The URL or path reported for the object.
+        geometry (Optional[GeometrySummary]): The summary of the object's geometry, when
+            computed for a whole batch of objects.
+        verbose (bool): Whether to include verbose error output.
+        fast (bool): Whether to use fast validation.
+        config (Optional[Dict]): The parsed linting configuration.
+        schema_bundle (Optional[str]): The path of a schema bundle to resolve every remote schema from.
+
+    Returns:
+        Dict: The validation result, matching the message structure of the Linter class.
+    """
+    try:
+        linter = Linter(
+            obj,
+            verbose=verbose,
+            fast=fast,
+            config=config,
+            precomputed_geometry=geometry,
+            schema_bundle=schema_bundle,
+        )
+        msg = dict(linter.message)
+        msg["path"] = obj_url
+        msg["best_practices"] = linter.best_practices_msg
+        msg["geometry_errors"] = linter.geometry_errors_msg
+        return msg
+    except Exception as e:
+        return _error_message(obj_url, e)
+
+
+def _error_message(obj_url: str, error: Exception) -> Dict:
+    """Build the result of an object that could not be linted.
+
+    Args:
+        obj_url (str): The URL or path reported for the object.
+        error (Exception): The error raised while decoding or linting the object.
+
+    Returns:
+        Dict: A failed validation result, matching the message structure of the Linter class.
+    """
+    return {
+        "path": obj_url,
+        "valid_stac": False,
+        "error_type": type(error).__name__,
+        "error_message": str(error),
+        "best_practices": [],
+        "geometry_errors": [],
+        "version": None,
+        "schema": [],
+        "recommendation": None,
+        "error_verbose": None,
+        "failed_schema": None,
+    }
+
+
+def _decode_line(line: str) -> Any:
+    """Decode an NDJSON line, keeping the line itself if it is not valid JSON.
+
+    Args:
+        line (str): The undecoded line.
+
+    Returns:
+        Any: The decoded value, or `line` so its error is reported when it is linted.
+    """
+    try:
+        return json_backend.loads(line)
+    except ValueError:
+        return line
+
+
+def _lint_ndjson_line(
+    line: Union[str, Dict],
+    line_url: str,
+    geometry: Optional[GeometrySummary] = None,
+    source: str = "",
+    lint_func: Callable[..., Dict] = _lint_object,
+) -> Dict:
+    """Decode and lint the object on one line of an NDJSON file.
+
+    This is a module level function so it can be sent to worker processes, where the
+    lines of a chunk are then parsed in parallel.
+
+    Args:
+        line (Union[str, Dict]): The undecoded line, or the object already decoded from it.
+        line_url (str): The source and line number of the line, reported for lines
+            that are not valid JSON objects or have no ID.
+        geometry (Optional[GeometrySummary]): The summary of the object's geometry, when
+            computed for a whole batch of objects.
+        source (str): The path of the NDJSON file.
+        lint_func (Callable[..., Dict]): The function linting the decoded object.
+
+    Returns:
+        Dict: The validation result.
+    """
+    try:
+        obj = json_backend.loads(line) if isinstance(line, str) else line
+        if not isinstance(obj, dict):
+            raise ValueError(f"Expected a JSON object but found {type(obj).__name__}")
+    except ValueError as e:
+        return _error_message(line_url, e)
+    obj_id = obj.get("id")
+    return lint_func(obj, f"{source}/{obj_id}" if obj_id else line_url, geometry)
+
+
+def _lint_object_fast(
+    obj: Dict,
+    obj_url: str,
+    geometry: Optional[GeometrySummary] = None,
+    **kwargs: Any,
+) -> Dict:
+    """Validate a single object from an endpoint with FastValidator.
+
+    This is a module level function so it can be sent to worker processes.
+
+    Args:
+        obj (Dict): The STAC object to validate.
+        obj_url (str): The URL or path reported for the object.
+        geometry (Optional[GeometrySummary]): The summary of the object's geometry, when
+            computed for a whole batch of objects.
+        **kwargs: The other arguments of validate_item_fast.
+
+    Returns:
+        Dict: The validation result.
+    """
+    try:
+        return validate_item_fast(obj, obj_url, geometry=geometry, **kwargs)
+    except (RefResolutionError, LookupError) as e:
+        return _error_message(obj_url, e)
 
 
 @dataclass
@@ -23,6 +207,30 @@ class ApiLinter:
             (e.g. "features", "collections").
         pages (int): Number of pages to fetch. Defaults to 1.
         headers (Optional[Dict], optional): Optional headers for HTTP requests. Defaults to None.
+        document (Optional[StacDocument], optional): The already loaded first page of `source`.
+            When given, it is used instead of fetching `source` again. Defaults to None.
+        stream (bool, optional): Read the features of a local FeatureCollection file one at
+            a time instead of loading the whole file. Results then do not include the
+            original objects. Always set for NDJSON sources (.ndjson or .jsonl files, or
+            "-" for standard input), which hold one object per line, and for stac-geoparquet
+            sources (.parquet or .geoparquet files), read one record batch at a time.
+            Defaults to False.
+        workers (int, optional): Number of processes used to lint objects. Values above 1
+            lint objects in a process pool; results keep their original order. Defaults to 1.
+        chunk_size (int, optional): Number of objects sent to a worker process at a time.
+            Defaults to DEFAULT_CHUNK_SIZE.
+        prefetch (int, optional): Number of pages fetched in the background while the
+            current page is linted. 0 fetches each page only when it is needed. Defaults to 1.
+        batch_geometry (bool, optional): Check the geometries of up to `geometry_batch_size`
+            objects at once, with one vectorized call over all their coordinates. Geometry
+            errors are then also reported in fast mode. Defaults to False.
+        geometry_batch_size (int, optional): Number of objects whose geometries are checked
+            together. Defaults to DEFAULT_GEOMETRY_BATCH_SIZE.
+        schema_bundle (Optional[str], optional): The path of a schema bundle. When given, every
+            remote schema is resolved from the bundle and never fetched. Defaults to None.
+        result_store (Optional[ResultStore], optional): A store of earlier results. When given,
+            objects whose content did not change are not linted again, and the results of the
+            other objects are added to the store. Defaults to None.
 
     Attributes:
         source (str): The source URL or file path.
@@ -42,6 +250,15 @@ class ApiLinter:
         verbose: bool = False,
         fast: bool = False,
         fast_linting: bool = False,
+        document: Optional[StacDocument] = None,
+        stream: bool = False,
+        workers: int = 1,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        prefetch: int = 1,
+        batch_geometry: bool = False,
+        geometry_batch_size: int = DEFAULT_GEOMETRY_BATCH_SIZE,
+        schema_bundle: Optional[str] = None,
+        result_store: Optional[ResultStore] = None,
     ):
         self.source = source
         self.object_list_key = object_list_key
@@ -50,6 +267,16 @@ class ApiLinter:
         self.verbose = verbose
         self.fast = fast
         self.fast_linting = fast_linting
+        self.document = document
+        # NDJSON is always read line by line, and stac-geoparquet batch by batch
+        self.stream = stream or is_ndjson(source) or is_geoparquet(source)
+        self.workers = max(workers, 1)
+        self.chunk_size = max(chunk_size, 1)
+        self.prefetch = max(prefetch, 0)
+        self.batch_geometry = batch_geometry
+        self.geometry_batch_size = max(geometry_batch_size, 1)
+        self.schema_bundle = schema_bundle
+        self.result_store = result_store
         self.version = None
         self.validator_version = self._get_validator_version()
         self.start_time = time.time()
@@ -63,10 +290,8 @@ class ApiLinter:
             str: The version string of stac-validator, or "unknown" if not available.
         """
         try:
-            import stac_validator
-
-            return getattr(stac_validator, "__version__", "unknown")
-        except ImportError:
+            return importlib.metadata.distribution("stac-valid").version
+        except importlib.metadata.PackageNotFoundError:
             return "unknown"
 
     def set_update_message(self) -> str:
@@ -86,6 +311,8 @@ class ApiLinter:
     def _fetch_and_parse(self, url: str) -> Dict:
         """Fetch and parse a STAC file from a URL.
 
+        URLs are fetched with the shared HTTP session, so pages reuse pooled connections.
+
         Args:
             url (str): The URL to fetch the STAC file from.
 
@@ -94,19 +321,126 @@ class ApiLinter:
         """
         return fetch_and_parse_file(url, self.headers)
 
-    def iterate_objects(self) -> Generator[Tuple[Dict, str], None, None]:
-        """Iterate through all objects in the endpoint, following pagination if necessary.
+    def iterate_pages(self) -> Generator[Tuple[str, Dict], None, None]:
+        """Iterate through the pages of the endpoint by following "next" links.
 
-        This generator yields each object in the endpoint along with its URL.
-        It handles pagination by following "next" links and prevents duplicate objects
-        by tracking seen IDs.
+        Stops after `pages` pages, or when a page has no "next" link or links to itself.
 
         Yields:
-            Tuple[Dict, str]: A tuple containing (object_dict, object_url) for each object.
+            Tuple[str, Dict]: A tuple containing (page_url, page_dict) for each page.
         """
         stac_file = self.source
         page = 1
-        seen_ids = set()
+
+        while stac_file:
+            # The first page may already have been loaded by the caller
+            if page == 1 and self.document is not None and self.document.error is None:
+                response = self.document.data
+            else:
+                response = self._fetch_and_parse(stac_file)
+            yield stac_file, response
+            stac_file = self.next_page_url(stac_file, response, page)
+            page += 1
+
+    def next_page_url(self, stac_file: str, response: Dict, page: int) -> Optional[str]:
+        """Return the URL of the page following a page, if it should be linted.
+
+        Args:
+            stac_file (str): The URL or path the page was loaded from.
+            response (Dict): The parsed page.
+            page (int): The number of the page, starting at 1.
+
+        Returns:
+            Optional[str]: The href of the page's "next" link, or None after `pages`
+                pages, or when the page has no "next" link or links to itself.
+        """
+        # Pagination: look for 'next' link
+        next_link = None
+        for link in response.get("links", []):
+            if link.get("rel") == "next":
+                next_link = link.get("href")
+                break
+        # Check if we should continue to the next page
+        if next_link and next_link != stac_file and page < self.pages:
+            return next_link
+        return None
+
+    def prefetch_pages(self) -> Generator[Tuple[str, Dict], None, None]:
+        """Iterate through the pages of the endpoint, fetching upcoming pages in the background.
+
+        A background thread walks the pages with `iterate_pages` and keeps up to
+        `prefetch` pages ready, so fetching the next pages overlaps with linting the
+        current one. Only pages that `iterate_pages` would fetch are requested.
+
+        Yields:
+            Tuple[str, Dict]: A tuple containing (page_url, page_dict) for each page.
+
+        Raises:
+            Exception: Any error raised while fetching a page, re-raised in the caller.
+        """
+        if self.prefetch < 1:
+            yield from self.iterate_pages()
+            return
+
+        # A slot is taken before fetching a page and freed when the page is handed
+        # over, so at most `prefetch` pages are fetched ahead of the current one
+        slots = threading.Semaphore(self.prefetch)
+        buffer: queue.Queue = queue.Queue()
+        stop = threading.Event()
+
+        def acquire() -> bool:
+            # Wait for a free slot unless the consumer has gone away
+            while not stop.is_set():
+                if slots.acquire(timeout=0.1):
+                    return True
+            return False
+
+        def produce() -> None:
+            pages = self.iterate_pages()
+            try:
+                while True:
+                    if not acquire():
+                        return
+                    try:
+                        page = next(pages)
+                    except StopIteration:
+                        break
+                    buffer.put(("page", page))
+            except Exception as e:
+                buffer.put(("error", e))
+                return
+            buffer.put(("done", None))
+
+        thread = threading.Thread(target=produce, daemon=True)
+        thread.start()
+        try:
+            while True:
+                kind, value = buffer.get()
+                if kind == "error":
+                    raise value
+                if kind == "done":
+                    return
+                slots.release()
+                yield value
+        finally:
+            stop.set()
+
+    def page_objects(
+        self, stac_file: str, response: Dict, seen_ids: Set
+    ) -> Generator[Tuple[Dict, str], None, None]:
+        """Iterate through the objects of a single page.
+
+        Objects whose ID is already in `seen_ids` are skipped, and the IDs of yielded
+        objects are added to it.
+
+        Args:
+            stac_file (str): The URL or path the page was loaded from.
+            response (Dict): The parsed page.
+            seen_ids (Set): The IDs of objects already yielded from earlier pages.
+
+        Yields:
+            Tuple[Dict, str]: A tuple containing (object_dict, object_url) for each object.
+        """
 
         def get_base_url(url: str) -> str:
             """Extract the base URL without query parameters or fragments.
@@ -120,53 +454,324 @@ class ApiLinter:
             parsed = urlparse(url)
             return urlunparse(parsed._replace(query="", fragment=""))
 
-        while stac_file:
-            response = self._fetch_and_parse(stac_file)
-            objects = response.get(self.object_list_key, [])
-            for obj in objects:
-                obj_id = obj.get("id")
-                base_url = get_base_url(stac_file)
-                obj_url = f"{base_url}/{obj_id}" if obj_id else base_url
-                # Only yield if not seen before (protects against duplicates from bad APIs)
-                if obj_id not in seen_ids:
-                    seen_ids.add(obj_id)
-                    yield obj, obj_url
-            # Pagination: look for 'next' link
-            next_link = None
-            for link in response.get("links", []):
-                if link.get("rel") == "next":
-                    next_link = link.get("href")
-                    break
-            # Check if we should continue to the next page
-            if next_link and next_link != stac_file and page < self.pages:
-                stac_file = next_link
-                page += 1
-            else:
+        objects = response.get(self.object_list_key, [])
+        for obj in objects:
+            obj_id = obj.get("id")
+            base_url = get_base_url(stac_file)
+            obj_url = f"{base_url}/{obj_id}" if obj_id else base_url
+            # Only yield if not seen before (protects against duplicates from bad APIs)
+            if obj_id not in seen_ids:
+                seen_ids.add(obj_id)
+                yield obj, obj_url
+
+    def iterate_objects(self) -> Generator[Tuple[Dict, str], None, None]:
+        """Iterate through all objects in the endpoint, following pagination if necessary.
+
+        This generator yields each object in the endpoint along with its URL.
+        It handles pagination by following "next" links, fetching upcoming pages in
+        the background, and prevents duplicate objects by tracking seen IDs.
+
+        Yields:
+            Tuple[Dict, str]: A tuple containing (object_dict, object_url) for each object.
+        """
+        seen_ids: Set = set()
+        for stac_file, response in self.prefetch_pages():
+            yield from self.page_objects(stac_file, response, seen_ids)
+
+    def summarize_objects(
+        self, objects: Iterable[Tuple[Dict, str]]
+    ) -> Generator[Tuple[Dict, str, Optional[GeometrySummary]], None, None]:
+        """Attach a geometry summary to each object, computed for batches of objects at once.
+
+        The coordinates of up to `geometry_batch_size` objects are packed into one array
+        and checked with one vectorized call; each summary is attributed back to its object.
+
+        Args:
+            objects (Iterable[Tuple[Dict, str]]): The (object, object_url) pairs to lint.
+
+        Yields:
+            Tuple[Dict, str, Optional[GeometrySummary]]: The object, its URL and the
+                summary of its geometry, in input order.
+        """
+        objects = iter(objects)
+        while True:
+            batch = list(itertools.islice(objects, self.geometry_batch_size))
+            if not batch:
                 break
+            summaries = summarize_geometries(
+                [
+                    obj.get("geometry") if isinstance(obj, dict) else None
+                    for obj, _ in batch
+                ]
+            )
+            for (obj, obj_url), summary in zip(batch, summaries):
+                yield obj, obj_url, summary
+
+    def _executor(self) -> ContextManager[Optional[ProcessPoolExecutor]]:
+        """Return the process pool objects are linted in, None when linting in this process.
 
-    def lint_all(self) -> List[Dict]:
-        """Lint all objects in the endpoint, handling pagination if configured.
+        Returns:
+            ContextManager[Optional[ProcessPoolExecutor]]: A context yielding the pool.
+        """
+        if self.workers == 1:
+            return contextlib.nullcontext()
+        # Forking while the prefetch thread runs and the shared session holds pooled
+        # connections can deadlock the workers, so they are spawned
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_worker,
+            initargs=(active_cache_dir(),),
+        )
+
+    def _batches(
+        self, objects: Iterable[Tuple[Any, ...]], batch_size: int
+    ) -> Generator[List[Tuple[Any, ...]], None, None]:
+        """Split objects into lists of at most `batch_size` entries, reading them lazily.
 
-        This method processes all objects in the endpoint (up to the specified number of pages),
-        validates each object using the Linter class, and collects the results.
-        It ensures only one result per asset URL and preserves the original object
-        for potential further processing.
+        Args:
+            objects (Iterable[Tuple[Any, ...]]): The entries to split.
+            batch_size (int): The maximum number of entries in a batch.
+
+        Yields:
+            List[Tuple[Any, ...]]: The batches, in input order.
+        """
+        objects = iter(objects)
+        while True:
+            batch = list(itertools.islice(objects, batch_size))
+            if not batch:
+                return
+            yield batch
+
+    def _map_batch(
+        self,
+        executor: Optional[ProcessPoolExecutor],
+        lint_func: Callable[..., Dict],
+        batch: List[Tuple[Any, ...]],
+    ) -> Iterable[Dict]:
+        """Apply a lint function to a batch of objects.
+
+        Args:
+            executor (Optional[ProcessPoolExecutor]): The pool from `_executor`.
+            lint_func (Callable[..., Dict]): A picklable function taking the values of an
+                entry and returning the validation result.
+            batch (List[Tuple[Any, ...]]): The (object, object_url, ...) tuples to lint.
 
         Returns:
-            List[Dict]: A list of validation result dictionaries, one per object,
-                matching the message structure of the Linter class.
+            Iterable[Dict]: The result of each entry, in input order.
         """
-        results_by_url = {}
+        if executor is None or not batch:
+            return (lint_func(*args) for args in batch)
+        return executor.map(lint_func, *zip(*batch), chunksize=self.chunk_size)
+
+    def _map_objects(
+        self,
+        lint_func: Callable[..., Dict],
+        objects: Iterable[Tuple[Any, ...]],
+    ) -> Generator[Tuple[Dict, str, Dict], None, None]:
+        """Apply a lint function to each object, in a process pool if workers are configured.
+
+        Objects are submitted in bounded batches of chunks, so a streamed source is never
+        read far ahead of the results being consumed.
+
+        Args:
+            lint_func (Callable[..., Dict]): A picklable function taking an object, its URL
+                and any extra values of its tuple, and returning the validation result.
+            objects (Iterable[Tuple[Any, ...]]): The (object, object_url, ...) tuples to lint.
+
+        Yields:
+            Tuple[Dict, str, Dict]: The object, its URL and its result, in input order.
+        """
+        # Without workers each object is linted as soon as it is read
+        batch_size = self.workers * self.chunk_size * 4 if self.workers > 1 else 1
+        with self._executor() as executor:
+            for batch in self._batches(objects, batch_size):
+                for args, msg in zip(
+                    batch, self._map_batch(executor, lint_func, batch)
+                ):
+                    yield args[0], args[1], msg
+
+    def _map_stored_objects(
+        self,
+        lint_func: Callable[..., Dict],
+        objects: Iterable[Tuple[Any, ...]],
+        config: Optional[Dict],
+    ) -> Generator[Tuple[Dict, str, Dict], None, None]:
+        """Like `_map_objects`, reusing the results of `result_store` for unchanged objects.
+
+        Args:
+            lint_func (Callable[..., Dict]): A picklable function taking the values of an
+                entry and returning the validation result.
+            objects (Iterable[Tuple[Any, ...]]): The (object, object_url, ...) tuples to lint.
+            config (Optional[Dict]): The linting configuration used by `lint_func`.
+
+        Yields:
+            Tuple[Dict, str, Dict]: The object, its URL and its result, in input order.
+
+        Raises:
+            ValueError: If the linter has no result_store.
+        """
+        if self.result_store is None:
+            raise ValueError("Reusing stored results requires a result_store")
+        flags = {
+            "verbose": self.verbose,
+            "fast": self.fast,
+            "fast_linting": self.fast_linting,
+            "schema_bundle": bundle_identity(self.schema_bundle),
+        }
+        with self._executor() as executor:
+            for batch in self._batches(objects, self.workers * self.chunk_size * 4):
+                keys = [
+                    self.result_store.key("object", args[0], args[1], flags, config)
+                    for args in batch
+                ]
+                stored = self.result_store.get_many(keys)
+                # Only the objects without a stored result are linted
+                linted = iter(
+                    self._map_batch(
+                        executor,
+                        lint_func,
+                        [args for args, msg in zip(batch, stored) if msg is None],
+                    )
+                )
+                new_results = []
+                for args, key, msg in zip(batch, keys, stored):
+                    if msg is None:
+                        msg = next(linted)
+                        new_results.append((key, msg))
+                    yield args[0], args[1], msg
+                self.result_store.put_many(new_results)
+
+    def lint_objects(
+        self,
+        lint_func: Callable[..., Dict],
+        objects: Iterable[Tuple[Any, ...]],
+        config: Optional[Dict] = None,
+        summarized: bool = False,
+    ) -> Generator[Tuple[Dict, str, Dict], None, None]:
+        """Lint objects, checking their geometries in batches when `batch_geometry` is set.
+
+        With a `result_store`, objects whose content did not change since they were
+        stored are not linted again.
+
+        Args:
+            lint_func (Callable[..., Dict]): A picklable function taking an object, its URL
+                and, with `batch_geometry`, the summary of its geometry.
+            objects (Iterable[Tuple[Any, ...]]): The (object, object_url) pairs to lint.
+            config (Optional[Dict]): The linting configuration used by `lint_func`, part
+                of the key of stored results.
+            summarized (bool): Whether `objects` already are (object, object_url, summary)
+                tuples, with geometry summaries computed by the reader.
+
+        Yields:
+            Tuple[Dict, str, Dict]: The object, its URL and its result, in input order.
+        """
+        if self.batch_geometry and not summarized:
+            objects = self.summarize_objects(objects)
+        if self.result_store is not None:
+            yield from self._map_stored_objects(lint_func, objects, config)
+        else:
+            yield from self._map_objects(lint_func, objects)
+
+    def iter_stream_results(self) -> Generator[Dict, None, None]:
+        """Lint the items of a local FeatureCollection, NDJSON or stac-geoparquet file as read.
+
+        Only one feature, or one batch of features when workers are used, is held in
+        memory at a time, so arbitrarily large files can be linted. With workers, the
+        lines of an NDJSON file are also decoded in the worker processes. stac-geoparquet
+        files are read one record batch at a time, and with `batch_geometry` their WKB
+        geometries are checked without building GeoJSON coordinates. Results do not
+        include the original object.
+
+        Yields:
+            Dict: The validation result for each feature, in file order.
+        """
+        config = (
+            Linter.parse_config()
+            if not self.fast or self.fast_linting or self.batch_geometry
+            else None
+        )
+        if self.fast:
+            lint_func = partial(
+                _lint_object_fast,
+                linter_class=Linter,
+                verbose=self.verbose,
+                fast_linting=self.fast_linting,
+                config=config,
+                schema_bundle=self.schema_bundle,
+            )
+        else:
+            lint_func = partial(
+                _lint_object,
+                verbose=self.verbose,
+                fast=self.fast,
+                config=config,
+                schema_bundle=self.schema_bundle,
+            )
+        objects: Iterable[Tuple[Any, ...]]
+        summarized = False
+        if is_geoparquet(self.source):
+            summarized = self.batch_geometry
+            objects = iter_geoparquet_objects(
+                self.source, self.geometry_batch_size, summarize=summarized
+            )
+        elif is_ndjson(self.source):
+            # Lines are decoded by the lint function, in the workers when there are some
+            lint_func = partial(
+                _lint_ndjson_line, source=self.source, lint_func=lint_func
+            )
+            objects = (
+                (line, f"{self.source}:{line_number}")
+                for line_number, line in iter_ndjson_lines(self.source)
+            )
+            if self.batch_geometry:
+                # Geometries are summarized from the objects decoded here
+                objects = ((_decode_line(line), url) for line, url in objects)
+        else:
+            objects = (
+                (obj, f"{self.source}/{obj.get('id', f'unknown-{idx}')}")
+                for idx, obj in enumerate(iter_features(self.source))
+            )
+        schemas_checked = set()
+        with use_schema_bundle(self.schema_bundle):
+            for _, _, msg in self.lint_objects(
+                lint_func, objects, config, summarized=summarized
+            ):
+                if self.fast:
+                    schemas_checked.update(msg["schema"])
+                if self.version is None and msg.get("version"):
+                    self.version = msg.get("version")
+                yield msg
+        self.schemas_checked = sorted(schemas_checked)
+        self.total_time = (time.time() - self.start_time) * 1000
+
+    def _lint_local(self) -> Optional[List[Dict]]:
+        """Lint a local file with the streaming or FastValidator paths, when they apply.
 
-        # In fast mode with a file path, validate with FastValidator for better performance
+        Returns:
+            Optional[List[Dict]]: The validation results, or None if neither path applies
+                and objects should be linted one by one.
+        """
+        # Stream local files feature by feature, or line by line, instead of loading them whole
+        if self.streams_locally:
+            return list(self.iter_stream_results())
+
+        # In fast mode with a file path, validate with FastValidator for better performance.
+        # With a result store objects are linted one by one, so unchanged ones are skipped
         if (
             self.fast
+            and self.result_store is None
             and isinstance(self.source, str)
-            and self.source.endswith((".json", ".geojson"))
+            and strip_compression_suffix(self.source).endswith((".json", ".geojson"))
         ):
             try:
                 results, total_time, schemas = validate_collection_fast(
-                    self.source, Linter, self.verbose, self.fast_linting
+                    self.document or self.source,
+                    Linter,
+                    self.verbose,
+                    self.fast_linting,
+                    self.batch_geometry,
+                    self.schema_bundle,
                 )
 
                 # Store results and metadata
@@ -182,14 +787,60 @@ class ApiLinter:
                 # Fall back to regular validation if fast validation fails
                 pass
 
+        return None
+
+    @property
+    def streams_locally(self) -> bool:
+        """bool: Whether the source is a local file or standard input read feature by feature."""
+        return self.stream and not is_valid_url(self.source)
+
+    def iter_results(self) -> Generator[Dict, None, None]:
+        """Lint all objects like `lint_all`, yielding each result as soon as it is produced.
+
+        Streamed local sources are linted lazily, so that callers holding only the
+        iterator keep memory bounded; other sources are linted with `lint_all` first.
+
+        Yields:
+            Dict: The validation result for each object.
+        """
+        if self.streams_locally:
+            yield from self.iter_stream_results()
+        else:
+            yield from self.lint_all()
+
+    def lint_all(self) -> List[Dict]:
+        """Lint all objects in the endpoint, handling pagination if configured.
+
+        This method processes all objects in the endpoint (up to the specified number of pages),
+        validates each object using the Linter class, and collects the results.
+        It ensures only one result per asset URL and preserves the original object
+        for potential further processing.
+
+        Returns:
+            List[Dict]: A list of validation result dictionaries, one per object,
+                matching the message structure of the Linter class.
+        """
+        # Local files may be streamed or validated at once with FastValidator
+        results = self._lint_local()
+        if results is not None:
+            return results
+
+        results_by_url = {}
+
         # Regular validation path (non-fast or when FastValidator unavailable)
-        for obj, obj_url in self.iterate_objects():
-            try:
-                linter = Linter(obj, verbose=self.verbose, fast=self.fast)
-                msg = dict(linter.message)
-                msg["path"] = obj_url
-                msg["best_practices"] = linter.best_practices_msg
-                msg["geometry_errors"] = linter.geometry_errors_msg
+        # Parse the configuration once and share it with every per-object Linter
+        config = Linter.parse_config()
+        lint_func = partial(
+            _lint_object,
+            verbose=self.verbose,
+            fast=self.fast,
+            config=config,
+            schema_bundle=self.schema_bundle,
+        )
+        with use_schema_bundle(self.schema_bundle):
+            for obj, obj_url, msg in self.lint_objects(
+                lint_func, self.iterate_objects(), config
+            ):
                 # Store the original object to allow recreation of Linter instance later
                 msg["original_object"] = obj
                 results_by_url[obj_url] = msg
@@ -200,21 +851,6 @@ class ApiLinter:
                     stac_version = msg.get("version")
                     if stac_version:
                         self.version = stac_version
-            except Exception as e:
-                results_by_url[obj_url] = {
-                    "path": obj_url,
-                    "valid_stac": False,
-                    "error_type": type(e).__name__,
-                    "error_message": str(e),
-                    "best_practices": [],
-                    "geometry_errors": [],
-                    "version": None,
-                    "schema": [],
-                    "recommendation": None,
-                    "error_verbose": None,
-                    "failed_schema": None,
-                    "original_object": obj,  # Still include the original object even if validation failed
-                }
 
         # Calculate total validation time
         self.total_time = (
@@ -0,0 +1,306 @@
+import asyncio
+import itertools
+import multiprocessing
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Deque, Dict, Iterator, List, Optional, Set, Tuple
+
+from stac_check.api_lint import ApiLinter, _error_message, _lint_object
+from stac_check.crawler import CRAWL_RELS, href_key, resolve_href
+from stac_check.lint import Linter
+from stac_check.schema_bundle import bundle_identity, use_schema_bundle
+from stac_check.schema_cache import active_cache_dir, init_worker
+
+# Maximum number of requests and lint jobs running at the same time by default
+DEFAULT_CONCURRENCY = 16
+
+# Key ordering results as ApiLinter.lint_all would report them: the page number and
+# the position of the object in its page, followed by the positions of the links
+# leading to it from a catalog
+ResultKey = Tuple[int, ...]
+
+
+class AsyncApiLinter(ApiLinter):
+    """An asyncio variant of ApiLinter for I/O-bound remote endpoints.
+
+    Pages, and the child catalogs and items linked from pages without an object list
+    (static catalogs), are fetched concurrently while the objects already fetched are
+    linted. At most `concurrency` requests and lint jobs run at the same time, and at
+    most `window` fetch and lint tasks are pending, so the objects held in memory stay
+    bounded however large the endpoint is. The next page is requested as soon as the
+    current one arrives. Results are the same, and in the same order, as those of
+    ApiLinter.lint_all.
+
+    No asynchronous HTTP client is required: requests are sent with the shared pooled
+    session from a thread pool of `concurrency` threads.
+
+    Args:
+        source (str): URL or file path of the STAC endpoint or static file.
+        object_list_key (str): Key in response containing list of objects
+            (e.g. "features", "collections").
+        concurrency (int, optional): Maximum number of requests and lint jobs running
+            at the same time. Defaults to DEFAULT_CONCURRENCY.
+        window (Optional[int], optional): Maximum number of fetch and lint tasks pending
+            at the same time. Defaults to twice `concurrency`.
+        **kwargs: Any other ApiLinter argument. With `workers` above 1, objects are linted
+            in a process pool instead of the event loop's default thread pool.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        object_list_key: str,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        window: Optional[int] = None,
+        **kwargs,
+    ):
+        super().__init__(source, object_list_key, **kwargs)
+        self.concurrency = max(concurrency, 1)
+        self.window = max(window or 2 * self.concurrency, 1)
+
+    def _page_entries(
+        self,
+        stac_file: str,
+        response: Dict,
+        page: int,
+        seen_ids: Set,
+        links: Deque[Tuple[ResultKey, str, str]],
+        visited: Set[str],
+    ) -> Iterator[Tuple[ResultKey, Tuple[Any, ...]]]:
+        """Iterate through the objects of a page, or queue its child and item links.
+
+        Args:
+            stac_file (str): The URL or path the page was loaded from.
+            response (Dict): The parsed page.
+            page (int): The number of the page, starting at 1.
+            seen_ids (Set): The IDs of objects already linted from earlier pages.
+            links (Deque[Tuple[ResultKey, str, str]]): The links waiting to be fetched,
+                as (key, resolved href, STAC version of the linking object).
+            visited (Set[str]): The normalized hrefs already queued.
+
+        Returns:
+            Iterator[Tuple[ResultKey, Tuple[Any, ...]]]: The key of each object of the
+                page and the arguments it is linted with.
+        """
+        if self.object_list_key not in response:
+            self._queue_links(stac_file, response, (page,), links, visited)
+            return iter(())
+        entries = self.page_objects(stac_file, response, seen_ids)
+        if self.batch_geometry:
+            # The geometries of a whole page are checked with one vectorized call
+            entries = self.summarize_objects(entries)
+        return (((page, index), entry) for index, entry in enumerate(entries))
+
+    @staticmethod
+    def _queue_links(
+        path: str,
+        data: Any,
+        key: ResultKey,
+        links: Deque[Tuple[ResultKey, str, str]],
+        visited: Set[str],
+    ) -> None:
+        """Queue the child and item links of an object that were not queued before.
+
+        Args:
+            path (str): The URL or path of the object.
+            data (Any): The parsed object.
+            key (ResultKey): The key of the object.
+            links (Deque[Tuple[ResultKey, str, str]]): The links waiting to be fetched.
+            visited (Set[str]): The normalized hrefs already queued.
+        """
+        if not isinstance(data, dict):
+            return
+        version = data.get("stac_version", "")
+        for index, link in enumerate(data.get("links", [])):
+            if (
+                isinstance(link, dict)
+                and link.get("rel") in CRAWL_RELS
+                and isinstance(link.get("href"), str)
+            ):
+                child = resolve_href(path, link["href"])
+                if href_key(child) not in visited:
+                    visited.add(href_key(child))
+                    links.append((key + (index,), child, version))
+
+    async def lint_all(self) -> List[Dict]:  # type: ignore[override]
+        """Lint all objects in the endpoint concurrently, handling pagination if configured.
+
+        Returns:
+            List[Dict]: A list of validation result dictionaries, one per object,
+                matching ApiLinter.lint_all.
+        """
+        loop = asyncio.get_running_loop()
+
+        # Local files may be streamed or validated at once with FastValidator
+        results = await loop.run_in_executor(None, self._lint_local)
+        if results is not None:
+            return results
+
+        config = Linter.parse_config()
+        lint_func = partial(
+            _lint_object,
+            verbose=self.verbose,
+            fast=self.fast,
+            config=config,
+            schema_bundle=self.schema_bundle,
+        )
+        flags = {
+            "verbose": self.verbose,
+            "fast": self.fast,
+            "fast_linting": self.fast_linting,
+            "schema_bundle": bundle_identity(self.schema_bundle),
+        }
+        slots = asyncio.Semaphore(self.concurrency)
+        fetch_executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        executor: Optional[Executor] = (
+            ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_worker,
+                initargs=(active_cache_dir(),),
+            )
+            if self.workers > 1
+            else None
+        )
+        new_results: List[Tuple[str, Dict]] = []
+
+        async def fetch(url: str) -> Any:
+            async with slots:
+                return await loop.run_in_executor(
+                    fetch_executor, self._fetch_and_parse, url
+                )
+
+        async def fetch_page(url: str) -> Tuple[str, Any]:
+            return url, await fetch(url)
+
+        async def lint(*args: Any) -> Tuple[Any, Dict]:
+            key = None
+            if self.result_store is not None:
+                key = self.result_store.key("object", args[0], args[1], flags, config)
+                stored = self.result_store.get(key)
+                if stored is not None:
+                    return args[0], stored
+            async with slots:
+                msg = await loop.run_in_executor(executor, lint_func, *args)
+            if key is not None:
+                new_results.append((key, msg))
+            return args[0], msg
+
+        async def visit(url: str, parent_version: str) -> Tuple[Any, Dict]:
+            try:
+                data = await fetch(url)
+            except Exception as e:
+                return None, _error_message(url, e)
+            # Objects of old STAC versions may omit stac_version, use the parent's
+            if isinstance(data, dict) and parent_version:
+                data.setdefault("stac_version", parent_version)
+            return await lint(data, url)
+
+        linted: Dict[ResultKey, Tuple[Any, str, Dict]] = {}
+        # The key and path of each pending task, and whether it visits a link
+        pending: Dict[asyncio.Future, Tuple[ResultKey, str, bool]] = {}
+        links: Deque[Tuple[ResultKey, str, str]] = deque()
+        seen_ids: Set = set()
+        visited: Set[str] = {href_key(self.source)}
+        entries: Iterator[Tuple[ResultKey, Tuple[Any, ...]]] = iter(())
+        next_entry: Optional[Tuple[ResultKey, Tuple[Any, ...]]] = None
+        page = 1
+
+        page_task: Optional[asyncio.Future]
+        if self.document is not None and self.document.error is None:
+            # The first page was already loaded by the caller
+            page_task = loop.create_future()
+            page_task.set_result((self.source, self.document.data))
+        else:
+            page_task = asyncio.ensure_future(fetch_page(self.source))
+
+        # Objects linted in threads resolve schemas from the bundle entered here
+        with use_schema_bundle(self.schema_bundle):
+            try:
+                while True:
+                    # Fill the window with the objects of the current page, then with links
+                    while len(pending) < self.window:
+                        if next_entry is not None:
+                            key, args = next_entry
+                            next_entry = next(entries, None)
+                            pending[asyncio.ensure_future(lint(*args))] = (
+                                key,
+                                args[1],
+                                False,
+                            )
+                        elif links:
+                            key, url, version = links.popleft()
+                            pending[asyncio.ensure_future(visit(url, version))] = (
+                                key,
+                                url,
+                                True,
+                            )
+                        else:
+                            break
+
+                    # Read the next page once the objects of the current one are scheduled
+                    if (
+                        next_entry is None
+                        and page_task is not None
+                        and page_task.done()
+                    ):
+                        stac_file, response = page_task.result()
+                        entries = self._page_entries(
+                            stac_file, response, page, seen_ids, links, visited
+                        )
+                        next_entry = next(entries, None)
+                        next_url = self.next_page_url(stac_file, response, page)
+                        page_task = (
+                            asyncio.ensure_future(fetch_page(next_url))
+                            if next_url
+                            else None
+                        )
+                        page += 1
+                        continue
+
+                    waiting = set(pending)
+                    if next_entry is None and page_task is not None:
+                        waiting.add(page_task)
+                    if not waiting:
+                        break
+                    done, _ = await asyncio.wait(
+                        waiting, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        if task is page_task:
+                            continue
+                        key, url, from_link = pending.pop(task)
+                        obj, msg = task.result()
+                        linted[key] = (obj, url, msg)
+                        if from_link:
+                            # Catalogs reached through links lead to their own children
+                            self._queue_links(url, obj, key, links, visited)
+
+                if self.result_store is not None:
+                    # Stored before original_object is added to the results
+                    self.result_store.put_many(new_results)
+            finally:
+                for task in itertools.chain(pending, [page_task] if page_task else []):
+                    task.cancel()
+                fetch_executor.shutdown(wait=False, cancel_futures=True)
+                if executor is not None:
+                    executor.shutdown(wait=False, cancel_futures=True)
+
+        results_by_url = {}
+        for key in sorted(linted):
+            obj, obj_url, msg = linted[key]
+            # Store the original object to allow recreation of Linter instance later
+            if obj is not None:
+                msg["original_object"] = obj
+            results_by_url[obj_url] = msg
+
+            # Set the version from the first valid STAC object if not already set
+            if self.version is None and msg.get("version"):
+                self.version = msg.get("version")
+
+        # Calculate total validation time
+        self.total_time = (time.time() - self.start_time) * 1000
+
+        return list(results_by_url.values())
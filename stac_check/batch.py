@@ -0,0 +1,248 @@
+"""Lint many STAC files, directories and glob patterns in one process.
+
+Inputs are expanded to files with an `os.scandir` walk, so a directory tree of
+static items is linted without starting a process, importing the validators and
+parsing the configuration once per file. Files can be linted in a process pool.
+"""
+
+import glob
+import itertools
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from stac_validator.utilities import is_valid_url
+
+from stac_check.compression import strip_compression_suffix
+from stac_check.lint import Linter
+from stac_check.result_store import ResultStore
+from stac_check.schema_bundle import use_schema_bundle
+from stac_check.schema_cache import active_cache_dir, init_worker
+
+# Extensions of the files found in directories
+DEFAULT_EXTENSIONS = (".json", ".geojson")
+
+# Number of files sent to a worker process in one task
+DEFAULT_CHUNK_SIZE = 16
+
+# Characters that make an input a glob pattern
+GLOB_CHARS = "*?["
+
+# The result store of a worker process, opened by _init_worker
+_worker_store: Optional[ResultStore] = None
+
+
+def is_glob(pattern: str) -> bool:
+    """Whether an input is a glob pattern rather than a path.
+
+    Args:
+        pattern (str): The input.
+
+    Returns:
+        bool: True if the input contains glob characters and is not an existing path.
+    """
+    return any(char in pattern for char in GLOB_CHARS) and not os.path.exists(pattern)
+
+
+def walk_files(
+    directory: str, extensions: Tuple[str, ...] = DEFAULT_EXTENSIONS
+) -> Iterator[str]:
+    """Find the files with some extensions in a directory tree.
+
+    Args:
+        directory (str): The directory to walk.
+        extensions (Tuple[str, ...]): The file extensions to keep, compared case-insensitively
+            and also matching compressed files, e.g. "item.json.gz".
+
+    Yields:
+        str: The paths of the files, sorted by name within each directory, each
+            directory's files before its subdirectories.
+    """
+    pending = [directory]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                entries_by_name = sorted(entries, key=lambda entry: entry.name)
+        except OSError:
+            continue
+        subdirectories = []
+        for entry in entries_by_name:
+            # Hidden files and directories are not STAC objects
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir():
+                subdirectories.append(entry.path)
+            elif strip_compression_suffix(entry.name.lower()).endswith(extensions):
+                yield entry.path
+        # Visit subdirectories in name order
+        pending.extend(reversed(subdirectories))
+
+
+def discover_files(
+    inputs: Iterable[str], extensions: Tuple[str, ...] = DEFAULT_EXTENSIONS
+) -> Iterator[str]:
+    """Expand paths, URLs, directories and glob patterns to the files to lint.
+
+    Directories, including those matched by a pattern, are walked for files with
+    one of `extensions`. Files and URLs are kept as given, and so are paths that do
+    not exist, so that linting reports them. Patterns support `**` to match any
+    number of directories.
+
+    Args:
+        inputs (Iterable[str]): The paths, URLs, directories and glob patterns.
+        extensions (Tuple[str, ...]): The file extensions kept when walking directories.
+
+    Yields:
+        str: The files and URLs, each once, in input order.
+    """
+    seen: Set[str] = set()
+    for source in inputs:
+        if is_valid_url(source):
+            candidates: Iterable[str] = [source]
+        elif is_glob(source):
+            candidates = sorted(glob.iglob(source, recursive=True))
+        else:
+            candidates = [source]
+        for candidate in candidates:
+            paths = (
+                walk_files(candidate, extensions)
+                if os.path.isdir(candidate)
+                else [candidate]
+            )
+            for path in paths:
+                if path not in seen:
+                    seen.add(path)
+                    yield path
+
+
+def lint_file(
+    path: str, result_store: Optional[ResultStore] = None, **kwargs: Any
+) -> Dict:
+    """Lint a single file.
+
+    Args:
+        path (str): The path or URL of the STAC object.
+        result_store (Optional[ResultStore]): A store of earlier results.
+        **kwargs: The other arguments of Linter.
+
+    Returns:
+        Dict: The validation result, with the best practices and geometry errors of the
+            object, as reported by ApiLinter for the objects of an item collection.
+    """
+    try:
+        linter = Linter(path, result_store=result_store, **kwargs)
+        msg = dict(linter.message) if isinstance(linter.message, dict) else {}
+        msg.update(
+            {
+                "path": path,
+                "valid_stac": linter.valid_stac,
+                "asset_type": linter.asset_type,
+                "version": linter.version,
+                "error_type": linter.error_type,
+                "error_message": linter.error_msg,
+                "best_practices": linter.best_practices_msg,
+                "geometry_errors": linter.geometry_errors_msg,
+                "schema": linter.schema,
+            }
+        )
+        return msg
+    except Exception as e:
+        return {
+            "path": path,
+            "valid_stac": False,
+            "error_type": type(e).__name__,
+            "error_message": str(e),
+            "best_practices": [],
+            "geometry_errors": [],
+            "version": None,
+            "schema": [],
+        }
+
+
+def _init_worker(
+    result_store_path: Optional[str], schema_cache_dir: Optional[str]
+) -> None:
+    global _worker_store
+    init_worker(schema_cache_dir)
+    if result_store_path is not None:
+        _worker_store = ResultStore(result_store_path)
+
+
+def _lint_chunk(paths: List[str], **kwargs: Any) -> List[Dict]:
+    """Lint a chunk of files in a worker process, committing their stored results together.
+
+    This is a module level function so it can be sent to worker processes.
+
+    Args:
+        paths (List[str]): The paths or URLs of the STAC objects.
+        **kwargs: The other arguments of lint_file.
+
+    Returns:
+        List[Dict]: The result of each file.
+    """
+    results = [lint_file(path, result_store=_worker_store, **kwargs) for path in paths]
+    if _worker_store is not None:
+        _worker_store.commit()
+    return results
+
+
+def lint_files(
+    paths: Iterable[str],
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    result_store: Optional[ResultStore] = None,
+    schema_bundle: Optional[str] = None,
+    **kwargs: Any,
+) -> Iterator[Dict]:
+    """Lint files one after the other, or in a process pool.
+
+    The configuration is parsed once and shared by every file. Paths are read lazily
+    and submitted in bounded batches, so discovery and linting overlap.
+
+    Args:
+        paths (Iterable[str]): The paths or URLs of the STAC objects.
+        workers (int): Number of processes used to lint files. Values above 1 lint
+            chunks of files in a process pool.
+        chunk_size (int): Number of files sent to a worker process at a time.
+        result_store (Optional[ResultStore]): A store of earlier results. Worker
+            processes open their own connection to the same database.
+        schema_bundle (Optional[str]): The path of a schema bundle to resolve every
+            remote schema from.
+        **kwargs: The other arguments of Linter, such as `assets` or `fast`.
+
+    Yields:
+        Dict: The result of each file, in input order.
+    """
+    kwargs.setdefault("config", Linter.parse_config())
+    kwargs["schema_bundle"] = schema_bundle
+    if workers == 1:
+        with use_schema_bundle(schema_bundle):
+            for path in paths:
+                yield lint_file(path, result_store=result_store, **kwargs)
+        return
+
+    lint_func = partial(_lint_chunk, **kwargs)
+    paths = iter(paths)
+    # Workers are spawned rather than forked from a process holding pooled connections
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(
+            result_store.path if result_store is not None else None,
+            active_cache_dir(),
+        ),
+    ) as executor:
+        while True:
+            batch = list(itertools.islice(paths, workers * chunk_size * 4))
+            if not batch:
+                return
+            chunks = [
+                batch[start : start + chunk_size]
+                for start in range(0, len(batch), chunk_size)
+            ]
+            for results in executor.map(lint_func, chunks):
+                yield from results
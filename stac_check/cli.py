@@ -1,41 +1,66 @@
 import importlib.metadata
-import json
+import itertools
+import os
 import sys
-from typing import Optional
+import time
+from typing import List, Optional, Union
 
 import click
-import requests
+from click.core import ParameterSource
 from stac_validator.utilities import is_valid_url
 
 from stac_check.api_lint import ApiLinter
+from stac_check.batch import discover_files, is_glob, lint_files
+from stac_check.crawler import DEFAULT_CRAWL_WORKERS
 from stac_check.display_messages import (
+    batch_message,
     cli_message,
     collections_message,
     intro_message,
     item_collection_message,
     recursive_message,
+    stream_item_collection_message,
 )
+from stac_check.document import StacDocument, load_document
+from stac_check.geoparquet import is_geoparquet
+from stac_check.http_client import configure_session
 from stac_check.lint import Linter
+from stac_check.result_store import ResultStore
+from stac_check.schema_bundle import build_schema_bundle, bundle_root_urls
+from stac_check.schema_cache import (
+    COMPILE_ERRORS,
+    DEFAULT_WARM_VERSIONS,
+    STAC_TYPES,
+    SchemaCache,
+    schema_cache_enabled,
+)
+from stac_check.sniff import sniff_document
+from stac_check.streaming import is_ndjson
 from stac_check.utilities import handle_output
 
 
-def is_item_collection(file: str, headers: dict = None) -> bool:
+def is_item_collection(
+    file: Union[str, StacDocument], headers: Optional[dict] = None
+) -> bool:
     """Detect if a file is an item collection (FeatureCollection with features).
 
+    Paths and URLs are only read until their top-level "type" and first feature
+    are found, not loaded whole.
+
     Args:
-        file: Path or URL to the file
+        file: Path or URL to the file, or an already loaded StacDocument
         headers: Optional HTTP headers for URL requests
 
     Returns:
         True if the file is an item collection, False otherwise
     """
     try:
-        if is_valid_url(file):
-            resp = requests.get(file, headers=headers or {})
-            data = resp.json()
-        else:
-            with open(file) as f:
-                data = json.load(f)
+        if isinstance(file, str):
+            with sniff_document(file, headers=headers) as sniffed:
+                if sniffed.is_item_collection is not None:
+                    return sniffed.is_item_collection
+                file = load_document(sniffed)
+        data = load_document(file, headers=headers).data
 
         # Check if it's a FeatureCollection with features
         return (
@@ -50,6 +75,148 @@ def is_item_collection(file: str, headers: dict = None) -> bool:
         return False
 
 
+@click.group()
+def cache() -> None:
+    """Manage the on-disk cache of resolved schemas and compiled validators.
+
+    The cache directory defaults to ~/.cache/stac-check and can be set with the
+    STAC_CHECK_CACHE_DIR environment variable.
+    """
+
+
+def _source_object_kinds(
+    sources: tuple[str, ...],
+) -> tuple[List[tuple[str, str, List[str]]], int]:
+    """Collect the type, STAC version and extensions of every object in some sources.
+
+    Args:
+        sources: STAC files or URLs; the features of item collections are each collected
+
+    Returns:
+        The (type, version, extensions) tuples without duplicates, and the number of
+        sources that could not be loaded
+    """
+    failed = 0
+    kinds = {}
+    for source in sources:
+        try:
+            data = load_document(source).data
+        except Exception as e:
+            failed += 1
+            click.secho(f"Could not load {source}: {e}", fg="red")
+            continue
+        objects = (
+            data.get("features", [])
+            if data.get("type") == "FeatureCollection"
+            else [data]
+        )
+        for obj in objects:
+            stac_type = obj.get("type", "Catalog")
+            stac_type = "Item" if stac_type == "Feature" else stac_type
+            version = obj.get("stac_version", "1.0.0")
+            extensions = obj.get("stac_extensions", [])
+            kinds[(stac_type, version, tuple(sorted(extensions)))] = (
+                stac_type,
+                version,
+                extensions,
+            )
+    return list(kinds.values()), failed
+
+
+@cache.command()
+@click.argument("sources", nargs=-1)
+@click.option(
+    "--stac-version",
+    multiple=True,
+    default=DEFAULT_WARM_VERSIONS,
+    show_default=True,
+    help="STAC version whose Item, Collection and Catalog validators are compiled when no SOURCES are given. Can be used multiple times.",
+)
+def warm(sources: tuple[str, ...], stac_version: tuple[str, ...]) -> None:
+    """Fetch and compile the validators needed by SOURCES, or the core validators.
+
+    Each source is a STAC file or URL; the validator of every object it contains,
+    including its extensions, is compiled and stored.
+    """
+    schema_cache = SchemaCache()
+    if sources:
+        kinds, failed = _source_object_kinds(sources)
+    else:
+        kinds = [
+            (stac_type, version, [])
+            for version in stac_version
+            for stac_type in STAC_TYPES
+        ]
+        failed = 0
+
+    cached = 0
+    for stac_type, version, extensions in kinds:
+        try:
+            schema_cache.load_validator(stac_type, version, extensions)
+            cached += 1
+        except COMPILE_ERRORS as e:
+            failed += 1
+            click.secho(f"Could not compile {stac_type} {version}: {e}", fg="red")
+    click.echo(f"Cached {cached} validators in {schema_cache.root}")
+    sys.exit(1 if failed else 0)
+
+
+@cache.command()
+@click.argument("output", type=click.Path(dir_okay=False, writable=True))
+@click.argument("sources", nargs=-1)
+@click.option(
+    "--stac-version",
+    multiple=True,
+    help="STAC version whose Item, Collection and Catalog schemas are bundled. Can be used multiple times. Defaults to 1.0.0 and 1.1.0 when no SOURCES are given.",
+)
+@click.option(
+    "--extension",
+    multiple=True,
+    help="Extension schema URL to bundle. Can be used multiple times.",
+)
+def bundle(
+    output: str,
+    sources: tuple[str, ...],
+    stac_version: tuple[str, ...],
+    extension: tuple[str, ...],
+) -> None:
+    """Write a schema bundle to OUTPUT for use with --schema-bundle.
+
+    The bundle holds the core schemas of the given STAC versions, the given extension
+    schemas, the schemas needed by the objects of SOURCES, and every schema they
+    reference. Schemas are read from the schema cache or fetched.
+    """
+    versions = list(stac_version)
+    extensions = list(extension)
+    failed = 0
+    if sources:
+        kinds, failed = _source_object_kinds(sources)
+        versions += [version for _, version, _ in kinds]
+        extensions += [ext for _, _, exts in kinds for ext in exts]
+    elif not versions:
+        versions = list(DEFAULT_WARM_VERSIONS)
+
+    try:
+        urls = build_schema_bundle(
+            output,
+            bundle_root_urls(dict.fromkeys(versions), extensions),
+            SchemaCache().fetch_schema,
+        )
+    except Exception as e:
+        click.secho(f"Could not build the schema bundle: {e}", fg="red")
+        sys.exit(1)
+    click.echo(f"Bundled {len(urls)} schemas in {output}")
+    sys.exit(1 if failed else 0)
+
+
+@cache.command()
+def clear() -> None:
+    """Remove every cached schema and validator."""
+    schema_cache = SchemaCache()
+    count = schema_cache.clear()
+    click.echo(f"Removed {count} files from {schema_cache.cache_dir}")
+
+
 @click.option(
     "--collections",
     is_flag=True,
@@ -60,12 +227,35 @@ def is_item_collection(file: str, headers: dict = None) -> bool:
     is_flag=True,
     help="Validate item collection response. Can be combined with --pages. Defaults to one page.",
 )
+@click.option(
+    "--stream",
+    is_flag=True,
+    help="Stream a local item collection file feature by feature to lint it with bounded memory. Implies --item-collection. NDJSON files (.ndjson, .jsonl) and standard input (-) are always streamed line by line, and stac-geoparquet files (.parquet, .geoparquet) record batch by record batch.",
+)
 @click.option(
     "--pages",
     "-p",
     type=int,
     help="Maximum number of pages to validate via --item-collection or --collections. Defaults to one page.",
 )
+@click.option(
+    "--batch-geometry",
+    is_flag=True,
+    help="Check the geometries of all items of an item collection at once with vectorized operations, also reporting geometry errors in fast mode.",
+)
+@click.option(
+    "--prefetch",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Number of pages fetched in the background while the current page is linted with --pages.",
+)
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(min=1),
+    help="Number of objects linted at the same time: processes with --item-collection, --collections or several files (defaults to 1), threads with --recursive (defaults to 8).",
+)
 @click.option(
     "--recursive",
     "-r",
@@ -101,6 +291,31 @@ def is_item_collection(file: str, headers: dict = None) -> bool:
     multiple=True,
     help="HTTP header to include in the requests. Can be used multiple times.",
 )
+@click.option(
+    "--pool-size",
+    type=click.IntRange(min=1),
+    help="Maximum number of connections kept open to each host. Defaults to 10.",
+)
+@click.option(
+    "--schema-cache",
+    is_flag=True,
+    help="Read and write the on-disk cache of schemas and compiled validators. Run `stac-check-cache --help` to manage the cache.",
+)
+@click.option(
+    "--schema-bundle",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Resolve every schema from a bundle built with `stac-check-cache bundle`, without network access. The on-disk schema cache is not used.",
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Reuse the results of earlier runs for unchanged objects, stored in results.sqlite in the stac-check cache directory.",
+)
+@click.option(
+    "--result-store",
+    type=click.Path(dir_okay=False, writable=True),
+    help="SQLite database of results reused for unchanged objects. Implies --incremental.",
+)
 @click.option(
     "--pydantic",
     is_flag=True,
@@ -123,19 +338,28 @@ def is_item_collection(file: str, headers: dict = None) -> bool:
     help="Use FastJSONSchema for high-speed validation with linting. Skips geometry checks for maximum performance.",
 )
 @click.command()
-@click.argument("file")
+@click.argument("files", nargs=-1, required=True, metavar="FILE...")
 @click.version_option(version=importlib.metadata.distribution("stac-check").version)
 def main(
-    file: str,
+    files: tuple[str, ...],
     collections: bool,
     item_collection: bool,
+    stream: bool,
     pages: Optional[int],
+    workers: Optional[int],
+    prefetch: int,
+    batch_geometry: bool,
     recursive: bool,
     max_depth: Optional[int],
     assets: bool,
     links: bool,
     no_assets_urls: bool,
     header: tuple[tuple[str, str], ...],
+    pool_size: Optional[int],
+    schema_cache: bool,
+    schema_bundle: Optional[str],
+    incremental: bool,
+    result_store: Optional[str],
     pydantic: bool,
     verbose: bool,
     output: Optional[str],
@@ -145,16 +369,25 @@ def main(
     """Main entry point for the stac-check CLI.
 
     Args:
-        file: The STAC file or URL to validate
+        files: The STAC files or URLs to validate, or directories and glob patterns of files
         collections: Validate a collections endpoint
         item_collection: Validate an item collection
+        stream: Stream a local item collection file instead of loading it whole
         pages: Number of pages to validate (for API endpoints)
+        workers: Number of objects linted at the same time (for API endpoints and recursive validation)
+        prefetch: Number of pages fetched ahead in the background (for API endpoints)
+        batch_geometry: Check the geometries of all items at once (for item collections and API endpoints)
         recursive: Recursively validate linked STAC objects
         max_depth: Maximum depth for recursive validation
         assets: Validate assets
         links: Validate links
         no_assets_urls: Disable URL validation for assets
         header: Additional HTTP headers
+        pool_size: Maximum number of connections kept open to each host
+        schema_cache: Enable the on-disk cache of schemas and compiled validators
+        schema_bundle: Path of a schema bundle to resolve every schema from
+        incremental: Reuse the stored results of unchanged objects
+        result_store: Path of the database of stored results, implies incremental
         pydantic: Use stac-pydantic for validation
         verbose: Show verbose output
         output: Save output to file (only with --collections, --item-collection, or --recursive)
@@ -165,10 +398,36 @@ def main(
     if fast_linting:
         fast = True
 
+    # Several files, directories or patterns are linted together with one summary
+    # URLs are never patterns, even with a query string
+    batch = len(files) > 1 or any(
+        not is_valid_url(source) and (os.path.isdir(source) or is_glob(source))
+        for source in files
+    )
+    if batch and any([collections, item_collection, stream, recursive]):
+        click.echo(
+            "Error: --collections, --item-collection, --stream and --recursive take a single FILE",
+            err=True,
+        )
+        sys.exit(1)
+    # Options of those modes would otherwise be silently ignored
+    prefetch_source = click.get_current_context().get_parameter_source("prefetch")
+    if batch and (
+        pages is not None
+        or batch_geometry
+        or max_depth is not None
+        or prefetch_source is not ParameterSource.DEFAULT
+    ):
+        click.echo(
+            "Error: --pages, --prefetch, --batch-geometry and --max-depth take a single FILE",
+            err=True,
+        )
+        sys.exit(1)
+
     # Check if output is used without --collections, --item-collection, or --recursive
-    if output and not any([collections, item_collection, recursive]):
+    if output and not batch and not any([collections, item_collection, recursive]):
         click.echo(
-            "Error: --output can only be used with --collections, --item-collection, or --recursive",
+            "Error: --output can only be used with --collections, --item-collection, or --recursive, or with several files",
             err=True,
         )
         sys.exit(1)
@@ -184,10 +443,79 @@ def main(
             )
             pydantic = False
 
+    # Every remote fetch goes through the shared session, size its pools first
+    if pool_size:
+        configure_session(pool_maxsize=pool_size)
+
+    # Reuse the schemas and validators of earlier runs, until this command exits
+    if schema_cache and schema_bundle is None:
+        click.get_current_context().with_resource(schema_cache_enabled())
+
+    # Results are committed to the store when this command exits
+    store: Optional[ResultStore] = None
+    if incremental or result_store:
+        store = click.get_current_context().with_resource(ResultStore(result_store))
+
+    if batch:
+        start_time = time.time()
+        results = list(
+            lint_files(
+                discover_files(files),
+                workers=workers or 1,
+                result_store=store,
+                schema_bundle=schema_bundle,
+                assets=assets,
+                links=links,
+                assets_open_urls=not no_assets_urls,
+                headers=dict(header),
+                pydantic=pydantic,
+                verbose=verbose,
+                fast=fast,
+                fast_linting=fast_linting,
+            )
+        )
+        if not results:
+            click.echo(f"Error: no STAC files found in {' '.join(files)}", err=True)
+            sys.exit(1)
+        total_time = (time.time() - start_time) * 1000
+
+        handle_output(
+            output,
+            lambda: batch_message(
+                results, verbose=verbose, fast=fast, total_time=total_time
+            ),
+        )
+        sys.exit(0 if all(msg.get("valid_stac") is True for msg in results) else 1)
+
+    file = files[0]
+
+    # A streamed file is never loaded whole, the ApiLinter reads it feature by feature
+    document: Optional[StacDocument] = None
+    detected: Optional[bool] = None
+    if stream or is_ndjson(file) or is_geoparquet(file):
+        # NDJSON files and standard input are read line by line, stac-geoparquet by batch
+        stream = True
+        item_collection = True
+    else:
+        # Read and decode the input once, every stage below works from this document.
+        # Item collections are auto-detected from its first bytes, which the loader reuses
+        try:
+            if collections or item_collection or recursive:
+                document = load_document(file, headers=dict(header))
+            else:
+                with sniff_document(file, headers=dict(header)) as sniffed:
+                    detected = sniffed.is_item_collection
+                    document = load_document(sniffed)
+        except Exception:
+            # Leave error reporting to the linters, which load the source themselves
+            pass
+
     # Auto-detect item collection if no explicit flag is set
     if not collections and not item_collection and not recursive:
-        if is_item_collection(file, headers=dict(header)):
-            item_collection = True
+        if document is not None:
+            if detected is None:
+                detected = is_item_collection(document)
+            item_collection = detected
 
     if collections or item_collection:
         # Handle API-based validation (collections or item collections)
@@ -199,23 +527,53 @@ def main(
             verbose=verbose,
             fast=fast,
             fast_linting=fast_linting,
+            document=document,
+            stream=stream,
+            workers=workers or 1,
+            prefetch=prefetch,
+            batch_geometry=batch_geometry,
+            schema_bundle=schema_bundle,
+            result_store=store,
         )
+        if stream and item_collection:
+            # Results are displayed as they are linted and never collected
+            results = api_linter.iter_results()
+            # The STAC version shown in the intro is known once the first item is linted
+            first = next(results, None)
+            intro_message(api_linter)
+            if first is not None:
+                results = itertools.chain([first], results)
+
+            valid = handle_output(
+                output,
+                lambda: stream_item_collection_message(
+                    api_linter, results, cli_message_func=cli_message
+                ),
+            )
+            sys.exit(0 if valid else 1)
+
         results = api_linter.lint_all()
 
-        # Create a dummy Linter instance for display purposes
-        display_linter = Linter(
-            file,
-            assets=assets,
-            links=links,
-            headers=dict(header),
-            pydantic=pydantic,
-            verbose=verbose,
-            fast=fast,
-            fast_linting=fast_linting,
-        )
+        if stream:
+            # Loading the whole file for display would defeat streaming
+            intro_message(api_linter)
+        else:
+            # Create a dummy Linter instance for display purposes
+            display_linter = Linter(
+                document or file,
+                assets=assets,
+                links=links,
+                headers=dict(header),
+                pydantic=pydantic,
+                verbose=verbose,
+                fast=fast,
+                fast_linting=fast_linting,
+                schema_bundle=schema_bundle,
+                result_store=store,
+            )
 
-        # Show intro message in the terminal
-        intro_message(display_linter)
+            # Show intro message in the terminal
+            intro_message(display_linter)
 
         # Define output generation function (without intro message since we already showed it)
         def generate_output():
@@ -240,17 +598,20 @@ def main(
     else:
         # Handle file-based validation (single file or recursive)
         linter = Linter(
-            file,
+            document or file,
             assets=assets,
             links=links,
             recursive=recursive,
             max_depth=max_depth,
+            workers=workers or DEFAULT_CRAWL_WORKERS,
             assets_open_urls=not no_assets_urls,
             headers=dict(header),
             pydantic=pydantic,
             verbose=verbose,
             fast=fast,
             fast_linting=fast_linting,
+            schema_bundle=schema_bundle,
+            result_store=store,
         )
 
         intro_message(linter)
@@ -0,0 +1,149 @@
+"""Reading of local inputs: transparent decompression and memory mapping.
+
+Files ending in .gz, .bz2, .xz or .zst are decompressed while they are read, so
+compressed items, item collections and NDJSON files are linted directly, without
+writing a decompressed copy to disk. Reading .zst files requires the optional
+zstandard package. Uncompressed files are memory-mapped by `map_file`, so they
+are decoded from the page cache rather than from a private copy.
+"""
+
+import bz2
+import contextlib
+import gzip
+import io
+import lzma
+import mmap
+from typing import IO, Callable, Dict, Iterator, Union
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - exercised when zstandard is not installed
+    zstandard = None
+
+
+def _open_zstd(path: str) -> IO[bytes]:
+    if zstandard is None:
+        raise ImportError(
+            f"Reading {path} requires the zstandard package. "
+            "Install it with: pip install stac-check[zstd]"
+        )
+    # Files written by parallel compressors hold several frames
+    return zstandard.ZstdDecompressor().stream_reader(
+        open(path, "rb"), read_across_frames=True, closefd=True
+    )
+
+
+# Binary openers of each compressed file suffix
+COMPRESSION_OPENERS: Dict[str, Callable[[str], IO[bytes]]] = {
+    ".gz": gzip.open,
+    ".bz2": bz2.open,
+    ".xz": lzma.open,
+    ".zst": _open_zstd,
+}
+
+
+def compression_suffix(path: str) -> str:
+    """Return the compression suffix of a path.
+
+    Args:
+        path (str): The file path.
+
+    Returns:
+        str: The lowercase suffix, e.g. ".gz", or "" if the file is not compressed.
+    """
+    lower = path.lower()
+    for suffix in COMPRESSION_OPENERS:
+        if lower.endswith(suffix):
+            return suffix
+    return ""
+
+
+def strip_compression_suffix(path: str) -> str:
+    """Remove the compression suffix of a path, so its content type can be told from it.
+
+    Args:
+        path (str): The file path, e.g. "items.ndjson.zst".
+
+    Returns:
+        str: The path without its compression suffix, e.g. "items.ndjson".
+    """
+    suffix = compression_suffix(path)
+    return path[: len(path) - len(suffix)] if suffix else path
+
+
+def open_binary(path: str) -> IO[bytes]:
+    """Open a local file for reading bytes, decompressing it as it is read.
+
+    Args:
+        path (str): The file path. Files ending in .gz, .bz2, .xz or .zst are decompressed.
+
+    Returns:
+        IO[bytes]: A binary stream over the decompressed content.
+
+    Raises:
+        ImportError: If the file is compressed with zstd and zstandard is not installed.
+        OSError: If the file cannot be opened.
+    """
+    suffix = compression_suffix(path)
+    if not suffix:
+        return open(path, "rb")
+    return COMPRESSION_OPENERS[suffix](path)
+
+
+@contextlib.contextmanager
+def map_file(path: str) -> Iterator[Union[bytes, memoryview]]:
+    """Expose the whole content of a local file as a buffer.
+
+    Uncompressed files are memory-mapped, so processes reading the same file share
+    its pages in the page cache, and no copy is made in Python. Compressed files,
+    and files that cannot be mapped such as empty files and pipes, are read.
+
+    Args:
+        path (str): The file path.
+
+    Yields:
+        Union[bytes, memoryview]: The content. A memoryview is only valid until the
+            context exits, and must not be referenced by slices beyond it.
+
+    Raises:
+        ImportError: If the file is compressed with zstd and zstandard is not installed.
+        OSError: If the file cannot be opened.
+    """
+    if compression_suffix(path):
+        with open_binary(path) as f:
+            yield f.read()
+        return
+    with open(path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            mapped = None
+        if mapped is None:
+            yield f.read()
+            return
+    # The mapping stays valid once the file is closed
+    view = memoryview(mapped)
+    try:
+        yield view
+    finally:
+        view.release()
+        mapped.close()
+
+
+def open_text(path: str) -> IO[str]:
+    """Open a local file for reading text, decompressing it as it is read.
+
+    Args:
+        path (str): The file path. Files ending in .gz, .bz2, .xz or .zst are decompressed.
+
+    Returns:
+        IO[str]: A UTF-8 text stream over the decompressed content.
+
+    Raises:
+        ImportError: If the file is compressed with zstd and zstandard is not installed.
+        OSError: If the file cannot be opened.
+    """
+    suffix = compression_suffix(path)
+    if not suffix:
+        return open(path, encoding="utf-8")
+    return io.TextIOWrapper(COMPRESSION_OPENERS[suffix](path), encoding="utf-8")
@@ -0,0 +1,254 @@
+"""Concurrent traversal of STAC catalogs for recursive linting."""
+
+import posixpath
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+from urllib.parse import urlparse, urlunparse
+
+from stac_validator.utilities import is_valid_url
+from stac_validator.validate import StacValidate
+
+from stac_check.document import StacDocument
+from stac_check.http_client import fetch_and_parse_file
+from stac_check.result_store import ResultStore
+from stac_check.schema_bundle import bundle_identity
+
+# Number of objects fetched and linted at the same time by default
+DEFAULT_CRAWL_WORKERS = 8
+
+# Link relations followed when crawling
+CRAWL_RELS = ("child", "item")
+
+
+@dataclass
+class CrawlResult:
+    """The lint result of one object visited while crawling a catalog.
+
+    Args:
+        path (str): The file path or URL of the object.
+        depth (int): The depth of the object, starting at 1 for the root.
+        message (Dict): The validation message, in the format of StacValidate's recursive messages.
+        best_practices (List[str]): The best practices messages for the object.
+        geometry_errors (List[str]): The geometry errors messages for the object.
+        children (List[str]): The resolved paths of the child and item links that were followed.
+    """
+
+    path: str
+    depth: int
+    message: Dict
+    best_practices: List[str] = field(default_factory=list)
+    geometry_errors: List[str] = field(default_factory=list)
+    children: List[str] = field(default_factory=list)
+
+
+def resolve_href(base: str, href: str) -> str:
+    """Resolve a link href against the path of the object that contains it.
+
+    Relative hrefs are appended to the directory of `base` without normalization,
+    so paths are reported exactly as stac-validator reports them.
+
+    Args:
+        base (str): The file path or URL of the object containing the link.
+        href (str): The link href.
+
+    Returns:
+        str: The resolved file path or URL.
+    """
+    if is_valid_url(href):
+        return href
+    return f"{base.rsplit('/', 1)[0]}/{href}" if "/" in base else href
+
+
+def href_key(path: str) -> str:
+    """Normalize a resolved path so the same object is only visited once.
+
+    Args:
+        path (str): A file path or URL returned by resolve_href.
+
+    Returns:
+        str: The normalized path.
+    """
+    if is_valid_url(path):
+        parsed = urlparse(path)
+        return urlunparse(parsed._replace(path=posixpath.normpath(parsed.path)))
+    return posixpath.normpath(path)
+
+
+def crawl_catalog(
+    document: StacDocument,
+    linter_class: Any,
+    max_depth: Optional[int] = None,
+    workers: int = DEFAULT_CRAWL_WORKERS,
+    headers: Optional[Dict] = None,
+    pydantic: bool = False,
+    verbose: bool = False,
+    config: Optional[Dict] = None,
+    result_store: Optional[ResultStore] = None,
+    schema_bundle: Optional[str] = None,
+    root: Optional[Any] = None,
+) -> List[CrawlResult]:
+    """Lint a STAC object and every object reachable through its child and item links.
+
+    Objects are fetched and linted by a bounded pool of threads, so network requests
+    overlap with validation. Each object is visited once, even when several objects link
+    to it, and is validated and checked against the best practices in the same pass.
+
+    Args:
+        document (StacDocument): The already loaded root object.
+        linter_class (Any): The Linter class used to lint each object.
+        max_depth (Optional[int]): The maximum depth to crawl, where the root has depth 1.
+            None crawls the whole tree.
+        workers (int): The number of objects fetched and linted at the same time.
+        headers (Optional[Dict]): HTTP headers to include in requests.
+        pydantic (bool): Whether to validate with stac-pydantic.
+        verbose (bool): Whether to include verbose validation errors.
+        config (Optional[Dict]): The parsed linting configuration.
+        result_store (Optional[ResultStore]): A store of earlier results. Objects whose
+            content did not change are not validated or linted again; their links are
+            still followed.
+        schema_bundle (Optional[str]): The path of the schema bundle objects are validated
+            with, which stored results must have been computed with too.
+        root (Optional[Any]): The Linter of `document` when the caller already built one.
+            Its validation and lint messages are reported for the root, which is then
+            not linted again; only its children are crawled.
+
+    Returns:
+        List[CrawlResult]: The result for every visited object, in depth-first link order.
+    """
+    headers = headers or {}
+    root_path = document.source or ""
+
+    def lint(
+        path: str, depth: int, data: Optional[Dict], parent_version: str = ""
+    ) -> CrawlResult:
+        try:
+            if data is None:
+                data = fetch_and_parse_file(path, headers)
+                # Objects of old STAC versions may omit stac_version, use the parent's
+                if isinstance(data, dict) and parent_version:
+                    data.setdefault("stac_version", parent_version)
+            key = (
+                result_store.key(
+                    "crawl",
+                    data,
+                    path,
+                    {
+                        "pydantic": pydantic,
+                        "verbose": verbose,
+                        "schema_bundle": bundle_identity(schema_bundle),
+                    },
+                    config,
+                )
+                if result_store is not None
+                else None
+            )
+            stored = result_store.get(key) if key is not None else None
+            if stored is not None:
+                # The stored message carries the lint messages of the object
+                best_practices = stored.pop("best_practices")
+                geometry_errors = stored.pop("geometry_errors")
+                result = CrawlResult(
+                    path, depth, stored, best_practices, geometry_errors
+                )
+            else:
+                # Linters validate and lint lazily, malformed objects fail here
+                result = linted_result(
+                    path,
+                    depth,
+                    linter_class(
+                        StacDocument(source=path, data=data),
+                        headers=headers,
+                        pydantic=pydantic,
+                        verbose=verbose,
+                        config=config,
+                        schema_bundle=schema_bundle,
+                    ),
+                )
+        except Exception as e:
+            stac = StacValidate(path, verbose=verbose)
+            message = stac.create_err_msg(
+                err_type=type(e).__name__, err_msg=str(e), error_obj=e
+            )
+            message["valid_stac"] = False
+            return CrawlResult(path, depth, message)
+
+        if stored is None and key is not None:
+            result_store.put(
+                key,
+                dict(
+                    result.message,
+                    best_practices=result.best_practices,
+                    geometry_errors=result.geometry_errors,
+                ),
+            )
+
+        add_children(result, data)
+        return result
+
+    def linted_result(path: str, depth: int, linter: Any) -> CrawlResult:
+        message = dict(linter.message)
+        message["validation_method"] = "recursive"
+        message["validator_engine"] = "pydantic" if linter.pydantic else "jsonschema"
+        return CrawlResult(
+            path,
+            depth,
+            message,
+            best_practices=linter.best_practices_msg,
+            geometry_errors=linter.geometry_errors_msg,
+        )
+
+    def add_children(result: CrawlResult, data: Any) -> None:
+        if max_depth is None or result.depth < max_depth:
+            for link in data.get("links", []) if isinstance(data, dict) else []:
+                if (
+                    isinstance(link, dict)
+                    and link.get("rel") in CRAWL_RELS
+                    and isinstance(link.get("href"), str)
+                ):
+                    result.children.append(resolve_href(result.path, link["href"]))
+
+    results: Dict[str, CrawlResult] = {}
+    visited: Set[str] = {href_key(root_path)}
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        if root is not None:
+            # The root was already linted by the caller, only its children are crawled
+            root_future: Future = Future()
+            root_result = linted_result(root_path, 1, root)
+            add_children(root_result, document.data)
+            root_future.set_result(root_result)
+        else:
+            root_future = executor.submit(lint, root_path, 1, document.data)
+        pending: Dict[Future, str] = {root_future: href_key(root_path)}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                key = pending.pop(future)
+                result = future.result()
+                results[key] = result
+                for child in result.children:
+                    child_key = href_key(child)
+                    if child_key not in visited:
+                        visited.add(child_key)
+                        future = executor.submit(
+                            lint,
+                            child,
+                            result.depth + 1,
+                            None,
+                            result.message.get("version", ""),
+                        )
+                        pending[future] = child_key
+
+    # Report objects in depth-first order of their links, as stac-validator does
+    ordered: List[CrawlResult] = []
+    emitted: Set[str] = set()
+    stack: List[str] = [href_key(root_path)]
+    while stack:
+        key = stack.pop()
+        if key in emitted or key not in results:
+            continue
+        emitted.add(key)
+        result = results[key]
+        ordered.append(result)
+        stack.extend(href_key(child) for child in reversed(result.children))
+    return ordered
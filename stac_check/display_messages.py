@@ -1,5 +1,5 @@
 import re
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 
 import click
 
@@ -13,6 +13,7 @@ __all__ = [
     "intro_message",
     "recursive_message",
     "item_collection_message",
+    "stream_item_collection_message",
     "collections_message",
     "link_asset_message",
 ]
@@ -221,129 +222,168 @@ def _display_disclaimer() -> None:
     click.secho()
 
 
-def _display_fast_validation_summary(
-    results: List[Dict[str, Any]],
-    total_time: float = 0.0,
-    schemas: Optional[List[str]] = None,
-) -> None:
-    """Display a compact validation summary for fast mode with large datasets.
+def _geometry_error_headlines(geometry_errors: List[str]) -> List[str]:
+    """Return the first message of each geometry rule in a geometry errors list.
+
+    The list starts with a header, and the messages of each rule are followed by an
+    empty string; details such as coordinate values are left out.
 
     Args:
-        results: List of validation result dictionaries
-        total_time: Total validation time in milliseconds
-        schemas: List of schemas that were checked
+        geometry_errors: The geometry errors messages of one object
+
+    Returns:
+        The first message of each violated rule
     """
-    passed = 0
-    failed = []
-    error_registry: Dict[str, List[str]] = {}
-    best_practices_issues: List[tuple] = []
+    headlines = []
+    block_start = True
+    for message in geometry_errors[1:]:
+        if not message.strip():
+            block_start = True
+        elif block_start:
+            headlines.append(message)
+            block_start = False
+    return headlines
 
-    for result in results:
+
+def _item_id(path: str) -> str:
+    """Return the item ID at the end of a result path."""
+    return path.split("/")[-1] if "/" in path else path
+
+
+class _ExampleGroups:
+    """Numbers of items per message, keeping the first few item IDs of each as examples.
+
+    Memory grows with the number of distinct messages, not with the number of items.
+
+    Args:
+        examples: The number of item IDs kept for each message
+    """
+
+    def __init__(self, examples: int = 3) -> None:
+        self.examples = examples
+        self.counts: Dict[str, int] = {}
+        self.samples: Dict[str, List[str]] = {}
+
+    def add(self, message: str, item_id: str) -> None:
+        self.counts[message] = self.counts.get(message, 0) + 1
+        samples = self.samples.setdefault(message, [])
+        if len(samples) < self.examples:
+            samples.append(item_id)
+
+    def display(self, prefix: str, fg: str) -> None:
+        for message, count in self.counts.items():
+            click.secho(f"{prefix} {message}", fg=fg)
+            sample_ids = ", ".join(self.samples[message])
+            if count > self.examples:
+                sample_ids += f" ... (and {count - self.examples} more)"
+            click.secho(f"   Affected Items: {count} | Examples: {sample_ids}", fg=fg)
+            click.secho()
+
+
+class _FastValidationSummary:
+    """Totals of fast mode results, accumulated one result at a time for the compact summary."""
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.passed = 0
+        self.errors = _ExampleGroups()
+        self.geometry_errors = _ExampleGroups()
+        self.best_practices = _ExampleGroups()
+
+    def add(self, result: Dict[str, Any]) -> None:
+        path = result.get("path", "unknown")
+        self.total += 1
         if result.get("valid_stac"):
-            passed += 1
+            self.passed += 1
         else:
-            failed.append(result)
             # Group errors by message
-            error_msg = result.get("error_message", "Unknown error")
-            if error_msg not in error_registry:
-                error_registry[error_msg] = []
-            # Extract item ID from path
-            path = result.get("path", "unknown")
-            item_id = path.split("/")[-1] if "/" in path else path
-            error_registry[error_msg].append(item_id)
+            self.errors.add(
+                result.get("error_message", "Unknown error"), _item_id(path)
+            )
 
         # Collect best practices issues (filter out empty/base messages)
-        best_practices = result.get("best_practices", [])
-        if best_practices:
-            # Filter out the base string and empty messages
-            filtered_practices = [
-                msg
-                for msg in best_practices
-                if msg and msg.strip() and msg.strip() != "STAC Best Practices:"
-            ]
-            if filtered_practices:
-                path = result.get("path", "unknown")
-                best_practices_issues.append((path, filtered_practices))
-
-    click.secho()
-    click.secho("\n Validation Summary", bold=True, bg="black", fg="white")
-    click.secho()
-    click.secho(f"✅ Passed: {passed}/{len(results)}")
-
-    if len(failed) > 0:
-        click.secho(f"❌ Failed: {len(failed)}/{len(results)}", fg="red")
+        for msg in result.get("best_practices", []) or []:
+            if not msg or not msg.strip() or msg.strip() == "STAC Best Practices:":
+                continue
+            # Normalize messages that contain item IDs to group them together
+            # e.g., "Item name 'S2B_1CCV_20200317_0_L2A' should only contain..."
+            # becomes "Item name '<id>' should only contain..."
+            # Use negative lookbehind to avoid matching apostrophes in contractions (e.g., "item's")
+            normalized_msg = re.sub(r"(?<![a-zA-Z])'[^']+'", "'<id>'", msg)
+            self.best_practices.add(normalized_msg, _item_id(path))
+
+        # Collect geometry errors (reported with --batch-geometry), grouped by rule
+        for headline in _geometry_error_headlines(result.get("geometry_errors", [])):
+            self.geometry_errors.add(headline, _item_id(path))
+
+    def display(
+        self, total_time: float = 0.0, schemas: Optional[List[str]] = None
+    ) -> None:
+        failed = self.total - self.passed
 
-    if total_time > 0:
         click.secho()
-        click.secho("⚡ Timing Information:", bold=True, fg="cyan")
-        click.secho(f"  Total Validation Time: {total_time:.2f} ms")
-        if len(results) > 0:
-            avg_time = total_time / len(results)
-            click.secho(f"  Average per Object: {avg_time:.3f} ms")
-
-    # Display schemas checked
-    if schemas and len(schemas) > 0:
+        click.secho("\n Validation Summary", bold=True, bg="black", fg="white")
         click.secho()
-        click.secho("Schemas checked:", bold=True)
-        for schema in schemas:
-            click.secho(f"    {schema}")
+        click.secho(f"✅ Passed: {self.passed}/{self.total}")
 
-    # Display grouped errors
-    if error_registry:
-        click.secho()
-        click.secho("\n Validation Errors", bg="red", fg="white")
-        click.secho()
-        for err_msg, affected_ids in error_registry.items():
-            count = len(affected_ids)
-            click.secho(f"❌ {err_msg}", fg="red")
-            sample_ids = ", ".join(affected_ids[:3])
-            if count > 3:
-                sample_ids += f" ... (and {count - 3} more)"
-            click.secho(
-                f"   Affected Items: {count} | Examples: {sample_ids}", fg="red"
-            )
+        if failed > 0:
+            click.secho(f"❌ Failed: {failed}/{self.total}", fg="red")
+
+        if total_time > 0:
             click.secho()
+            click.secho("⚡ Timing Information:", bold=True, fg="cyan")
+            click.secho(f"  Total Validation Time: {total_time:.2f} ms")
+            if self.total > 0:
+                avg_time = total_time / self.total
+                click.secho(f"  Average per Object: {avg_time:.3f} ms")
+
+        # Display schemas checked
+        if schemas and len(schemas) > 0:
+            click.secho()
+            click.secho("Schemas checked:", bold=True)
+            for schema in schemas:
+                click.secho(f"    {schema}")
 
-    # Display best practices issues (grouped by message type)
-    if best_practices_issues:
-        click.secho()
-        click.secho("\n Best Practices Warnings", bg="blue", fg="white")
-        click.secho()
+        # Display grouped errors
+        if self.errors.counts:
+            click.secho()
+            click.secho("\n Validation Errors", bg="red", fg="white")
+            click.secho()
+            self.errors.display("❌", "red")
 
-        # Group best practices by message type (normalize item-specific messages)
-        practices_registry: Dict[str, List[str]] = {}
-        for path, messages in best_practices_issues:
-            # Extract item ID from path
-            item_id = path.split("/")[-1] if "/" in path else path
-            for msg in messages:
-                # Normalize messages that contain item IDs to group them together
-                # e.g., "Item name 'S2B_1CCV_20200317_0_L2A' should only contain..."
-                # becomes "Item name should only contain Searchable identifiers"
-                normalized_msg = msg
-                # Replace specific item/file names in single quotes with generic placeholder
-                # Handles patterns like: "Item name 'xyz' should...", "Item file names should match their ids: 'xyz' not equal to 'abc'"
-                # Use negative lookbehind to avoid matching apostrophes in contractions (e.g., "item's")
-                normalized_msg = re.sub(
-                    r"(?<![a-zA-Z])'[^']+'", "'<id>'", normalized_msg
-                )
+        # Display geometry errors, each rule with the items that violate it
+        if self.geometry_errors.counts:
+            click.secho()
+            click.secho("\n Geometry Validation Errors", bg="magenta", fg="black")
+            click.secho()
+            self.geometry_errors.display("❌", "magenta")
 
-                if normalized_msg not in practices_registry:
-                    practices_registry[normalized_msg] = []
-                practices_registry[normalized_msg].append(item_id)
-
-        # Display grouped best practices
-        for practice_msg, affected_ids in practices_registry.items():
-            count = len(affected_ids)
-            click.secho(f"⚠️  {practice_msg}", fg="blue")
-            sample_ids = ", ".join(affected_ids[:3])
-            if count > 3:
-                sample_ids += f" ... (and {count - 3} more)"
-            click.secho(
-                f"   Affected Items: {count} | Examples: {sample_ids}", fg="blue"
-            )
+        # Display best practices issues (grouped by message type)
+        if self.best_practices.counts:
+            click.secho()
+            click.secho("\n Best Practices Warnings", bg="blue", fg="white")
             click.secho()
+            self.best_practices.display("⚠️ ", "blue")
 
-    click.secho()
+        click.secho()
+
+
+def _display_fast_validation_summary(
+    results: Iterable[Dict[str, Any]],
+    total_time: float = 0.0,
+    schemas: Optional[List[str]] = None,
+) -> None:
+    """Display a compact validation summary for fast mode with large datasets.
+
+    Args:
+        results: The validation result dictionaries, read once
+        total_time: Total validation time in milliseconds
+        schemas: List of schemas that were checked
+    """
+    summary = _FastValidationSummary()
+    for result in results:
+        summary.add(result)
+    summary.display(total_time, schemas)
 
 
 def _display_validation_summary(
@@ -476,6 +516,69 @@ def _display_validation_summary(
         click.secho()
 
 
+def _display_result(
+    count: int,
+    msg: Dict[str, Any],
+    cli_message_func: Callable[[Linter], None],
+    create_linter_func: Optional[Callable[[Dict[str, Any]], Linter]] = None,
+    display_result_func: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> None:
+    """Display one validation result under its asset header, see `_display_validation_results`.
+
+    Args:
+        count: The index of the result, shown in the header
+        msg: The validation result dictionary
+        cli_message_func: Function to use for displaying validation messages
+        create_linter_func: Function to create a Linter instance from the result
+        display_result_func: Function to display the result directly, used when
+                            no create_linter_func is provided
+    """
+    # Get the path or use a fallback
+    path = msg.get("path", f"(unknown-{count + 1})")
+    click.secho(f"\n Asset {count + 1}: {path}", bg="white", fg="black")
+    click.secho()
+
+    try:
+        # Try to create a Linter instance using the provided function
+        if create_linter_func:
+            item_linter = create_linter_func(msg)
+
+            # If create_linter_func returns None (for recursive validation), use fallback
+            if item_linter is None:
+                _display_fallback_message(msg)
+            else:
+                # Set validation status and error info for invalid items
+                if not msg.get("valid_stac", True):
+                    item_linter.valid_stac = False
+                    item_linter.error_type = msg.get("error_type")
+                    item_linter.error_msg = msg.get("error_message")
+
+                # Ensure best practices are included in the result
+                if (
+                    hasattr(item_linter, "best_practices_msg")
+                    and item_linter.best_practices_msg
+                ):
+                    # Skip the first line which is just the header
+                    bp_msgs = [
+                        msg for msg in item_linter.best_practices_msg[1:] if msg.strip()
+                    ]
+                    if bp_msgs:
+                        msg["best_practices"] = bp_msgs
+
+                # Display using the provided message function
+                cli_message_func(item_linter)
+        elif display_result_func:
+            display_result_func(msg)
+        else:
+            # No linter creation function provided, use fallback
+            _display_fallback_message(msg)
+    except Exception as e:
+        # Fall back to basic display if creating the Linter fails
+        _display_fallback_message(msg, e)
+
+    click.secho("-------------------------")
+
+
 def _display_validation_results(
     results: List[Dict[str, Any]],
     title: str,
@@ -485,6 +588,7 @@ def _display_validation_results(
     verbose: bool = False,
     fast: bool = False,
     total_time: float = 0.0,
+    display_result_func: Optional[Callable[[Dict[str, Any]], None]] = None,
 ) -> None:
     """Shared helper function to display validation results consistently.
 
@@ -500,6 +604,8 @@ def _display_validation_results(
         cli_message_func: Function to use for displaying validation messages
         create_linter_func: Function to create a Linter instance from a result item
                            Should take a result dict and return a Linter instance
+        display_result_func: Function to display a result dict directly, used when
+                            no create_linter_func is provided
 
     Returns:
         None
@@ -535,50 +641,9 @@ def _display_validation_results(
             continue
 
         if show_all_items:
-            # Get the path or use a fallback
-            path = msg.get("path", f"(unknown-{count + 1})")
-            click.secho(f"\n Asset {count + 1}: {path}", bg="white", fg="black")
-            click.secho()
-
-            try:
-                # Try to create a Linter instance using the provided function
-                if create_linter_func:
-                    item_linter = create_linter_func(msg)
-
-                    # If create_linter_func returns None (for recursive validation), use fallback
-                    if item_linter is None:
-                        _display_fallback_message(msg)
-                    else:
-                        # Set validation status and error info for invalid items
-                        if not msg.get("valid_stac", True):
-                            item_linter.valid_stac = False
-                            item_linter.error_type = msg.get("error_type")
-                            item_linter.error_msg = msg.get("error_message")
-
-                        # Ensure best practices are included in the result
-                        if (
-                            hasattr(item_linter, "best_practices_msg")
-                            and item_linter.best_practices_msg
-                        ):
-                            # Skip the first line which is just the header
-                            bp_msgs = [
-                                msg
-                                for msg in item_linter.best_practices_msg[1:]
-                                if msg.strip()
-                            ]
-                            if bp_msgs:
-                                msg["best_practices"] = bp_msgs
-
-                        # Display using the provided message function
-                        cli_message_func(item_linter)
-                else:
-                    # No linter creation function provided, use fallback
-                    _display_fallback_message(msg)
-            except Exception as e:
-                # Fall back to basic display if creating the Linter fails
-                _display_fallback_message(msg, e)
-
-            click.secho("-------------------------")
+            _display_result(
+                count, msg, cli_message_func, create_linter_func, display_result_func
+            )
         else:
             items_shown += 1
 
@@ -626,6 +691,9 @@ def item_collection_message(
     def create_api_linter(msg):
         if msg.get("original_object"):
             return Linter(msg.get("original_object"), fast=linter.fast)
+        # Streamed results do not keep the original object
+        if linter.stream:
+            return None
         raise ValueError("No original object available")
 
     # Display the results using the shared helper
@@ -641,6 +709,128 @@ def item_collection_message(
     )
 
 
+class _StreamValidationSummary:
+    """Totals of streamed results for the standard summary, accumulated one result at a time.
+
+    Only the first `limit` paths of each list are kept, every asset has already been
+    displayed with its details when the summary is printed.
+
+    Args:
+        limit: The number of failed, warned and checked paths kept for the summary
+    """
+
+    def __init__(self, limit: int = 12) -> None:
+        self.limit = limit
+        self.total = 0
+        self.passed = 0
+        self.failed: List[str] = []
+        self.failed_count = 0
+        self.warnings: List[tuple] = []
+        self.warning_count = 0
+        self.paths: List[str] = []
+
+    def add(self, result: Dict[str, Any]) -> None:
+        path = result.get("path", "unknown")
+        self.total += 1
+        if len(self.paths) < self.limit:
+            self.paths.append(path)
+
+        if result.get("valid_stac"):
+            self.passed += 1
+        else:
+            self.failed_count += 1
+            if len(self.failed) < self.limit:
+                self.failed.append(path)
+
+        best_practices = [
+            p
+            for p in result.get("best_practices", []) or []
+            if p and p.strip() and p != "STAC Best Practices: "
+        ]
+        if best_practices:
+            self.warning_count += 1
+            if len(self.warnings) < self.limit:
+                self.warnings.append((path, best_practices))
+
+    def display(self) -> None:
+        click.secho("\n Validation Summary", bold=True, bg="black", fg="white")
+        click.secho()
+        click.secho(f"✅ Passed: {self.passed}/{self.total}")
+
+        if self.failed_count:
+            click.secho(f"❌ Failed: {self.failed_count}/{self.total}", fg="red")
+            click.secho("\nFailed Assets:", fg="red")
+            for path in self.failed:
+                click.secho(f"  - {path}")
+            if self.failed_count > len(self.failed):
+                click.secho(f"  ... (and {self.failed_count - len(self.failed)} more)")
+
+        if self.warning_count:
+            click.secho(
+                f"\n⚠️  Best Practice Warnings ({self.warning_count} assets)",
+                fg="yellow",
+            )
+            if self.warning_count <= self.limit:
+                for path, msgs in self.warnings:
+                    click.secho(f"\n  {path}:", fg="yellow")
+                    for msg in msgs:
+                        click.secho(f"    • {msg}", fg="yellow")
+            else:
+                click.secho("  (Shown with each asset above)", fg="yellow")
+
+        click.secho(f"\n🔍 All {self.total} Assets Checked")
+        if self.total <= self.limit:
+            for path in self.paths:
+                click.secho(f"  - {path}")
+        else:
+            click.secho("  (Shown above)", fg="yellow")
+
+        click.secho()
+
+
+def stream_item_collection_message(
+    linter: ApiLinter,
+    results: Iterable[Dict[str, Any]],
+    cli_message_func: Optional[Callable[[Linter], None]] = None,
+) -> bool:
+    """Displays the results of a streamed feature collection as they are produced.
+
+    Each result is displayed as soon as it is read from `results`, in the layout of
+    item_collection_message, and only totals and a few examples are kept for the
+    summary, so memory stays bounded however many items are linted. In fast mode
+    only the compact summary is displayed.
+
+    Args:
+        linter: The ApiLinter producing the results.
+        results: The validation results, typically `linter.iter_results()`.
+        cli_message_func: The cli_message function to use for item validation.
+
+    Returns:
+        bool: Whether every item was valid.
+    """
+    if linter.fast:
+        fast_summary = _FastValidationSummary()
+        for msg in results:
+            fast_summary.add(msg)
+        fast_summary.display(linter.total_time, linter.schemas_checked)
+        return fast_summary.passed == fast_summary.total
+
+    click.secho()
+    click.secho(
+        "Item Collection: Validate all assets in a feature collection", bold=True
+    )
+    click.secho(f"Pages = {linter.pages}")
+    click.secho("-------------------------")
+
+    summary = _StreamValidationSummary()
+    for count, msg in enumerate(results):
+        # Streamed results do not keep the original object
+        _display_result(count, msg, cli_message_func or cli_message)
+        summary.add(msg)
+    summary.display()
+    return summary.passed == summary.total
+
+
 def _display_fallback_message(
     msg: Dict[str, Any], error: Optional[Exception] = None
 ) -> None:
@@ -705,6 +895,62 @@ def _display_fallback_message(
     click.secho("-------------------------")
 
 
+def _display_recursive_result(msg: Dict[str, Any]) -> None:
+    """Display one result of a recursive validation in the same layout as cli_message.
+
+    Args:
+        msg: The message dictionary recorded for the object during the traversal
+    """
+    valid = msg.get("valid_stac")
+    click.secho(
+        f"{msg.get('asset_type')} Passed: {valid}",
+        fg="green" if valid else "red",
+        bold=True,
+    )
+
+    click.secho()
+    if msg.get("schema"):
+        click.secho("Schemas checked: ", fg="blue")
+        for schema in msg["schema"]:
+            click.secho(f"    {schema}")
+    click.secho()
+
+    if msg.get("failed_schema"):
+        click.secho("Failed Schema: ", fg="blue")
+        click.secho(f"    {msg['failed_schema']}")
+        click.secho()
+
+    if msg.get("recommendation"):
+        click.secho("Recommendation: ", fg="blue")
+        click.secho(f"    {msg['recommendation']}")
+
+    best_practices = msg.get("best_practices", [])
+    if best_practices:
+        click.secho("\n " + best_practices[0], bg="blue")
+        click.secho()
+        for message in best_practices[1:]:
+            click.secho(message, fg="black")
+
+    geometry_errors = msg.get("geometry_errors", [])
+    if geometry_errors:
+        click.secho("\n " + geometry_errors[0], bg="magenta", fg="black")
+        click.secho()
+        for message in geometry_errors[1:]:
+            click.secho(message, fg="black")
+
+    if not valid:
+        click.secho()
+        if msg.get("error_type"):
+            click.secho("\n Validation Errors: ", fg="white", bold=True, bg="black")
+            click.secho()
+            click.secho("Validation error type: ", fg="red")
+            click.secho(f"    {msg['error_type']}")
+            click.secho()
+        if msg.get("error_message"):
+            click.secho("Validation error message: ", fg="red")
+            click.secho(f"    {msg['error_message']}")
+
+
 def collections_message(
     linter: ApiLinter,
     results: Optional[List[Dict[str, Any]]] = None,
@@ -752,6 +998,37 @@ def collections_message(
     )
 
 
+def batch_message(
+    results: List[Dict[str, Any]],
+    verbose: bool = False,
+    fast: bool = False,
+    total_time: float = 0.0,
+) -> None:
+    """Displays one summary of the validation of many files linted together.
+
+    Args:
+        results: The validation results, one per file.
+        verbose: Whether to show every file and best practice warning.
+        fast: Whether fast mode is enabled (for compact output and timing display).
+        total_time: Total validation time in milliseconds.
+
+    Returns:
+        None.
+    """
+    click.secho(logo, fg="white")
+    click.secho("stac-check: STAC spec validation and linting tool", bold=True)
+    click.secho()
+    click.secho(
+        f" Batch: {len(results)} files linted in {total_time / 1000:.2f} s",
+        bold=True,
+        bg="black",
+        fg="white",
+    )
+    _display_validation_summary(
+        results, verbose=verbose, fast=fast, total_time=total_time
+    )
+
+
 def recursive_message(
     linter: Linter,
     cli_message_func: Optional[Callable[[Linter], None]] = None,
@@ -760,9 +1037,9 @@ def recursive_message(
     """Displays messages related to the recursive validation of assets in a collection or catalog.
 
     This function processes recursive validation results from a Linter and displays them in a
-    consistent format. For each asset in the collection or catalog, it attempts to create a new
-    Linter instance and use cli_message_func for display. If that fails, it falls back to a
-    simpler display using _display_fallback_message.
+    consistent format. Each asset in the collection or catalog is displayed from the result
+    recorded during the linter's traversal, in the same layout as cli_message, so no object
+    is fetched or validated a second time.
 
     The function handles both valid and invalid STAC objects consistently, ensuring that
     error information is displayed appropriately for invalid items.
@@ -775,19 +1052,20 @@ def recursive_message(
     Returns:
         None.
     """
-
-    # Define a function to create Linter instances from recursive results
-    def create_recursive_linter(msg):
-        return Linter(msg["path"], recursive=True)
+    # Attach the best practices found for each object during the same traversal
+    results = [
+        dict(msg, **linter.recursive_lint.get(msg.get("path"), {}))
+        for msg in linter.validate_all
+    ]
 
     # Display the results using the shared helper
     _display_validation_results(
-        results=linter.validate_all,
+        results=results,
         title="Recursive: Validate all assets in a collection or catalog",
         metadata={"Max-depth": linter.max_depth},
         cli_message_func=cli_message_func,
-        create_linter_func=create_recursive_linter,
         verbose=verbose,
+        display_result_func=_display_recursive_result,
     )
 
 
@@ -816,7 +1094,7 @@ def cli_message(linter: Linter) -> None:
     _display_disclaimer()
 
 
-def intro_message(linter: Linter) -> None:
+def intro_message(linter: Union[Linter, ApiLinter]) -> None:
     """Prints an introduction message for the stac-check tool.
 
     The message includes the stac-check logo, the name of the tool, the version
@@ -824,7 +1102,7 @@ def intro_message(linter: Linter) -> None:
     stac-validator being used.
 
     Args:
-        linter (object): An instance of the Linter class, which is used to
+        linter (object): An instance of the Linter or ApiLinter class, which is used to
             obtain the version of the STAC spec being validated, the update
             message, and the version of the stac-validator being used.
 
@@ -0,0 +1,80 @@
+"""Loading of STAC documents so each input is read and decoded only once per run."""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Union
+
+import requests
+from stac_validator.utilities import is_valid_url
+
+from stac_check import json_backend
+from stac_check.compression import map_file
+from stac_check.http_client import DEFAULT_TIMEOUT, get_session
+from stac_check.sniff import SniffedDocument
+
+
+@dataclass
+class StacDocument:
+    """A STAC JSON document that has already been read and decoded.
+
+    A single StacDocument is created per input and handed to the CLI, the
+    Linter, the ApiLinter and the fast validation wrapper, so that the source
+    bytes are never read or parsed more than once.
+
+    Args:
+        source (Optional[str]): The file path or URL the document was loaded from,
+            or None if the document was provided as a dictionary.
+        data (Any): The decoded JSON content.
+        error (Optional[Exception]): An HTTP error returned while fetching the document.
+            It is reported by the validator as a failed validation rather than raised.
+    """
+
+    source: Optional[str]
+    data: Any
+    error: Optional[Exception] = None
+
+
+def load_document(
+    source: Union[str, Dict, StacDocument, SniffedDocument],
+    headers: Optional[Dict] = None,
+) -> StacDocument:
+    """Load a STAC document from a file path, URL or dictionary.
+
+    Args:
+        source (Union[str, Dict, StacDocument, SniffedDocument]): A file path, URL,
+            dictionary or an already loaded StacDocument, which is returned unchanged.
+            A SniffedDocument is read on from the bytes its detection already read.
+        headers (Optional[Dict]): HTTP headers to include in URL requests.
+
+    Returns:
+        StacDocument: The loaded document.
+
+    Raises:
+        requests.exceptions.RequestException: If there is an error making a request to a URL.
+        JSONDecodeError: If the JSON data cannot be decoded.
+        FileNotFoundError: If the specified file cannot be found.
+    """
+    if isinstance(source, StacDocument):
+        return source
+
+    if isinstance(source, SniffedDocument):
+        with source:
+            data = json_backend.loads(source.read())
+        return StacDocument(source=source.source, data=data, error=source.error)
+
+    if isinstance(source, str):
+        if is_valid_url(source):
+            resp = get_session().get(
+                source, headers=headers or {}, timeout=DEFAULT_TIMEOUT
+            )
+            data = json_backend.loads(resp.content)
+            try:
+                resp.raise_for_status()
+            except requests.exceptions.HTTPError as e:
+                return StacDocument(source=source, data=data, error=e)
+        else:
+            # Decode straight from the memory-mapped file
+            with map_file(source) as content:
+                data = json_backend.loads(content)
+        return StacDocument(source=source, data=data)
+
+    return StacDocument(source=None, data=source)
@@ -1,8 +1,23 @@
-"""Fast validation wrapper for item collections using FastValidator."""
+"""Fast validation of STAC objects and item collections with stac-valid's fast validators."""
 
-import json
+import contextlib
+import io
 import time
-from typing import Any, Dict, List
+import warnings
+from typing import Any, Dict, List, Optional, Union
+
+import fastjsonschema  # type: ignore
+import jsonschema
+
+from stac_check.document import StacDocument, load_document
+from stac_check.geometry import GeometrySummary, summarize_geometries
+from stac_check.schema_bundle import use_schema_bundle
+from stac_check.schema_cache import STAC_TYPES, get_validator
+
+with warnings.catch_warnings():
+    # Still raised by the RefResolver of stac-valid's python-jsonschema fallback
+    warnings.simplefilter("ignore", DeprecationWarning)
+    from jsonschema.exceptions import RefResolutionError
 
 
 def extract_schemas(obj: Dict) -> List[str]:
@@ -28,6 +43,10 @@ def extract_schemas(obj: Dict) -> List[str]:
             schemas.append(
                 f"https://schemas.stacspec.org/v{stac_version}/collection-spec/json-schema/collection.json"
             )
+        elif item_type == "Catalog":
+            schemas.append(
+                f"https://schemas.stacspec.org/v{stac_version}/catalog-spec/json-schema/catalog.json"
+            )
 
         # Add extension schemas
         for ext in obj.get("stac_extensions", []):
@@ -36,94 +55,303 @@ def extract_schemas(obj: Dict) -> List[str]:
     return schemas
 
 
+def translate_fast_error(error: fastjsonschema.JsonSchemaValueException) -> str:
+    """Word a fastjsonschema validation error as stac-valid's FastValidator does.
+
+    Args:
+        error: The error raised by a compiled validator
+
+    Returns:
+        The error message, prefixed with the path of the failing value; violations of
+        `not` rules are explained, such as the missing collection link of an Item
+    """
+    message = f"{error.name} {error.message.replace(error.name, '').strip()}"
+    if "disallowed definition" in message:
+        if "collection" in message:
+            return "STAC Spec Violation: Missing {'rel': 'collection'} in links array."
+        return f"{error.name} violated a 'not' rule. Value: {error.value!r}"
+    return message
+
+
+def fast_validation_errors(
+    obj: Dict, timings: Optional[Dict[str, float]] = None
+) -> List[str]:
+    """Validate one STAC object with stac-valid's fast validators.
+
+    Validators come from the on-disk schema cache when it is enabled.
+
+    Args:
+        obj: A STAC Item, Collection or Catalog; Features are validated as Items and
+            objects without a type as Catalogs, as FastValidator does
+        timings: When given, the time spent getting the validator and running it is
+            added to its setup_time_ms and execution_time_ms keys
+
+    Returns:
+        The validation error of the object, or an empty list if it is valid
+    """
+    stac_type = "Item" if obj.get("type") == "Feature" else obj.get("type", "Catalog")
+    if stac_type not in STAC_TYPES:
+        return ["Unable to determine the STAC type of the object"]
+
+    start = time.perf_counter()
+    try:
+        # get_validator reports schema fetches and fallbacks on stdout
+        with contextlib.redirect_stdout(io.StringIO()):
+            validator, _ = get_validator(
+                stac_type,
+                obj.get("stac_version", "1.0.0"),
+                obj.get("stac_extensions", []),
+            )
+    except (RuntimeError, ValueError, fastjsonschema.JsonSchemaException):
+        return ["Unable to load the schema for the object"]
+    setup_end = time.perf_counter()
+
+    try:
+        validator(obj)
+    except fastjsonschema.JsonSchemaValueException as e:
+        return [translate_fast_error(e)]
+    except jsonschema.exceptions.ValidationError as e:
+        return [e.message]
+    except (RefResolutionError, LookupError) as e:
+        # e.g. a schema missing from the active schema bundle
+        return [f"Unable to resolve a schema of the object: {e}"]
+    finally:
+        if timings is not None:
+            end = time.perf_counter()
+            timings["setup_time_ms"] = (
+                timings.get("setup_time_ms", 0.0) + (setup_end - start) * 1000
+            )
+            timings["execution_time_ms"] = (
+                timings.get("execution_time_ms", 0.0) + (end - setup_end) * 1000
+            )
+    return []
+
+
+def fast_validation_message(data: Dict) -> Dict[str, Any]:
+    """Validate already-loaded STAC content object by object with fast_validation_errors.
+
+    Args:
+        data: A STAC Item, Collection, Catalog or FeatureCollection dictionary
+
+    Returns:
+        A message dict with the valid_stac, valid_objects, invalid_objects,
+        setup_time_ms, execution_time_ms, schemas_checked and errors keys of
+        ``FastValidator.message[0]``
+    """
+    objects = (
+        data.get("features", []) if data.get("type") == "FeatureCollection" else [data]
+    )
+    error_registry: Dict[str, List[str]] = {}
+    schemas_checked: set = set()
+    timings = {"setup_time_ms": 0.0, "execution_time_ms": 0.0}
+    for index, obj in enumerate(objects):
+        schemas_checked.update(extract_schemas(obj))
+        for error in fast_validation_errors(obj, timings):
+            error_registry.setdefault(error, []).append(
+                obj.get("id", f"unknown-{index}")
+            )
+    invalid_count = sum(len(affected) for affected in error_registry.values())
+
+    return {
+        "valid_stac": bool(objects) and not error_registry,
+        "setup_time_ms": timings["setup_time_ms"],
+        "execution_time_ms": timings["execution_time_ms"],
+        "valid_objects": len(objects) - invalid_count,
+        "invalid_objects": invalid_count,
+        "schemas_checked": sorted(schemas_checked),
+        "errors": [
+            {
+                "error_message": error,
+                "affected_items": affected,
+                "count": len(affected),
+            }
+            for error, affected in error_registry.items()
+        ],
+    }
+
+
+def _create_fast_result(
+    obj: Dict,
+    obj_url: str,
+    error_messages: List[str],
+    linter_class: Any,
+    verbose: bool = False,
+    fast_linting: bool = False,
+    config: Optional[Dict] = None,
+    geometry: Optional[GeometrySummary] = None,
+) -> Dict[str, Any]:
+    """Build the result dict for one object validated in fast mode.
+
+    Args:
+        obj: The STAC object that was validated
+        obj_url: The path reported for the object
+        error_messages: The validation errors reported for the object
+        linter_class: The Linter class to use for linting
+        verbose: Whether to show verbose output
+        fast_linting: Whether to include linting checks in fast mode
+        config: The parsed linting configuration, used when fast_linting is enabled
+        geometry: The summary of the object's geometry computed in a batch; when given,
+            geometry errors are reported
+
+    Returns:
+        The result dict, without the original object
+    """
+    is_valid = not error_messages
+
+    # Get best practices for this item (linting checks only, no re-validation)
+    # Only run linting if fast_linting is enabled, or if the geometry was checked in a batch
+    best_practices = []
+    geometry_errors = []
+    if fast_linting or geometry is not None:
+        try:
+            item_linter = linter_class(
+                obj,
+                verbose=verbose,
+                fast=True,
+                fast_linting=True,
+                config=config,
+                precomputed_geometry=geometry,
+            )
+            if fast_linting:
+                best_practices = item_linter.best_practices_msg
+            geometry_errors = item_linter.geometry_errors_msg
+        except Exception:
+            best_practices = []
+            geometry_errors = []
+
+    return {
+        "path": obj_url,
+        "valid_stac": is_valid,
+        "asset_type": "",
+        "version": obj.get("stac_version", ""),
+        "validation_method": "FastJSONSchema",
+        "error_type": "FastValidationError" if not is_valid else "",
+        "error_message": error_messages[0] if error_messages else "",
+        "best_practices": best_practices,
+        "geometry_errors": geometry_errors,
+        "schema": extract_schemas(obj),
+    }
+
+
+def validate_item_fast(
+    obj: Dict,
+    obj_url: str,
+    linter_class: Any,
+    verbose: bool = False,
+    fast_linting: bool = False,
+    config: Optional[Dict] = None,
+    geometry: Optional[GeometrySummary] = None,
+    schema_bundle: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Validate a single item with stac-valid's fast validators.
+
+    Used when an item collection is streamed, so that each feature can be
+    validated and released before the next one is read.
+
+    Args:
+        obj: The STAC item to validate
+        obj_url: The path reported for the item
+        linter_class: The Linter class to use for linting
+        verbose: Whether to show verbose output
+        fast_linting: Whether to include linting checks in fast mode
+        config: The parsed linting configuration, used when fast_linting is enabled
+        geometry: The summary of the item's geometry computed in a batch
+        schema_bundle: The path of a schema bundle to resolve every remote schema from
+
+    Returns:
+        The result dict, without the original object
+    """
+    with use_schema_bundle(schema_bundle):
+        return _create_fast_result(
+            obj,
+            obj_url,
+            fast_validation_errors(obj),
+            linter_class,
+            verbose,
+            fast_linting,
+            config,
+            geometry,
+        )
+
+
 def validate_collection_fast(
-    source: str, linter_class: Any, verbose: bool = False, fast_linting: bool = False
+    source: Union[str, StacDocument],
+    linter_class: Any,
+    verbose: bool = False,
+    fast_linting: bool = False,
+    batch_geometry: bool = False,
+    schema_bundle: Optional[str] = None,
 ) -> tuple[List[Dict], float, List[str]]:
-    """Validate a collection file using FastValidator.
-
-    Uses the updated FastValidator that exposes valid/invalid counts and error details
-    in the message dict, eliminating the need for temp files.
+    """Validate every item of a collection file with stac-valid's fast validators.
 
     Args:
-        source: Path to the STAC collection file
+        source: Path to the STAC collection file, or the already loaded StacDocument
         linter_class: The Linter class to use for validation
         verbose: Whether to show verbose output
         fast_linting: Whether to include linting checks in fast mode
+        batch_geometry: Whether to check the geometries of all items with one vectorized
+            call over their coordinates, and report geometry errors for each item
+        schema_bundle: The path of a schema bundle to resolve every remote schema from
 
     Returns:
         Tuple of (results list, total_time in ms, schemas_checked list)
     """
+    with use_schema_bundle(schema_bundle):
+        return _validate_collection_fast(
+            source, linter_class, verbose, fast_linting, batch_geometry
+        )
+
+
+def _validate_collection_fast(
+    source: Union[str, StacDocument],
+    linter_class: Any,
+    verbose: bool,
+    fast_linting: bool,
+    batch_geometry: bool,
+) -> tuple[List[Dict], float, List[str]]:
     start_time = time.time()
     results_by_url = {}
+    schemas_checked: set = set()
 
-    # Parse the source file to get items
-    with open(source) as f:
-        data = json.load(f)
+    # Parse the source file once
+    document = load_document(source)
+    data = document.data
 
     items = (
         data.get("features", []) if data.get("type") == "FeatureCollection" else [data]
     )
 
-    # Validate the collection file with FastValidator
-    # FastValidator now exposes valid_count, invalid_count, and error details
-    linter = linter_class(source, verbose=verbose, fast=True)
+    # Parse the linting configuration once for all items
+    config = linter_class.parse_config() if fast_linting or batch_geometry else None
 
-    # FastValidator returns message as a list with one dict
-    if isinstance(linter.message, list) and len(linter.message) > 0:
-        msg = linter.message[0]
-    else:
-        msg = linter.message if isinstance(linter.message, dict) else {}
-
-    # Extract validation results from FastValidator message
-    schemas_checked = msg.get("schemas_checked", [])
-    errors = msg.get("errors", [])
-
-    # Build a map of failed item IDs for quick lookup
-    failed_items: Dict[str, List[str]] = {}
-    for error in errors:
-        for item_id in error.get("affected_items", []):
-            if item_id not in failed_items:
-                failed_items[item_id] = []
-            failed_items[item_id].append(error.get("error_message", ""))
+    # Check the geometries of all items at once, each summary belongs to the item at its index
+    geometries = (
+        summarize_geometries(
+            [obj.get("geometry") if isinstance(obj, dict) else None for obj in items]
+        )
+        if batch_geometry
+        else [None] * len(items)
+    )
 
     # Create per-item results
-    for idx, obj in enumerate(items):
+    for idx, (obj, geometry) in enumerate(zip(items, geometries)):
         item_id = obj.get("id", f"unknown-{idx}")
-        obj_url = f"{source}/{item_id}"
-        item_schemas = extract_schemas(obj)
-
-        # Determine if item is valid
-        is_valid = item_id not in failed_items
-        error_messages = failed_items.get(item_id, [])
-
-        # Get best practices for this item (linting checks only, no re-validation)
-        # Only run linting if fast_linting is enabled
-        best_practices = []
-        if fast_linting:
-            try:
-                item_linter = linter_class(
-                    obj, verbose=verbose, fast=True, fast_linting=True
-                )
-                best_practices = item_linter.best_practices_msg
-            except Exception:
-                best_practices = []
-
-        result = {
-            "path": obj_url,
-            "valid_stac": is_valid,
-            "asset_type": "",
-            "version": obj.get("stac_version", ""),
-            "validation_method": "FastJSONSchema",
-            "error_type": "FastValidationError" if not is_valid else "",
-            "error_message": error_messages[0] if error_messages else "",
-            "best_practices": best_practices,
-            "geometry_errors": [],
-            "schema": item_schemas,
-            "original_object": obj,
-        }
+        obj_url = f"{document.source}/{item_id}"
+        schemas_checked.update(extract_schemas(obj))
+        result = _create_fast_result(
+            obj,
+            obj_url,
+            fast_validation_errors(obj),
+            linter_class,
+            verbose,
+            fast_linting,
+            config,
+            geometry,
+        )
+        result["original_object"] = obj
         results_by_url[obj_url] = result
 
     # Calculate total validation time
     total_time = (time.time() - start_time) * 1000
 
-    return list(results_by_url.values()), total_time, schemas_checked
+    return list(results_by_url.values()), total_time, sorted(schemas_checked)
@@ -0,0 +1,607 @@
+"""Vectorized geometry checks backed by NumPy.
+
+NumPy is an optional dependency. When it is not installed, or when the coordinates of a
+geometry cannot be represented as one numeric array, the flatten functions return None
+and Linter falls back to its pure Python checks. Both engines return the same results.
+"""
+
+import itertools
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when numpy is not installed
+    np = None
+
+
+@dataclass
+class FlatCoordinates:
+    """The positions of a geometry flattened into one contiguous array.
+
+    Args:
+        array (numpy.ndarray): A float64 array of shape (N, 2) holding the longitude and
+            latitude of every position, in the order the positions appear in the geometry.
+        sequences (List[List]): The original lists of positions the array was built from.
+        offsets (numpy.ndarray): The index in `array` of the first position of each sequence.
+    """
+
+    array: Any
+    sequences: List[List]
+    offsets: Any
+
+    def position(self, index: int) -> List:
+        """Returns the original position at an index of the array.
+
+        Values are read from the original position so they are reported exactly as
+        they appear in the geometry (e.g. integers are not turned into floats).
+
+        Args:
+            index (int): The index of the position in `array`.
+
+        Returns:
+            List: The original position.
+        """
+        sequence = int(np.searchsorted(self.offsets, index, side="right")) - 1
+        return self.sequences[sequence][index - int(self.offsets[sequence])]
+
+    def select(self, sequences: List[List]) -> Optional["FlatCoordinates"]:
+        """Returns the positions of some of the flattened sequences, without copying them again.
+
+        Args:
+            sequences (List[List]): Sequences of positions that were flattened, e.g. the
+                exterior rings of a polygon.
+
+        Returns:
+            Optional[FlatCoordinates]: The positions of the sequences, or None if a
+                sequence was not part of the flattened coordinates.
+        """
+        indices = {id(sequence): i for i, sequence in enumerate(self.sequences)}
+        ends = np.append(self.offsets[1:], len(self.array))
+        arrays = []
+        kept = []
+        for sequence in sequences:
+            if isinstance(sequence, list) and not sequence:
+                continue
+            i = indices.get(id(sequence))
+            if i is None:
+                return None
+            arrays.append(self.array[self.offsets[i] : ends[i]])
+            kept.append(sequence)
+        return _concatenate(arrays, kept)
+
+
+def _sequence_array(sequence: Any) -> Optional[Any]:
+    """Converts a non empty list of positions into an array of longitudes and latitudes.
+
+    Args:
+        sequence (Any): A list of positions, e.g. a linear ring.
+
+    Returns:
+        Optional[numpy.ndarray]: A float64 array of shape (N, 2), or None if the sequence
+            is not a list of numeric positions of the same size.
+    """
+    if not isinstance(sequence, list):
+        return None
+    try:
+        # Every position must have the same number of values
+        sizes = set(map(len, sequence))
+        if len(sizes) != 1:
+            return None
+        size = sizes.pop()
+        if size < 2:
+            return None
+        # Only numbers are checked, fromiter would also parse numeric strings
+        if not set(map(type, itertools.chain.from_iterable(sequence))) <= {
+            int,
+            float,
+            bool,
+        }:
+            return None
+        # fromiter over the chained values avoids creating one array per position
+        values = np.fromiter(
+            itertools.chain.from_iterable(sequence),
+            dtype=np.float64,
+            count=len(sequence) * size,
+        )
+    except (ValueError, TypeError, OverflowError):
+        return None
+    array = values.reshape(-1, size)[:, :2]
+    if np.isnan(array).any():
+        return None
+    return array
+
+
+def _flatten_sequences(sequences: List[List]) -> Optional[FlatCoordinates]:
+    """Builds a FlatCoordinates from lists of positions.
+
+    Args:
+        sequences (List[List]): Lists of positions, e.g. the rings of a polygon.
+
+    Returns:
+        Optional[FlatCoordinates]: The flattened positions, or None if NumPy is not
+            installed or a sequence is not a list of numeric positions of the same size.
+    """
+    if np is None:
+        return None
+
+    arrays = []
+    kept = []
+    for sequence in sequences:
+        if isinstance(sequence, list) and not sequence:
+            continue
+        array = _sequence_array(sequence)
+        if array is None:
+            return None
+        arrays.append(array)
+        kept.append(sequence)
+
+    return _concatenate(arrays, kept)
+
+
+def _concatenate(arrays: List[Any], sequences: List[List]) -> FlatCoordinates:
+    """Concatenates the position arrays of sequences into a FlatCoordinates.
+
+    Args:
+        arrays (List[numpy.ndarray]): The (N, 2) arrays of positions of each sequence.
+        sequences (List[List]): The original sequences of positions.
+
+    Returns:
+        FlatCoordinates: The flattened positions.
+    """
+    if not arrays:
+        return FlatCoordinates(np.empty((0, 2)), [], np.zeros(0, dtype=np.int64))
+
+    lengths = [len(array) for array in arrays]
+    offsets = np.concatenate(([0], np.cumsum(lengths[:-1]))).astype(np.int64)
+    return FlatCoordinates(np.concatenate(arrays), sequences, offsets)
+
+
+def _collect_sequences(coordinates: Any, sequences: List[List]) -> None:
+    """Collects the lists of positions of a GeoJSON coordinates array of any depth.
+
+    Args:
+        coordinates (Any): The coordinates, or a nested part of them.
+        sequences (List[List]): The list the sequences of positions are appended to.
+    """
+    if not isinstance(coordinates, list) or not coordinates:
+        return
+    first = coordinates[0]
+    if isinstance(first, (int, float)):
+        # A single position, e.g. the coordinates of a Point
+        sequences.append([coordinates])
+    elif isinstance(first, list) and first and isinstance(first[0], (int, float)):
+        sequences.append(coordinates)
+    else:
+        for item in coordinates:
+            _collect_sequences(item, sequences)
+
+
+def flatten_coordinates(coordinates: Any) -> Optional[FlatCoordinates]:
+    """Flattens every position of a GeoJSON coordinates array into one array.
+
+    Args:
+        coordinates (Any): The "coordinates" member of a geometry.
+
+    Returns:
+        Optional[FlatCoordinates]: The flattened positions, or None if the coordinates
+            must be checked with the pure Python engine.
+    """
+    sequences: List[List] = []
+    _collect_sequences(coordinates, sequences)
+    return _flatten_sequences(sequences)
+
+
+def find_definite_errors(flat: FlatCoordinates) -> Union[bool, Tuple[bool, List]]:
+    """Finds coordinates outside of the valid longitude and latitude ranges.
+
+    Like the pure Python check, only the first invalid coordinate is reported.
+
+    Args:
+        flat (FlatCoordinates): The flattened positions of a geometry.
+
+    Returns:
+        Union[bool, Tuple[bool, List]]:
+            - If no errors: True
+            - If errors found: (False, list_of_invalid_coordinates)
+    """
+    lons = np.abs(flat.array[:, 0])
+    lats = np.abs(flat.array[:, 1])
+    invalid = (lats > 90) | (lons > 180)
+    if not invalid.any():
+        return True
+
+    position = flat.position(int(np.argmax(invalid)))
+    lon, lat = position[0], position[1]
+    reason = "latitude > ±90°" if abs(lat) > 90 else "longitude > ±180°"
+    return (False, [(lon, lat, reason)])
+
+
+def check_coordinates_order(flat: FlatCoordinates) -> bool:
+    """Checks if any position is likely in latitude, longitude order.
+
+    Args:
+        flat (FlatCoordinates): The flattened positions of a geometry.
+
+    Returns:
+        bool: True if coordinates appear to be in the correct order, False if they may be reversed.
+    """
+    lons = np.abs(flat.array[:, 0])
+    lats = np.abs(flat.array[:, 1])
+    reversed_order = (lons > 90) & (lats < 90) & (lons > lats * 2)
+    return not bool(reversed_order.any())
+
+
+def calculate_bbox(flat: FlatCoordinates) -> Optional[List[float]]:
+    """Calculates the bounding box of the flattened positions.
+
+    Args:
+        flat (FlatCoordinates): The flattened positions of a geometry.
+
+    Returns:
+        Optional[List[float]]: [min lon, min lat, max lon, max lat], or None if there are
+            no positions.
+    """
+    if not len(flat.array):
+        return None
+
+    lons = flat.array[:, 0]
+    lats = flat.array[:, 1]
+    return [
+        flat.position(int(np.argmin(lons)))[0],
+        flat.position(int(np.argmin(lats)))[1],
+        flat.position(int(np.argmax(lons)))[0],
+        flat.position(int(np.argmax(lats)))[1],
+    ]
+
+
+@dataclass
+class GeometrySummary:
+    """Everything the geometry rules need, collected in a single pass over the coordinates.
+
+    Args:
+        invalid_coordinate (Optional[Tuple[Any, Any, str]]): The first coordinate outside
+            of the valid longitude and latitude ranges, as (lon, lat, reason).
+        reversed_order (bool): Whether any coordinate is likely in latitude, longitude order.
+        bbox (Optional[List[float]]): The bounding box of the exterior rings of a Polygon
+            or MultiPolygon, or None for other geometry types or without positions.
+    """
+
+    invalid_coordinate: Optional[Tuple[Any, Any, str]] = None
+    reversed_order: bool = False
+    bbox: Optional[List[float]] = None
+
+
+def exterior_rings(geometry: Dict) -> List[List]:
+    """Returns the exterior rings of a Polygon or MultiPolygon geometry.
+
+    Args:
+        geometry (Dict): A GeoJSON geometry.
+
+    Returns:
+        List[List]: The exterior rings, or an empty list for other geometry types.
+    """
+    rings = []
+    if geometry.get("type") == "Polygon":
+        # For Polygon, use the exterior ring (first element)
+        if len(geometry.get("coordinates", [])) > 0:
+            rings.append(geometry.get("coordinates")[0])
+    elif geometry.get("type") == "MultiPolygon":
+        # For MultiPolygon, collect the exterior rings of all polygons
+        for polygon in geometry.get("coordinates", []):
+            if len(polygon) > 0:
+                rings.append(polygon[0])
+    return rings
+
+
+def _summarize_flat(
+    flat: FlatCoordinates, rings: List[List]
+) -> Optional[GeometrySummary]:
+    """Summarizes a geometry with vectorized operations on its flattened positions.
+
+    Args:
+        flat (FlatCoordinates): The flattened positions of the geometry.
+        rings (List[List]): The exterior rings used for the bounding box.
+
+    Returns:
+        Optional[GeometrySummary]: The summary, or None if the exterior rings were not
+            part of the flattened positions.
+    """
+    exterior = flat.select(rings)
+    if exterior is None:
+        return None
+
+    definite_errors = find_definite_errors(flat)
+    return GeometrySummary(
+        invalid_coordinate=(None if definite_errors is True else definite_errors[1][0]),
+        reversed_order=not check_coordinates_order(flat),
+        bbox=calculate_bbox(exterior),
+    )
+
+
+def _summarize_positions(
+    coordinates: Any, rings: List[List]
+) -> Optional[GeometrySummary]:
+    """Summarizes a geometry by visiting each of its positions once.
+
+    Args:
+        coordinates (Any): The "coordinates" member of the geometry.
+        rings (List[List]): The exterior rings used for the bounding box.
+
+    Returns:
+        Optional[GeometrySummary]: The summary, or None if a position is not a list of
+            at least two numbers.
+    """
+    sequences: List[List] = []
+    _collect_sequences(coordinates, sequences)
+    exterior_ids = {id(ring) for ring in rings if isinstance(ring, list) and ring}
+    if not exterior_ids <= {id(sequence) for sequence in sequences}:
+        return None
+
+    summary = GeometrySummary()
+    bbox: Optional[List] = None
+    for sequence in sequences:
+        exterior = id(sequence) in exterior_ids
+        for position in sequence:
+            if not isinstance(position, list) or len(position) < 2:
+                return None
+            lon, lat = position[0], position[1]
+            if type(lon) not in (int, float, bool) or type(lat) not in (
+                int,
+                float,
+                bool,
+            ):
+                return None
+
+            abs_lon, abs_lat = abs(lon), abs(lat)
+            if summary.invalid_coordinate is None:
+                if abs_lat > 90:
+                    summary.invalid_coordinate = (lon, lat, "latitude > ±90°")
+                elif abs_lon > 180:
+                    summary.invalid_coordinate = (lon, lat, "longitude > ±180°")
+            if abs_lon > 90 and abs_lat < 90 and abs_lon > abs_lat * 2:
+                summary.reversed_order = True
+
+            if exterior:
+                # Keep the first of equal values, as min() and max() do
+                if bbox is None:
+                    bbox = [lon, lat, lon, lat]
+                else:
+                    if lon < bbox[0]:
+                        bbox[0] = lon
+                    if lat < bbox[1]:
+                        bbox[1] = lat
+                    if lon > bbox[2]:
+                        bbox[2] = lon
+                    if lat > bbox[3]:
+                        bbox[3] = lat
+
+    summary.bbox = bbox
+    return summary
+
+
+def summarize_geometry(
+    geometry: Dict, flat: Optional[FlatCoordinates] = None
+) -> Optional[GeometrySummary]:
+    """Collects what the geometry rules need in a single pass over a geometry.
+
+    The summary is computed with the NumPy engine when the flattened positions are
+    given, and by visiting each position once otherwise.
+
+    Args:
+        geometry (Dict): A GeoJSON geometry.
+        flat (Optional[FlatCoordinates]): The flattened positions of the geometry, if
+            NumPy is available.
+
+    Returns:
+        Optional[GeometrySummary]: The summary, or None if the coordinates are malformed
+            and each rule must check them on its own.
+    """
+    try:
+        rings = exterior_rings(geometry)
+    except TypeError:
+        return None
+    if flat is not None:
+        summary = _summarize_flat(flat, rings)
+        if summary is not None:
+            return summary
+    return _summarize_positions(geometry.get("coordinates", []), rings)
+
+
+def _pack_geometry(geometry: Dict) -> Optional[Tuple[List[Any], List[List], Set[int]]]:
+    """Converts the positions of a geometry into arrays for a batch.
+
+    Args:
+        geometry (Dict): A GeoJSON geometry.
+
+    Returns:
+        Optional[Tuple[List[numpy.ndarray], List[List], Set[int]]]: The array of each
+            sequence of positions, the sequences, and the ids of the exterior rings, or
+            None if the geometry must be summarized on its own.
+    """
+    try:
+        rings = exterior_rings(geometry)
+    except TypeError:
+        return None
+    sequences: List[List] = []
+    _collect_sequences(geometry.get("coordinates", []), sequences)
+    exterior_ids = {id(ring) for ring in rings if isinstance(ring, list) and ring}
+    if not exterior_ids <= {id(sequence) for sequence in sequences}:
+        return None
+
+    arrays = []
+    for sequence in sequences:
+        array = _sequence_array(sequence)
+        if array is None:
+            return None
+        arrays.append(array)
+    return arrays, sequences, exterior_ids
+
+
+def _first_index_per_owner(indices: Any, owners: Any) -> Dict[int, int]:
+    """Returns the first of some position indices for each geometry owning them.
+
+    Args:
+        indices (numpy.ndarray): Position indices, in ascending order.
+        owners (numpy.ndarray): The index of the geometry owning each position.
+
+    Returns:
+        Dict[int, int]: The first position index, keyed by geometry index.
+    """
+    groups, first = np.unique(owners[indices], return_index=True)
+    return dict(zip(groups.tolist(), indices[first].tolist()))
+
+
+def summarize_geometries(geometries: List[Any]) -> List[Optional[GeometrySummary]]:
+    """Summarizes the geometries of many items with one set of vectorized operations.
+
+    The positions of all geometries are packed into one columnar array (flat coordinates
+    plus offsets). The range, order and bbox inputs of every geometry are then computed
+    in one call over that array, and attributed back to their geometry. Without NumPy,
+    or for geometries that cannot be packed, each geometry is summarized on its own.
+
+    Args:
+        geometries (List[Any]): The geometries of the items, in order. Null geometries
+            are allowed.
+
+    Returns:
+        List[Optional[GeometrySummary]]: One summary per geometry, in the same order. None
+            for null geometries and for geometries with malformed coordinates.
+    """
+    summaries: List[Optional[GeometrySummary]] = [None] * len(geometries)
+    arrays: List[Any] = []
+    sequences: List[List] = []
+    owners: List[int] = []
+    exterior: List[bool] = []
+    for index, geometry in enumerate(geometries):
+        if not isinstance(geometry, dict):
+            continue
+        packed = _pack_geometry(geometry) if np is not None else None
+        if packed is None:
+            summaries[index] = summarize_geometry(geometry)
+            continue
+        summaries[index] = GeometrySummary()
+        geometry_arrays, geometry_sequences, exterior_ids = packed
+        arrays.extend(geometry_arrays)
+        sequences.extend(geometry_sequences)
+        owners.extend([index] * len(geometry_sequences))
+        exterior.extend(id(sequence) in exterior_ids for sequence in geometry_sequences)
+
+    if not arrays:
+        return summaries
+
+    flat = _concatenate(arrays, sequences)
+    lengths = [len(array) for array in arrays]
+    _summarize_packed(
+        summaries,
+        flat.array,
+        np.repeat(owners, lengths),
+        np.repeat(exterior, lengths),
+        flat.position,
+    )
+    return summaries
+
+
+def summarize_position_arrays(
+    geometries: List[Optional[List[Tuple[Any, bool]]]],
+) -> List[Optional[GeometrySummary]]:
+    """Summarizes geometries whose positions are already arrays, e.g. decoded from WKB.
+
+    This is the columnar entry point of `summarize_geometries`, for readers that never
+    build GeoJSON coordinates. It requires NumPy.
+
+    Args:
+        geometries (List[Optional[List[Tuple[numpy.ndarray, bool]]]]): For each geometry,
+            its non empty sequences of positions as (array, is_exterior_ring) pairs, where
+            each array is a float64 array of shape (N, 2) without NaN values. None for
+            null geometries.
+
+    Returns:
+        List[Optional[GeometrySummary]]: One summary per geometry, in the same order. None
+            for null geometries. Reported values are read from the arrays, as floats.
+    """
+    summaries: List[Optional[GeometrySummary]] = [None] * len(geometries)
+    arrays: List[Any] = []
+    owners: List[int] = []
+    exterior: List[bool] = []
+    for index, sequences in enumerate(geometries):
+        if sequences is None:
+            continue
+        summaries[index] = GeometrySummary()
+        for array, is_exterior in sequences:
+            arrays.append(array)
+            owners.append(index)
+            exterior.append(is_exterior)
+
+    if not arrays:
+        return summaries
+
+    lengths = [len(array) for array in arrays]
+    array = np.concatenate(arrays)
+    _summarize_packed(
+        summaries,
+        array,
+        np.repeat(owners, lengths),
+        np.repeat(exterior, lengths),
+        lambda index: array[index].tolist(),
+    )
+    return summaries
+
+
+def _summarize_packed(
+    summaries: List[Optional[GeometrySummary]],
+    array: Any,
+    owner: Any,
+    exterior: Any,
+    position: Callable[[int], List],
+) -> None:
+    """Fills in the summaries of many geometries from their positions packed in one array.
+
+    Args:
+        summaries (List[Optional[GeometrySummary]]): The summaries, one per geometry; the
+            summary of every geometry owning positions must already exist.
+        array (numpy.ndarray): The (N, 2) longitudes and latitudes of all positions.
+        owner (numpy.ndarray): The index of the geometry owning each position.
+        exterior (numpy.ndarray): Whether each position is part of an exterior ring.
+        position (Callable[[int], List]): Returns the reported values of a position.
+    """
+    lons = array[:, 0]
+    lats = array[:, 1]
+    abs_lons = np.abs(lons)
+    abs_lats = np.abs(lats)
+
+    # Coordinates outside of the valid ranges, only the first one of each geometry is kept
+    invalid = np.flatnonzero((abs_lats > 90) | (abs_lons > 180))
+    for index, position_index in _first_index_per_owner(invalid, owner).items():
+        lon, lat = position(position_index)[:2]
+        reason = "latitude > ±90°" if abs(lat) > 90 else "longitude > ±180°"
+        summaries[index].invalid_coordinate = (lon, lat, reason)
+
+    # Coordinates likely in latitude, longitude order
+    reversed_order = (abs_lons > 90) & (abs_lats < 90) & (abs_lons > abs_lats * 2)
+    for index in np.unique(owner[reversed_order]).tolist():
+        summaries[index].reversed_order = True
+
+    # Bounding box of the exterior rings, values are read from the original positions
+    exterior_positions = np.flatnonzero(exterior)
+    if exterior_positions.size:
+        exterior_owner = owner[exterior_positions]
+        starts = np.flatnonzero(
+            np.concatenate(([True], exterior_owner[1:] != exterior_owner[:-1]))
+        )
+        sizes = np.diff(np.append(starts, len(exterior_positions)))
+        for index in exterior_owner[starts].tolist():
+            summaries[index].bbox = [None] * 4
+        for slot, (values, reduce) in enumerate(
+            (
+                (lons, np.minimum),
+                (lats, np.minimum),
+                (lons, np.maximum),
+                (lats, np.maximum),
+            )
+        ):
+            column = values[exterior_positions]
+            extremes = np.repeat(reduce.reduceat(column, starts), sizes)
+            matches = exterior_positions[column == extremes]
+            for index, position_index in _first_index_per_owner(matches, owner).items():
+                summaries[index].bbox[slot] = position(position_index)[slot % 2]
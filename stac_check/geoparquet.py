@@ -0,0 +1,470 @@
+"""Reading of stac-geoparquet files so their items can be linted without converting them to JSON.
+
+Files are read in Arrow record batches. The values of each batch are converted
+to Python once per column, and each row is turned back into an Item only when it
+is reached. Geometries are stored as WKB: with batch geometry checks, the
+positions of a whole batch are decoded straight into arrays and checked with
+`summarize_position_arrays`, without building GeoJSON coordinates for them.
+Reading stac-geoparquet requires the optional pyarrow package.
+"""
+
+import datetime
+import struct
+from decimal import Decimal
+from typing import Any, Dict, Generator, Iterator, List, Optional, Tuple, Union
+
+from stac_check import json_backend
+from stac_check.geometry import (
+    GeometrySummary,
+    np,
+    summarize_geometry,
+    summarize_position_arrays,
+)
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - exercised when pyarrow is not installed
+    pq = None
+
+# Extensions of stac-geoparquet files
+GEOPARQUET_EXTENSIONS = (".parquet", ".geoparquet")
+
+# Columns holding the top-level fields of an Item, every other column is a property
+ITEM_COLUMNS = (
+    "type",
+    "stac_version",
+    "stac_extensions",
+    "id",
+    "geometry",
+    "bbox",
+    "links",
+    "assets",
+    "collection",
+)
+
+# Properties kept in an Item even when they are null
+NULLABLE_PROPERTIES = ("datetime",)
+
+# GeoJSON geometry types by WKB type code
+WKB_TYPES = {
+    1: "Point",
+    2: "LineString",
+    3: "Polygon",
+    4: "MultiPoint",
+    5: "MultiLineString",
+    6: "MultiPolygon",
+    7: "GeometryCollection",
+}
+
+
+def is_geoparquet(source: Any) -> bool:
+    """Whether a source is a stac-geoparquet file.
+
+    Args:
+        source (Any): The source given to a linter.
+
+    Returns:
+        bool: True for paths ending in .parquet or .geoparquet.
+    """
+    return isinstance(source, str) and source.lower().endswith(GEOPARQUET_EXTENSIONS)
+
+
+class _WkbReader:
+    """Decodes a WKB or EWKB geometry into a GeoJSON type and nested position blocks.
+
+    Each block of positions, e.g. a LineString or a ring, is a float64 array of shape
+    (N, 2) or (N, 3) when NumPy is installed, and a list of positions otherwise. M
+    values are dropped, as GeoJSON has no place for them.
+    """
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.pos = 0
+
+    def _uint32(self, byte_order: str) -> int:
+        (value,) = struct.unpack_from(f"{byte_order}I", self.data, self.pos)
+        self.pos += 4
+        return value
+
+    def _positions(self, count: int, dims: int, byte_order: str) -> Any:
+        size = count * dims
+        if np is not None:
+            values = np.frombuffer(
+                self.data, dtype=f"{byte_order}f8", count=size, offset=self.pos
+            ).reshape(count, dims)
+            block = values[:, :3] if dims > 2 else values
+            block = block.astype(np.float64)
+        else:
+            flat = struct.unpack_from(f"{byte_order}{size}d", self.data, self.pos)
+            block = [list(flat[i : i + min(dims, 3)]) for i in range(0, size, dims)]
+        self.pos += size * 8
+        return block
+
+    def read(self) -> Tuple[str, Any]:
+        """Decode the next geometry.
+
+        Returns:
+            Tuple[str, Any]: The GeoJSON type, and its position blocks nested as in
+                GeoJSON coordinates, or the list of (type, blocks) of the members of
+                a GeometryCollection.
+
+        Raises:
+            ValueError: If the data is not valid WKB.
+        """
+        try:
+            byte_order = "<" if self.data[self.pos] == 1 else ">"
+            self.pos += 1
+            code = self._uint32(byte_order)
+        except (IndexError, struct.error):
+            raise ValueError("Invalid WKB geometry")
+        # EWKB flags, then ISO type codes (1000 Z, 2000 M, 3000 ZM)
+        has_z = bool(code & 0x80000000)
+        has_m = bool(code & 0x40000000)
+        if code & 0x20000000:
+            self.pos += 4
+        dimensions, base = divmod(code & 0x0FFFFFFF, 1000)
+        has_z = has_z or dimensions in (1, 3)
+        has_m = has_m or dimensions in (2, 3)
+        dims = 2 + has_z + has_m
+        if base not in WKB_TYPES:
+            raise ValueError(f"Unsupported WKB geometry type {code}")
+        try:
+            if base == 1:
+                return WKB_TYPES[base], self._positions(1, dims, byte_order)
+            if base == 2:
+                count = self._uint32(byte_order)
+                return WKB_TYPES[base], self._positions(count, dims, byte_order)
+            if base == 3:
+                rings = self._uint32(byte_order)
+                return WKB_TYPES[base], [
+                    self._positions(self._uint32(byte_order), dims, byte_order)
+                    for _ in range(rings)
+                ]
+            members = [self.read() for _ in range(self._uint32(byte_order))]
+        except (struct.error, ValueError) as e:
+            raise ValueError(f"Invalid WKB geometry: {e}")
+        if base == 7:
+            return WKB_TYPES[base], members
+        return WKB_TYPES[base], [blocks for _, blocks in members]
+
+
+def _is_empty_point(block: Any) -> bool:
+    # Empty points are written as NaN coordinates
+    values = block[0] if len(block) else []
+    return all(value != value for value in values)
+
+
+def _to_coordinates(geometry_type: str, blocks: Any) -> Any:
+    if geometry_type == "Point":
+        return [] if _is_empty_point(blocks) else _tolist(blocks)[0]
+    if geometry_type == "MultiPoint":
+        return [_tolist(block)[0] for block in blocks if not _is_empty_point(block)]
+    if geometry_type in ("LineString",):
+        return _tolist(blocks)
+    if geometry_type in ("Polygon", "MultiLineString"):
+        return [_tolist(block) for block in blocks]
+    return [[_tolist(block) for block in polygon] for polygon in blocks]
+
+
+def _tolist(block: Any) -> List:
+    return block.tolist() if np is not None else block
+
+
+def _to_geojson(geometry_type: str, blocks: Any) -> Dict:
+    if geometry_type == "GeometryCollection":
+        return {
+            "type": geometry_type,
+            "geometries": [_to_geojson(*member) for member in blocks],
+        }
+    return {
+        "type": geometry_type,
+        "coordinates": _to_coordinates(geometry_type, blocks),
+    }
+
+
+def wkb_to_geojson(data: bytes) -> Dict:
+    """Decode a WKB or EWKB geometry into a GeoJSON geometry.
+
+    Args:
+        data (bytes): The WKB geometry.
+
+    Returns:
+        Dict: The GeoJSON geometry, with 2D or 3D positions.
+
+    Raises:
+        ValueError: If the data is not valid WKB.
+    """
+    return _to_geojson(*_WkbReader(data).read())
+
+
+def _pack_wkb(data: bytes) -> Optional[List[Tuple[Any, bool]]]:
+    """Decode the positions of a WKB geometry into the arrays of summarize_position_arrays.
+
+    Args:
+        data (bytes): The WKB geometry.
+
+    Returns:
+        Optional[List[Tuple[numpy.ndarray, bool]]]: The non empty (N, 2) arrays of
+            positions, each with whether it is an exterior ring, in GeoJSON order. None
+            if the geometry must be summarized from its GeoJSON, e.g. with NaN values.
+    """
+    geometry_type, blocks = _WkbReader(data).read()
+    sequences: List[Tuple[Any, bool]] = []
+    if geometry_type == "Point":
+        if not _is_empty_point(blocks):
+            sequences.append((blocks, False))
+    elif geometry_type == "MultiPoint":
+        points = [block for block in blocks if not _is_empty_point(block)]
+        if points:
+            # Like GeoJSON, the positions of a MultiPoint form a single sequence
+            sequences.append((np.concatenate(points), False))
+    elif geometry_type in ("LineString", "MultiLineString"):
+        lines = [blocks] if geometry_type == "LineString" else blocks
+        sequences.extend((line, False) for line in lines)
+    elif geometry_type in ("Polygon", "MultiPolygon"):
+        polygons = [blocks] if geometry_type == "Polygon" else blocks
+        for polygon in polygons:
+            sequences.extend((ring, index == 0) for index, ring in enumerate(polygon))
+    arrays = [(array[:, :2], exterior) for array, exterior in sequences if len(array)]
+    if any(np.isnan(array).any() for array, _ in arrays):
+        return None
+    return arrays
+
+
+def summarize_wkb_geometries(
+    geometries: List[Optional[bytes]],
+) -> List[Optional[GeometrySummary]]:
+    """Summarize the WKB geometries of a batch of items for the batch geometry checks.
+
+    With NumPy, positions are decoded straight into arrays and all geometries are
+    checked with one set of vectorized operations. Without NumPy, and for geometries
+    with NaN values, each geometry is summarized from its GeoJSON.
+
+    Args:
+        geometries (List[Optional[bytes]]): The WKB geometry of each item, None when null.
+
+    Returns:
+        List[Optional[GeometrySummary]]: One summary per geometry, as returned by
+            summarize_geometries for the GeoJSON geometries. None for null or invalid
+            geometries.
+    """
+    if np is None:
+        return [
+            _summarize_single(data) if data is not None else None for data in geometries
+        ]
+
+    packed: List[Optional[List[Tuple[Any, bool]]]] = []
+    single: Dict[int, Optional[GeometrySummary]] = {}
+    for index, data in enumerate(geometries):
+        sequences = None
+        if data is not None:
+            try:
+                sequences = _pack_wkb(data)
+            except ValueError:
+                pass
+            if sequences is None:
+                single[index] = _summarize_single(data)
+        packed.append(sequences)
+    summaries = summarize_position_arrays(packed)
+    for index, summary in single.items():
+        summaries[index] = summary
+    return summaries
+
+
+def _summarize_single(data: bytes) -> Optional[GeometrySummary]:
+    try:
+        return summarize_geometry(wkb_to_geojson(data))
+    except ValueError:
+        return None
+
+
+def _to_json(value: Any) -> Any:
+    """Convert an Arrow value to its JSON form, dropping the null members of structs.
+
+    The schema of a stac-geoparquet file is the union of the fields of all items, so
+    fields an item did not have are read back as nulls.
+
+    Args:
+        value (Any): A value converted to Python by pyarrow.
+
+    Returns:
+        Any: The JSON value.
+    """
+    if isinstance(value, dict):
+        return {
+            key: _to_json(member) for key, member in value.items() if member is not None
+        }
+    if isinstance(value, (list, tuple)):
+        return [_to_json(member) for member in value]
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+        return f"{value.isoformat()}Z"
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="replace")
+    return value
+
+
+def _to_bbox(value: Any) -> Any:
+    """Convert a bbox column value, a struct in stac-geoparquet 1.0, to a GeoJSON bbox.
+
+    Args:
+        value (Any): The bbox struct or list.
+
+    Returns:
+        Any: The bbox as a list of 4 or 6 numbers.
+    """
+    if not isinstance(value, dict):
+        return value
+    if value.get("zmin") is not None:
+        keys = ("xmin", "ymin", "zmin", "xmax", "ymax", "zmax")
+    else:
+        keys = ("xmin", "ymin", "xmax", "ymax")
+    return [value.get(key) for key in keys]
+
+
+def _row_to_item(row: Dict[str, Any], geometry: Any) -> Dict:
+    """Turn the values of a stac-geoparquet row back into an Item.
+
+    Args:
+        row (Dict[str, Any]): The values of the row, by column, without the geometry.
+        geometry (Any): The WKB geometry of the row, or None.
+
+    Returns:
+        Dict: The Item.
+    """
+    properties = {}
+    for key, value in row.items():
+        if key in ITEM_COLUMNS:
+            continue
+        if value is not None or key in NULLABLE_PROPERTIES:
+            properties[key] = _to_json(value)
+    if isinstance(geometry, bytes):
+        try:
+            geometry = wkb_to_geojson(geometry)
+        except ValueError as e:
+            # Left to the schema validation, which reports the invalid geometry
+            geometry = str(e)
+    elif isinstance(geometry, str):
+        geometry = json_backend.loads(geometry)
+
+    item: Dict[str, Any] = {"type": row.get("type") or "Feature"}
+    for key in ("stac_version", "stac_extensions", "id"):
+        if row.get(key) is not None:
+            item[key] = _to_json(row[key])
+    item["geometry"] = geometry
+    if row.get("bbox") is not None:
+        item["bbox"] = _to_bbox(row["bbox"])
+    item["properties"] = properties
+    for key in ("links", "assets", "collection"):
+        if row.get(key) is not None:
+            item[key] = _to_json(row[key])
+    return item
+
+
+def _require_pyarrow(source: str) -> None:
+    if pq is None:
+        raise ImportError(
+            f"Reading {source} requires the pyarrow package. "
+            "Install it with: pip install stac-check[geoparquet]"
+        )
+
+
+def _geometry_column(parquet_file: Any) -> str:
+    """Return the name of the primary geometry column from the GeoParquet metadata."""
+    metadata = parquet_file.schema_arrow.metadata or {}
+    try:
+        return json_backend.loads(metadata[b"geo"])["primary_column"]
+    except (KeyError, TypeError, ValueError):
+        return "geometry"
+
+
+def iter_geoparquet_batches(
+    source: str, batch_size: int
+) -> Iterator[Tuple[Iterator[Dict], List[Any]]]:
+    """Read a stac-geoparquet file one record batch at a time.
+
+    Args:
+        source (str): The path of the file.
+        batch_size (int): The maximum number of rows in a batch.
+
+    Yields:
+        Tuple[Iterator[Dict], List[Any]]: An iterator building the Item of each row of
+            the batch as it is consumed, and the undecoded geometries of the batch.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    _require_pyarrow(source)
+    parquet_file = pq.ParquetFile(source)
+    geometry_column = _geometry_column(parquet_file)
+    for batch in parquet_file.iter_batches(batch_size=batch_size):
+        columns = {
+            name: batch.column(index).to_pylist()
+            for index, name in enumerate(batch.schema.names)
+        }
+        geometries = columns.pop(geometry_column, [None] * batch.num_rows)
+        yield _batch_items(columns, geometries, batch.num_rows), geometries
+
+
+def _batch_items(
+    columns: Dict[str, List[Any]], geometries: List[Any], num_rows: int
+) -> Iterator[Dict]:
+    for row in range(num_rows):
+        yield _row_to_item(
+            {name: values[row] for name, values in columns.items()}, geometries[row]
+        )
+
+
+def iter_geoparquet_items(source: str, batch_size: int = 1000) -> Iterator[Dict]:
+    """Yield the Items of a stac-geoparquet file one at a time.
+
+    Args:
+        source (str): The path of the file.
+        batch_size (int): The number of rows read at a time.
+
+    Yields:
+        Dict: Each Item, in file order.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    for items, _ in iter_geoparquet_batches(source, batch_size):
+        yield from items
+
+
+def iter_geoparquet_objects(
+    source: str, batch_size: int, summarize: bool = False
+) -> Generator[Union[Tuple[Dict, str], Tuple[Dict, str, Any]], None, None]:
+    """Yield the Items of a stac-geoparquet file with the URLs reported for them.
+
+    Args:
+        source (str): The path of the file.
+        batch_size (int): The number of rows read, and with `summarize` checked, at a time.
+        summarize (bool): Also yield the geometry summary of each Item, computed for a
+            whole batch from the WKB geometry column.
+
+    Yields:
+        Union[Tuple[Dict, str], Tuple[Dict, str, Optional[GeometrySummary]]]: Each Item,
+            its URL and, with `summarize`, its geometry summary, in file order.
+    """
+    index = 0
+    for items, geometries in iter_geoparquet_batches(source, batch_size):
+        summaries = (
+            summarize_wkb_geometries(
+                [data if isinstance(data, bytes) else None for data in geometries]
+            )
+            if summarize
+            else None
+        )
+        for position, item in enumerate(items):
+            obj_url = f"{source}/{item.get('id', f'unknown-{index}')}"
+            index += 1
+            if summaries is None:
+                yield item, obj_url
+            else:
+                yield item, obj_url, summaries[position]
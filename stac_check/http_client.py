@@ -0,0 +1,124 @@
+"""Shared HTTP session so remote fetches reuse pooled keep-alive connections."""
+
+import threading
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from stac_validator.utilities import is_valid_url
+
+from stac_check import json_backend
+from stac_check.compression import map_file
+
+# Number of per-host connection pools kept open
+DEFAULT_POOL_CONNECTIONS = 10
+# Number of connections kept open to a single host
+DEFAULT_POOL_MAXSIZE = 10
+# Timeout in seconds for requests made by stac-check, matching stac-validator
+DEFAULT_TIMEOUT = 10
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def create_session(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+) -> requests.Session:
+    """Create a requests session with pooled keep-alive connections.
+
+    Responses are decoded from gzip and deflate, and from br when the brotli
+    package is installed; requests advertises whichever encodings are available.
+
+    Args:
+        pool_connections (int): The number of hosts to keep a connection pool for.
+        pool_maxsize (int): The number of connections kept open per host.
+
+    Returns:
+        requests.Session: The new session.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """Return the session shared by every remote fetch in stac-check.
+
+    Returns:
+        requests.Session: The shared session, created on first use.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = create_session()
+        return _session
+
+
+def configure_session(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+) -> requests.Session:
+    """Replace the shared session with one using the given pool sizes.
+
+    Args:
+        pool_connections (int): The number of hosts to keep a connection pool for.
+        pool_maxsize (int): The number of connections kept open per host.
+
+    Returns:
+        requests.Session: The new shared session.
+    """
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = create_session(pool_connections, pool_maxsize)
+        return _session
+
+
+def fetch_json(
+    url: str, headers: Optional[Dict] = None, timeout: float = DEFAULT_TIMEOUT
+) -> Any:
+    """Fetch a URL with the shared session and decode its JSON body.
+
+    Args:
+        url (str): The URL to fetch.
+        headers (Optional[Dict]): HTTP headers to include in the request.
+        timeout (float): The request timeout in seconds.
+
+    Returns:
+        Any: The decoded JSON content.
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails or returns an error status.
+        JSONDecodeError: If the response is not valid JSON.
+    """
+    resp = get_session().get(url, headers=headers or {}, timeout=timeout)
+    resp.raise_for_status()
+    return json_backend.loads(resp.content)
+
+
+def fetch_and_parse_file(input_path: str, headers: Optional[Dict] = None) -> Any:
+    """Fetch and parse a JSON file from a URL or local file path.
+
+    A drop-in replacement for ``stac_validator.utilities.fetch_and_parse_file`` that
+    fetches URLs with the shared session.
+
+    Args:
+        input_path (str): The URL or local file path of the JSON file.
+        headers (Optional[Dict]): HTTP headers to include in URL requests.
+
+    Returns:
+        Any: The decoded JSON content.
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails or returns an error status.
+        JSONDecodeError: If the content is not valid JSON.
+        FileNotFoundError: If the local file cannot be found.
+    """
+    if is_valid_url(input_path):
+        return fetch_json(input_path, headers)
+    with map_file(input_path) as content:
+        return json_backend.loads(content)
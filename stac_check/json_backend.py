@@ -0,0 +1,167 @@
+"""Pluggable JSON decoding and encoding.
+
+Every document, NDJSON line, stored result and cached schema is decoded with the
+fastest backend installed: orjson, then simdjson (the pysimdjson package), then the
+standard library. `STAC_CHECK_JSON_BACKEND` or `set_backend` selects one explicitly.
+The standard library stays the reference: input a fast backend rejects, such as
+NaN literals, is decoded again with it, so every backend accepts the same documents
+and raises the same `json.JSONDecodeError` on invalid JSON. The exception is orjson,
+which decodes integers outside the 64-bit range (below -2**63 or above 2**64 - 1) as
+floats, losing precision, where simdjson and the standard library keep them exact.
+An unknown or missing backend in `STAC_CHECK_JSON_BACKEND` is ignored with a warning.
+"""
+
+import json
+import os
+import warnings
+from typing import IO, Any, Callable, List, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is not installed
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:  # pragma: no cover - exercised when pysimdjson is not installed
+    simdjson = None
+
+# Environment variable selecting the JSON backend
+JSON_BACKEND_ENV = "STAC_CHECK_JSON_BACKEND"
+
+# Backends in order of preference
+BACKENDS = ("orjson", "simdjson", "json")
+
+JsonInput = Union[str, bytes, bytearray, memoryview]
+
+_loads: Callable[[Any], Any] = json.loads
+_dumps: Optional[Callable[..., bytes]] = None
+# Whether the backend decodes buffers such as memory-mapped files without a copy
+_decodes_buffers = False
+
+backend = "json"
+
+
+def available_backends() -> List[str]:
+    """Return the JSON backends that can be used.
+
+    Returns:
+        List[str]: The names of the installed backends, in order of preference.
+    """
+    modules = {"orjson": orjson, "simdjson": simdjson, "json": json}
+    return [name for name in BACKENDS if modules[name] is not None]
+
+
+def set_backend(name: Optional[str] = None) -> str:
+    """Select the JSON backend used by stac-check.
+
+    Args:
+        name (Optional[str]): "orjson", "simdjson" or "json". None selects the value of
+            STAC_CHECK_JSON_BACKEND if set, otherwise the first installed backend.
+
+    Returns:
+        str: The name of the selected backend.
+
+    Raises:
+        ValueError: If the backend is unknown or not installed.
+    """
+    global backend, _loads, _dumps, _decodes_buffers
+    name = name or os.environ.get(JSON_BACKEND_ENV) or available_backends()[0]
+    if name not in BACKENDS:
+        raise ValueError(
+            f"Unknown JSON backend {name!r}, expected one of {', '.join(BACKENDS)}"
+        )
+    if name not in available_backends():
+        raise ValueError(f"The {name} JSON backend is not installed")
+    backend = name
+    _decodes_buffers = name != "json"
+    if name == "orjson":
+        _loads = orjson.loads
+        _dumps = orjson.dumps
+    elif name == "simdjson":
+        # simdjson only decodes, encoding uses the standard library
+        _loads = simdjson.loads
+        _dumps = None
+    else:
+        _loads = json.loads
+        _dumps = None
+    return backend
+
+
+def loads(data: JsonInput) -> Any:
+    """Decode a JSON document.
+
+    Args:
+        data (JsonInput): The document, as text or UTF-8 bytes. orjson and simdjson
+            decode a memoryview, e.g. of a memory-mapped file, in place.
+
+    Returns:
+        Any: The decoded value.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON.
+    """
+    if isinstance(data, memoryview) and not _decodes_buffers:
+        data = data.tobytes()
+    try:
+        return _loads(data)
+    except (ValueError, RuntimeError):
+        # simdjson raises RuntimeError for integers beyond 64 bits
+        if _loads is json.loads:
+            raise
+    # Not valid for the fast backend, the standard library decides
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def load(fp: IO) -> Any:
+    """Decode the JSON document of a file object.
+
+    Args:
+        fp (IO): A text or binary file object. Binary files spare decoding the text.
+
+    Returns:
+        Any: The decoded value.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON.
+    """
+    return loads(fp.read())
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Encode a value as compact JSON.
+
+    Args:
+        obj (Any): The value to encode.
+        default (Optional[Callable[[Any], Any]]): Converts values that are not JSON
+            serializable, as in `json.dumps`.
+
+    Returns:
+        str: The JSON text.
+
+    Raises:
+        TypeError: If a value is not JSON serializable.
+    """
+    if _dumps is not None:
+        try:
+            return _dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS).decode(
+                "utf-8"
+            )
+        except TypeError:
+            # e.g. integers beyond 64 bits, which the standard library encodes
+            pass
+    return json.dumps(obj, default=default, separators=(",", ":"))
+
+
+def _set_default_backend() -> None:
+    """Select the backend at import, falling back to the first installed one with a warning."""
+    try:
+        set_backend()
+    except ValueError as e:
+        warnings.warn(f"Ignoring {JSON_BACKEND_ENV}: {e}", UserWarning)
+        set_backend(available_backends()[0])
+
+
+_set_default_backend()
@@ -1,25 +1,92 @@
+import copy
 import importlib.metadata
 import importlib.resources
-import json
 import os
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any, Dict, List, Optional, Tuple, Union
 
-import requests
 import yaml
 from dotenv import load_dotenv
-from stac_validator.utilities import is_valid_url
 from stac_validator.validate import StacValidate
 
+from .crawler import DEFAULT_CRAWL_WORKERS, crawl_catalog
+from .document import StacDocument, load_document
+from .fast_validator_wrapper import fast_validation_message
+from .geometry import (
+    FlatCoordinates,
+    GeometrySummary,
+    exterior_rings,
+    flatten_coordinates,
+    summarize_geometry,
+)
+from .result_store import ResultStore
+from .rules import run_rules
+from .schema_bundle import bundle_identity, use_schema_bundle
+
 load_dotenv()
 
+# Best practices keys that are displayed as geometry validation errors
+GEOMETRY_KEYS = [
+    "geometry_coordinates_order",
+    "geometry_coordinates_definite_errors",
+    "check_bbox_antimeridian",
+    "check_bbox_geometry_match",
+    "bbox_geometry_mismatch",
+]
+
+# Parsed YAML configuration files shared by every Linter in the process,
+# keyed by (absolute path, modification time) so edited files are re-read
+_CONFIG_CACHE: Dict[Tuple[str, float], Dict] = {}
+
+
+def load_config_file(path: str) -> Dict:
+    """Load a YAML configuration file, reusing the parsed result while the file is unchanged.
+
+    Args:
+        path (str): The path to the YAML configuration file.
+
+    Returns:
+        A copy of the parsed configuration, safe for the caller to modify.
+
+    Raises:
+        IOError: If the file cannot be read.
+        yaml.YAMLError: If any YAML syntax errors occur while parsing the file.
+    """
+    key = (os.path.abspath(path), os.path.getmtime(path))
+    if key not in _CONFIG_CACHE:
+        with open(path) as f:
+            _CONFIG_CACHE[key] = yaml.load(f, Loader=yaml.FullLoader)
+    return copy.deepcopy(_CONFIG_CACHE[key])
+
+
+class _LoadedStacValidate(StacValidate):
+    """A StacValidate for content already loaded from `source`, which is not fetched again.
+
+    Relative extension and custom schema paths still resolve against the directory of
+    `source`, as they do when StacValidate is given the file itself.
+    """
+
+    def __init__(self, source: str, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.source = source
+
+    def custom_validator(self) -> None:
+        # run() fetches stac_file when it is set, so it is only set for this call
+        self.stac_file = self.source
+        try:
+            super().custom_validator()
+        finally:
+            self.stac_file = None
+
 
 @dataclass
 class Linter:
     """A class for linting STAC JSON files and generating validation messages.
 
     Args:
-        item (Union[str, dict]): A URL, file name, or dictionary representing a STAC JSON file.
+        item (Union[str, dict, StacDocument]): A URL, file name, dictionary or already loaded StacDocument
+            representing a STAC JSON file.
         config_file (Optional[str], optional): A path to a YAML configuration file. Defaults to None.
         assets (bool, optional): A boolean value indicating whether to validate assets. Defaults to False.
         links (bool, optional): A boolean value indicating whether to validate links. Defaults to False.
@@ -30,8 +97,21 @@ class Linter:
         pydantic (bool, optional): A boolean value indicating whether to use pydantic validation. Defaults to False.
         verbose (bool, optional): A boolean value indicating whether to enable verbose output. Defaults to False.
         fast (bool, optional): A boolean value indicating whether to use fast validation mode (skips geometry checks for performance). Defaults to False.
+        config (Optional[dict], optional): An already parsed configuration, as returned by `parse_config`. When given,
+            `config_file` is ignored and no configuration file is read. Defaults to None.
+        workers (int, optional): The number of objects fetched and linted at the same time during recursive
+            validation. Defaults to DEFAULT_CRAWL_WORKERS.
+        precomputed_geometry (Optional[GeometrySummary], optional): A summary of the item's geometry computed
+            ahead of time, e.g. for a whole FeatureCollection with `summarize_geometries`. When given, the geometry
+            checks read from it, and geometry errors are reported even in fast mode. Defaults to None.
+        schema_bundle (Optional[str], optional): The path of a schema bundle built with `build_schema_bundle`.
+            When given, every remote schema is resolved from the bundle and never fetched. Defaults to None.
+        result_store (Optional[ResultStore], optional): A store of earlier results. When given, the validation
+            message of unchanged content is reused, and so are the results of unchanged objects visited during
+            recursive validation. New results are added to the store. Defaults to None.
 
     Attributes:
+        document (StacDocument): The loaded STAC document shared with the validator.
         data (dict): A dictionary representing the STAC JSON file.
         message (dict): A dictionary containing the validation message for the STAC JSON file.
         config (dict): A dictionary containing the configuration settings.
@@ -39,6 +119,8 @@ class Linter:
         version (str): A string representing the version of the STAC standard used in the STAC JSON file.
         validator_version (str): A string representing the version of the STAC validator used to validate the STAC JSON file.
         validate_all (dict): A dictionary containing the validation message for all STAC JSON files found recursively, if recursive validation was performed.
+        recursive_lint (dict): The best practices and geometry errors messages of every object visited during
+            recursive validation, keyed by path. Empty if recursive validation was not performed.
         valid_stac (bool): A boolean value indicating whether the STAC JSON file is valid.
         error_type (str): A string representing the type of error in the STAC JSON file, if one exists.
         error_msg (str): A string representing the error message in the STAC JSON file, if one exists.
@@ -49,9 +131,14 @@ class Linter:
         schema (List[str]): A list of the STAC JSON file's JSON schema files.
         object_id (str): A string representing the STAC JSON file's ID.
         file_name (str): A string representing the name of the file containing the STAC JSON data.
+        best_practices_dict (dict): The best practices violations for the STAC JSON file, computed once and shared
+            by `best_practices_msg` and `geometry_errors_msg`. Empty in fast mode without fast linting.
         best_practices_msg (str): A string representing best practices messages for the STAC JSON file.
         geometry_errors_msg (str): A string representing geometry-related error messages for the STAC JSON file.
 
+        Every attribute but `document`, `data` and `config` is computed when it is first read and then cached,
+        so only the validation, link and asset scans and checks whose results are used are run.
+
     Methods:
         parse_config(config_file: Optional[str] = None) -> Dict:
             Parses a YAML configuration file and returns a dictionary with the configuration settings.
@@ -59,13 +146,13 @@ class Linter:
         def get_asset_name(self, file: Union[str, Dict] = None) -> str:
             Returns the name of a file.
 
-        load_data(self, file: Union[str, Dict]) -> Dict:
+        load_data(self, file: Union[str, Dict, StacDocument]) -> Dict:
             Loads a STAC JSON file from a URL or file path and returns a dictionary representation.
 
-        validate_file(self, file: Union[str, dict]) -> Dict[str, Any]:
+        validate_file(self, file: Union[str, dict, StacDocument]) -> Dict[str, Any]:
             Validates a STAC JSON file and returns a dictionary with the validation message.
 
-        recursive_validation(self, file: Union[str, Dict[str, Any]]) -> str:
+        recursive_validation(self, file: Union[str, Dict[str, Any], StacDocument]) -> str:
             Validates a STAC JSON file recursively and returns a dictionary with the validation message.
 
         set_update_message(self) -> str:
@@ -132,7 +219,7 @@ class Linter:
             Creates a message with geometry-related error messages for the STAC JSON file.
     """
 
-    item: Union[str, Dict]
+    item: Union[str, Dict, StacDocument]
     config_file: Optional[str] = None
     assets: bool = False
     links: bool = False
@@ -144,6 +231,11 @@ class Linter:
     verbose: bool = False
     fast: bool = False
     fast_linting: bool = False
+    config: Optional[Dict] = None
+    workers: int = DEFAULT_CRAWL_WORKERS
+    precomputed_geometry: Optional[GeometrySummary] = None
+    schema_bundle: Optional[str] = None
+    result_store: Optional[ResultStore] = None
 
     def __post_init__(self):
         # Check if pydantic validation is requested but not installed
@@ -161,52 +253,160 @@ class Linter:
                 )
                 self.pydantic = False
 
-        self.data = self.load_data(self.item)
-        self.message = self.validate_file(self.item)
-        self.config = self.parse_config(self.config_file)
-
-        from .utilities import determine_asset_type
-
-        # Set message fields using the get_message_field method
-        self.asset_type = self.get_message_field("asset_type")
-
-        # If asset_type is not in message, determine it from the data
-        if self.asset_type == "" and isinstance(self.data, dict):
-            self.asset_type = determine_asset_type(self.data)
+        # Read and decode the input once; the same document is passed to the validator
+        self.document = load_document(self.item, self.headers)
+        if isinstance(self.item, StacDocument):
+            self.item = (
+                self.document.source
+                if self.document.source is not None
+                else self.document.data
+            )
+        self.data = self.document.data
+        if self.config is None:
+            self.config = self.parse_config(self.config_file)
+        if self.precomputed_geometry is not None:
+            self._geometry_summary = (
+                self.data.get("geometry"),
+                self.precomputed_geometry,
+            )
 
-        self.version = self.get_message_field("version")
-        self.valid_stac = self.get_message_field("valid_stac")
+    # The attributes below are computed when first read and then cached, so callers
+    # only pay for the validation, scans and checks whose results they use
 
-        self.validator_version = importlib.metadata.distribution("stac-valid").version
-        self.validate_all = self.recursive_validation(self.item)
+    @cached_property
+    def message(self) -> Dict[str, Any]:
+        """Dict[str, Any]: The validation message of the document."""
+        with use_schema_bundle(self.schema_bundle):
+            return self.validate_file(self.document)
 
-        # Set error and info fields
-        self.error_type = self.get_message_field("error_type")
-        self.error_msg = self.get_message_field("error_message")
-        self.failed_schema = self.get_message_field("failed_schema")
-        self.recommendation = self.get_message_field("recommendation")
-        self.verbose_error_msg = self.get_message_field("error_verbose")
-        self.invalid_asset_format = (
-            self.check_links_assets(10, "assets", "format") if self.assets else None
-        )
-        self.invalid_asset_request = (
-            self.check_links_assets(10, "assets", "request") if self.assets else None
-        )
-        self.invalid_link_format = (
-            self.check_links_assets(10, "links", "format") if self.links else None
-        )
-        self.invalid_link_request = (
-            self.check_links_assets(10, "links", "request") if self.links else None
-        )
-        self.schema = self.message["schema"] if "schema" in self.message else []
-        self.object_id = self.data["id"] if "id" in self.data else ""
-        self.file_name = self.get_asset_name(self.item)
-        self.best_practices_msg = self.create_best_practices_msg()
-        self.geometry_errors_msg = self.create_geometry_errors_msg()
+    @cached_property
+    def asset_type(self) -> str:
+        """str: The asset type, from the validation message or else from the data."""
+        from .utilities import determine_asset_type
 
-        # Extract timing information from FastValidator if available
-        self.fast_setup_time = self.get_message_field("fast_setup_time")
-        self.fast_exec_time = self.get_message_field("fast_exec_time")
+        asset_type = self.get_message_field("asset_type")
+        if asset_type == "" and isinstance(self.data, dict):
+            return determine_asset_type(self.data)
+        return asset_type
+
+    @cached_property
+    def version(self) -> str:
+        """str: The STAC version reported by the validator."""
+        return self.get_message_field("version")
+
+    @cached_property
+    def valid_stac(self) -> bool:
+        """bool: Whether the document is valid STAC."""
+        return self.get_message_field("valid_stac")
+
+    @cached_property
+    def validator_version(self) -> str:
+        """str: The installed stac-valid version."""
+        return importlib.metadata.distribution("stac-valid").version
+
+    @cached_property
+    def validate_all(self) -> Union[str, List[Dict[str, Any]]]:
+        """Union[str, List[Dict[str, Any]]]: The result of `recursive_validation`."""
+        with use_schema_bundle(self.schema_bundle):
+            return self.recursive_validation(self.document)
+
+    @cached_property
+    def recursive_lint(self) -> Dict[str, Dict[str, List[str]]]:
+        """Dict[str, Dict[str, List[str]]]: The messages of the recursively visited objects."""
+        # Set by recursive_validation, which runs when validate_all is first read
+        self.validate_all
+        return self.__dict__.get("recursive_lint", {})
+
+    @cached_property
+    def error_type(self) -> str:
+        """str: The type of the validation error, if any."""
+        return self.get_message_field("error_type")
+
+    @cached_property
+    def error_msg(self) -> str:
+        """str: The validation error message, if any."""
+        return self.get_message_field("error_message")
+
+    @cached_property
+    def failed_schema(self) -> str:
+        """str: The schema the document failed to validate against, if any."""
+        return self.get_message_field("failed_schema")
+
+    @cached_property
+    def recommendation(self) -> str:
+        """str: The recommendation of the validator, if any."""
+        return self.get_message_field("recommendation")
+
+    @cached_property
+    def verbose_error_msg(self) -> str:
+        """str: The verbose validation error message, if any."""
+        return self.get_message_field("error_verbose")
+
+    @cached_property
+    def invalid_asset_format(self) -> Optional[List[str]]:
+        """Optional[List[str]]: Assets with an invalid URL format, None if assets are not validated."""
+        return self.check_links_assets(10, "assets", "format") if self.assets else None
+
+    @cached_property
+    def invalid_asset_request(self) -> Optional[List[str]]:
+        """Optional[List[str]]: Assets that could not be requested, None if assets are not validated."""
+        return self.check_links_assets(10, "assets", "request") if self.assets else None
+
+    @cached_property
+    def invalid_link_format(self) -> Optional[List[str]]:
+        """Optional[List[str]]: Links with an invalid URL format, None if links are not validated."""
+        return self.check_links_assets(10, "links", "format") if self.links else None
+
+    @cached_property
+    def invalid_link_request(self) -> Optional[List[str]]:
+        """Optional[List[str]]: Links that could not be requested, None if links are not validated."""
+        return self.check_links_assets(10, "links", "request") if self.links else None
+
+    @cached_property
+    def schema(self) -> List[str]:
+        """List[str]: The schemas the document was validated against."""
+        return self.message["schema"] if "schema" in self.message else []
+
+    @cached_property
+    def object_id(self) -> str:
+        """str: The ID of the object."""
+        return self.data["id"] if "id" in self.data else ""
+
+    @cached_property
+    def file_name(self) -> str:
+        """str: The name of the file the object was read from."""
+        return self.get_asset_name(self.item)
+
+    @cached_property
+    def best_practices_dict(self) -> Dict[str, Any]:
+        """Dict[str, Any]: The best practices violations, only geometry ones in fast mode without fast linting."""
+        # Run the rule checks once, both message lists are derived from this result
+        if self.fast and not self.fast_linting:
+            # Geometries summarized in a batch are still checked
+            if self.precomputed_geometry is None:
+                return {}
+            return run_rules(self, keys=GEOMETRY_KEYS)
+        return self.create_best_practices_dict()
+
+    @cached_property
+    def best_practices_msg(self) -> List[str]:
+        """List[str]: The best practices messages."""
+        return self.create_best_practices_msg()
+
+    @cached_property
+    def geometry_errors_msg(self) -> List[str]:
+        """List[str]: The geometry errors messages."""
+        return self.create_geometry_errors_msg()
+
+    @cached_property
+    def fast_setup_time(self) -> str:
+        """str: The FastValidator setup time, if fast validation was used."""
+        return self.get_message_field("fast_setup_time")
+
+    @cached_property
+    def fast_exec_time(self) -> str:
+        """str: The FastValidator execution time, if fast validation was used."""
+        return self.get_message_field("fast_exec_time")
 
     @staticmethod
     def parse_config(config_file: Optional[str] = None) -> Dict:
@@ -221,6 +421,9 @@ class Linter:
         file located at that path and merges its contents with the default or
         environment-based configuration.
 
+        Parsed files are cached for the whole process by path and modification time,
+        so creating many Linters does not parse the same YAML again.
+
         Args:
             config_file (str): The path to the YAML configuration file.
 
@@ -234,20 +437,16 @@ class Linter:
         """
         default_config_file = os.getenv("STAC_CHECK_CONFIG")
         if default_config_file:
-            with open(default_config_file) as f:
-                default_config = yaml.load(f, Loader=yaml.FullLoader)
+            default_config = load_config_file(default_config_file)
         else:
             config_file_path = importlib.resources.files("stac_check").joinpath(
                 "stac-check.config.yml"
             )
             with importlib.resources.as_file(config_file_path) as path:
-                with open(path) as f:
-                    default_config = yaml.load(f, Loader=yaml.FullLoader)
+                default_config = load_config_file(str(path))
 
         if config_file:
-            with open(config_file) as f:
-                config = yaml.load(f, Loader=yaml.FullLoader)
-            default_config.update(config)
+            default_config.update(load_config_file(config_file))
 
         return default_config
 
@@ -269,11 +468,12 @@ class Linter:
         else:
             return file["id"]
 
-    def load_data(self, file: Union[str, Dict]) -> Dict:
+    def load_data(self, file: Union[str, Dict, StacDocument]) -> Dict:
         """Loads JSON data from a file or URL.
 
         Args:
-            file (Union[str, Dict]): A string representing the path to a JSON file or a dictionary containing the JSON data.
+            file (Union[str, Dict, StacDocument]): A string representing the path to a JSON file, a dictionary
+                containing the JSON data or an already loaded StacDocument.
 
         Returns:
             A dictionary containing the loaded JSON data.
@@ -285,24 +485,17 @@ class Linter:
             JSONDecodeError: If the JSON data cannot be decoded.
             FileNotFoundError: If the specified file cannot be found.
         """
+        return load_document(file, self.headers).data
 
-        if isinstance(file, str):
-            if is_valid_url(file):
-                resp = requests.get(file, headers=self.headers)
-                data = resp.json()
-            else:
-                with open(file) as json_file:
-                    data = json.load(json_file)
-            return data
-        else:
-            return file
-
-    def validate_file(self, file: Union[str, dict]) -> Dict[str, Any]:
+    def validate_file(self, file: Union[str, dict, StacDocument]) -> Dict[str, Any]:
         """Validates the given file path or STAC dictionary against the validation schema.
 
+        File paths and URLs are loaded once and the decoded content is handed to the validator,
+        so the validator never re-reads the source.
+
         Args:
-            file (Union[str, dict]): A string representing the file path to the STAC file or a dictionary representing the STAC
-                item.
+            file (Union[str, dict, StacDocument]): A string representing the file path to the STAC file, a dictionary
+                representing the STAC item or an already loaded StacDocument.
 
         Returns:
             A dictionary containing the results of the validation, including the status of the validation and any errors
@@ -311,78 +504,81 @@ class Linter:
         Raises:
             ValueError: If `file` is not a valid file path or STAC dictionary.
         """
-        # Use FastValidator for fast mode with file paths
-        if self.fast and isinstance(file, str):
-            try:
-                import io
-                import sys
-
-                from stac_validator.fast_validator import FastValidator
+        if not isinstance(file, (str, dict, StacDocument)):
+            raise ValueError("Input must be a file path or STAC dictionary.")
 
-                # Suppress FastValidator output
-                old_stdout = sys.stdout
-                sys.stdout = io.StringIO()
+        document = load_document(file, self.headers)
+        if document.error is not None:
+            return self.create_fetch_error_message(document)
+
+        if self.result_store is None:
+            return self._validate_document(document)
+
+        # Unchanged content validated with the same options keeps its message
+        key = self.result_store.key(
+            "message",
+            document.data,
+            document.source,
+            {
+                "links": self.links,
+                "assets": self.assets,
+                "assets_open_urls": self.assets_open_urls,
+                "pydantic": self.pydantic,
+                "verbose": self.verbose,
+                "fast": self.fast,
+                "schema_bundle": bundle_identity(self.schema_bundle),
+            },
+        )
+        message = self.result_store.get(key)
+        if message is None:
+            message = self._validate_document(document)
+            self.result_store.put(key, message)
+        return message
 
-                fast_validator = FastValidator(file, quiet=False, verbose=self.verbose)
-                fast_validator.run()
+    def _validate_document(self, document: StacDocument) -> Dict[str, Any]:
+        """Validate a loaded document, see `validate_file`.
 
-                # Restore stdout
-                sys.stdout = old_stdout
+        Args:
+            document (StacDocument): The loaded document.
 
-                # Use the message attribute directly from FastValidator if available
-                # FastValidator.message is a list with one dict containing all validation info
-                fv_msg = {}
-                if hasattr(fast_validator, "message"):
-                    if (
-                        isinstance(fast_validator.message, list)
-                        and len(fast_validator.message) > 0
-                    ):
-                        fv_msg = fast_validator.message[0]
-                    elif isinstance(fast_validator.message, dict):
-                        fv_msg = fast_validator.message
-
-                # Extract error message from the first error if any
-                error_message = ""
-                if not fast_validator.valid and "errors" in fv_msg:
-                    errors = fv_msg.get("errors", [])
-                    if errors and len(errors) > 0:
-                        error_message = errors[0].get("error_message", "")
-
-                # Convert FastValidator result to StacValidate message format
-                return {
-                    "valid_stac": fast_validator.valid,
-                    "asset_type": "",
-                    "version": "",
-                    "validation_method": "FastJSONSchema",
-                    "error_type": (
-                        "FastValidationError" if not fast_validator.valid else ""
-                    ),
-                    "error_message": error_message,
-                    "fast_setup_time": fv_msg.get("setup_time_ms", ""),
-                    "fast_exec_time": fv_msg.get("execution_time_ms", ""),
-                    "valid_objects": fv_msg.get("valid_objects", 0),
-                    "invalid_objects": fv_msg.get("invalid_objects", 0),
-                    "schemas_checked": fv_msg.get("schemas_checked", []),
-                    "errors": fv_msg.get("errors", []),
-                }
-            except ImportError:
-                pass
+        Returns:
+            The validation message.
+        """
+        # Validate the loaded content with stac-valid's fast validators in fast mode
+        if self.fast and document.source is not None:
+            fv_msg = fast_validation_message(document.data)
+            errors = fv_msg["errors"]
+            return {
+                "valid_stac": fv_msg["valid_stac"],
+                "asset_type": "",
+                "version": "",
+                "validation_method": "FastJSONSchema",
+                "error_type": "FastValidationError" if not fv_msg["valid_stac"] else "",
+                "error_message": errors[0]["error_message"] if errors else "",
+                "fast_setup_time": fv_msg["setup_time_ms"],
+                "fast_exec_time": fv_msg["execution_time_ms"],
+                "valid_objects": fv_msg["valid_objects"],
+                "invalid_objects": fv_msg["invalid_objects"],
+                "schemas_checked": fv_msg["schemas_checked"],
+                "errors": errors,
+            }
 
         # In fast mode with dict, skip validation (already done by FastValidator)
         # and only run linting checks
-        if self.fast and isinstance(file, dict):
+        if self.fast and document.source is None:
             return {
                 "valid_stac": True,
                 "asset_type": "",
-                "version": file.get("stac_version", ""),
+                "version": document.data.get("stac_version", ""),
                 "validation_method": "FastJSONSchema",
                 "error_type": "",
                 "error_message": "",
             }
 
-        if isinstance(file, str):
-            stac = StacValidate(
-                file,
+        if document.source is not None:
+            # The content is already loaded, so StacValidate does not fetch the source
+            stac = _LoadedStacValidate(
+                document.source,
                 links=self.links,
                 assets=self.assets,
                 assets_open_urls=self.assets_open_urls,
@@ -390,56 +586,90 @@ class Linter:
                 pydantic=self.pydantic,
                 verbose=self.verbose,
             )
-            stac.run()
-        elif isinstance(file, dict):
+            # Link validation rewrites relative hrefs in place, keep self.data untouched
+            content = copy.deepcopy(document.data) if self.links else document.data
+            stac.validate_dict(content)
+            stac.message[0]["path"] = document.source
+        else:
             stac = StacValidate(
                 assets_open_urls=self.assets_open_urls,
                 headers=self.headers,
                 pydantic=self.pydantic,
             )
-            stac.validate_dict(file)
-        else:
-            raise ValueError("Input must be a file path or STAC dictionary.")
+            stac.validate_dict(document.data)
 
         return stac.message[0]
 
-    def recursive_validation(self, file: Union[str, Dict[str, Any]]) -> str:
+    def recursive_validation(
+        self, file: Union[str, Dict[str, Any], StacDocument]
+    ) -> str:
         """Recursively validate a STAC item or catalog file and its child items.
 
+        Child and item links are crawled concurrently by `crawl_catalog`, up to `max_depth`, and every
+        visited object is checked against the best practices in the same pass. The best practices and
+        geometry errors messages are stored in `recursive_lint`.
+
         Args:
-            file (Union[str, Dict[str, Any]]): A string representing the file path to the STAC item or catalog, or a
-                dictionary representing the STAC item or catalog.
+            file (Union[str, Dict[str, Any], StacDocument]): A string representing the file path to the STAC item or
+                catalog, a dictionary representing the STAC item or catalog, or an already loaded StacDocument.
 
         Returns:
-            A string containing the validation message.
+            A list with the validation message of every visited object, or only of the invalid objects
+            if any object is invalid.
 
         Raises:
             TypeError: If the input `file` is not a string or a dictionary.
         """
         if self.recursive:
-            if isinstance(file, str):
-                stac = StacValidate(
-                    file,
-                    recursive=True,
-                    max_depth=self.max_depth,
-                    assets_open_urls=self.assets_open_urls,
-                    headers=self.headers,
-                    pydantic=self.pydantic,
-                )
-                stac.run()
-            else:
-                stac = StacValidate(
-                    recursive=True,
-                    max_depth=self.max_depth,
-                    assets_open_urls=self.assets_open_urls,
-                    headers=self.headers,
-                    pydantic=self.pydantic,
-                )
-                stac.validate_dict(file)
-            return stac.message
+            document = load_document(file, self.headers)
+            if document.error is not None:
+                return [self.create_fetch_error_message(document)]
+            # Every visited object is validated and linted in the same pass, the root
+            # keeps the message this Linter already computed
+            results = crawl_catalog(
+                document,
+                Linter,
+                max_depth=self.max_depth,
+                workers=self.workers,
+                headers=self.headers,
+                pydantic=self.pydantic,
+                verbose=self.verbose,
+                config=self.config,
+                result_store=self.result_store,
+                schema_bundle=self.schema_bundle,
+                root=self if file is self.document else None,
+            )
+            self.recursive_lint = {
+                result.path: {
+                    "best_practices": result.best_practices,
+                    "geometry_errors": result.geometry_errors,
+                }
+                for result in results
+            }
+            messages = [result.message for result in results]
+            # As with stac-validator, only the failures are reported when any object is invalid
+            if not all(msg.get("valid_stac") for msg in messages):
+                messages = [msg for msg in messages if not msg.get("valid_stac")]
+            return messages
         else:
             return "Recursive validation is disabled."
 
+    def create_fetch_error_message(self, document: StacDocument) -> Dict[str, Any]:
+        """Creates the validation message for a document whose request returned an HTTP error.
+
+        Args:
+            document (StacDocument): The loaded document carrying the request error.
+
+        Returns:
+            A dictionary in the same format StacValidate uses for errors raised while fetching a file.
+        """
+        stac = StacValidate(document.source, verbose=self.verbose)
+        return stac.create_err_msg(
+            err_type=type(document.error).__name__,
+            err_msg=str(document.error),
+            error_obj=document.error,
+        )
+
     def set_update_message(self) -> str:
         """Returns a message for users to update their STAC version.
 
@@ -599,27 +829,25 @@ class Linter:
         if geom_type not in ["Polygon", "MultiPolygon"]:
             return True
 
-        # Extract coordinates based on geometry type
-        coordinates = []
-        if geom_type == "Polygon":
-            # For Polygon, use the exterior ring (first element)
-            if len(geometry.get("coordinates", [])) > 0:
-                coordinates = geometry.get("coordinates")[0]
-        elif geom_type == "MultiPolygon":
-            # For MultiPolygon, collect all coordinates from all polygons
-            for polygon in geometry.get("coordinates", []):
-                if len(polygon) > 0:
-                    coordinates.extend(polygon[0])
-
-        # If no valid coordinates, skip check
-        if not coordinates:
-            return True
+        summary = self.geometry_summary()
+        if summary is not None:
+            calc_bbox = summary.bbox
+            # If no valid coordinates, skip check
+            if calc_bbox is None:
+                return True
+        else:
+            # The coordinates are malformed, check the exterior rings on their own
+            coordinates = [coord for ring in exterior_rings(geometry) for coord in ring]
 
-        # Calculate min/max from coordinates
-        lons = [coord[0] for coord in coordinates]
-        lats = [coord[1] for coord in coordinates]
+            # If no valid coordinates, skip check
+            if not coordinates:
+                return True
 
-        calc_bbox = [min(lons), min(lats), max(lons), max(lats)]
+            # Calculate min/max from coordinates
+            lons = [coord[0] for coord in coordinates]
+            lats = [coord[1] for coord in coordinates]
+
+            calc_bbox = [min(lons), min(lats), max(lons), max(lats)]
 
         # Allow for differences that would be invisible when rounded to 6 decimal places
         # 1e-6 would be exactly at the 6th decimal place, so use 5e-7 to be just under that threshold
@@ -731,6 +959,46 @@ class Linter:
         else:
             return True
 
+    def flatten_geometry(self) -> Optional[FlatCoordinates]:
+        """Flattens the coordinates of the item's geometry for the NumPy geometry engine.
+
+        The result is computed once and shared by the geometry checks.
+
+        Returns:
+            Optional[FlatCoordinates]: The flattened positions, or None if NumPy is not
+                installed, the geometry is null, or its coordinates must be checked with
+                the pure Python engine.
+        """
+        geometry = self.data.get("geometry")
+        if not isinstance(geometry, dict):
+            return None
+        coordinates = geometry.get("coordinates", [])
+        cached = getattr(self, "_flat_geometry", None)
+        if cached is None or cached[0] is not coordinates:
+            self._flat_geometry = (coordinates, flatten_coordinates(coordinates))
+        return self._flat_geometry[1]
+
+    def geometry_summary(self) -> Optional[GeometrySummary]:
+        """Collects what the geometry rules need in a single pass over the item's geometry.
+
+        The coordinate range, coordinate order and bbox checks all read from this summary,
+        which is computed once, with the NumPy engine when it is available.
+
+        Returns:
+            Optional[GeometrySummary]: The summary, or None if the geometry is null or its
+                coordinates are malformed and each check must walk them on its own.
+        """
+        geometry = self.data.get("geometry")
+        if not isinstance(geometry, dict):
+            return None
+        cached = getattr(self, "_geometry_summary", None)
+        if cached is None or cached[0] is not geometry:
+            self._geometry_summary = (
+                geometry,
+                summarize_geometry(geometry, self.flatten_geometry()),
+            )
+        return self._geometry_summary[1]
+
     def check_geometry_coordinates_definite_errors(
         self,
     ) -> Union[bool, Tuple[bool, List]]:
@@ -752,6 +1020,13 @@ class Linter:
         if "geometry" not in self.data or self.data.get("geometry") is None:
             return True
 
+        # Read the result from the single pass over the coordinates
+        summary = self.geometry_summary()
+        if summary is not None:
+            if summary.invalid_coordinate is None:
+                return True
+            return (False, [summary.invalid_coordinate])
+
         geometry = self.data.get("geometry")
         invalid_coords = []
 
@@ -809,6 +1084,11 @@ class Linter:
         if "geometry" not in self.data or self.data.get("geometry") is None:
             return True
 
+        # Read the result from the single pass over the coordinates
+        summary = self.geometry_summary()
+        if summary is not None:
+            return not summary.reversed_order
+
         geometry = self.data.get("geometry")
 
         # Function to check if a single coordinate pair is likely in the correct order
@@ -874,239 +1154,19 @@ class Linter:
 
     def create_best_practices_dict(self) -> Dict:
         """Creates a dictionary of best practices violations for the current STAC object. The violations are determined
-        by a set of configurable linting rules specified in the config file.
+        by the rules registered in `stac_check.rules`, of which only those enabled in the config file and applying to
+        the object's asset type are checked.
 
         Returns:
             A dictionary of best practices violations for the current STAC object. The keys in the dictionary correspond
             to the linting rules that were violated, and the values are lists of strings containing error messages and
             recommendations for how to fix the violations.
         """
-        best_practices_dict = {}
-        linting_config = self.config["linting"]
-        geometry_validation_config = self.config["geometry_validation"]
-        max_links = self.config["settings"]["max_links"]
-        max_properties = self.config["settings"]["max_properties"]
-
-        # best practices - item ids should only contain searchable identifiers
-        if (
-            self.check_searchable_identifiers() == False
-            and linting_config["searchable_identifiers"] == True
-        ):
-            msg_1 = f"Item name '{self.object_id}' should only contain Searchable identifiers"
-            msg_2 = "Identifiers should consist of only lowercase characters, numbers, '_', and '-'"
-            best_practices_dict["searchable_identifiers"] = [msg_1, msg_2]
-
-        # best practices - item ids should not contain ':' or '/' characters
-        if self.check_percent_encoded() and linting_config["percent_encoded"] == True:
-            msg_1 = f"Item name '{self.object_id}' should not contain ':' or '/'"
-            msg_2 = "https://github.com/radiantearth/stac-spec/blob/master/best-practices.md#item-ids"
-            best_practices_dict["percent_encoded"] = [msg_1, msg_2]
-
-        # best practices - item ids should match file names
-        if (
-            not self.check_item_id_file_name()
-            and linting_config["item_id_file_name"] == True
-        ):
-            msg_1 = f"Item file names should match their ids: '{self.file_name}' not equal to '{self.object_id}"
-            best_practices_dict["check_item_id"] = [msg_1]
-
-        # best practices - collection and catalog file names should be collection.json and catalog.json
-        if (
-            self.check_catalog_file_name() == False
-            and linting_config["catalog_id_file_name"] == True
-        ):
-            msg_1 = f"Object should be called '{self.asset_type.lower()}.json' not '{self.file_name}.json'"
-            best_practices_dict["check_catalog_id"] = [msg_1]
-
-        # best practices - collections should contain summaries
-        if (
-            self.asset_type == "COLLECTION"
-            and self.check_summaries() == False
-            and linting_config["check_summaries"] == True
-        ):
-            msg_1 = "A STAC collection should contain a summaries field"
-            msg_2 = "It is recommended to store information like eo:bands in summaries"
-            best_practices_dict["check_summaries"] = [msg_1, msg_2]
-
-        # best practices - datetime fields should not be set to null
-        if self.check_datetime_null() and linting_config["null_datetime"] == True:
-            msg_1 = "Please avoid setting the datetime field to null, many clients search on this field"
-            best_practices_dict["datetime_null"] = [msg_1]
-
-        # best practices - check unlocated items to make sure bbox field is not set
-        if self.check_unlocated() and linting_config["check_unlocated"] == True:
-            msg_1 = "Unlocated item. Please avoid setting the bbox field when geometry is set to null"
-            best_practices_dict["check_unlocated"] = [msg_1]
-
-        # best practices - recommend items have a geometry
-        if self.check_geometry_null() and linting_config["check_geometry"] == True:
-            msg_1 = "All items should have a geometry field. STAC is not meant for non-spatial data"
-            best_practices_dict["null_geometry"] = [msg_1]
-
-        # best practices - check if bbox matches geometry
-        bbox_check_result = self.check_bbox_matches_geometry()
-        bbox_mismatch = False
-
-        if isinstance(bbox_check_result, tuple):
-            bbox_mismatch = not bbox_check_result[0]
-        else:
-            bbox_mismatch = not bbox_check_result
-
-        if (
-            bbox_mismatch
-            and geometry_validation_config.get("check_bbox_geometry_match", True)
-            == True
-        ):
-            if isinstance(bbox_check_result, tuple):
-                # Unpack the result
-                _, calc_bbox, actual_bbox, differences = bbox_check_result
-
-                # Format the bbox values for display
-                calc_bbox_str = ", ".join([f"{v:.6f}" for v in calc_bbox])
-                actual_bbox_str = ", ".join([f"{v:.6f}" for v in actual_bbox])
-
-                # Create a more detailed message about which coordinates differ
-                coordinate_labels = [
-                    "min longitude",
-                    "min latitude",
-                    "max longitude",
-                    "max latitude",
-                ]
-                mismatch_details = []
-
-                # Use the same epsilon threshold as in check_bbox_matches_geometry
-                epsilon = 5e-7
-
-                for i, (diff, label) in enumerate(zip(differences, coordinate_labels)):
-                    if diff > epsilon:
-                        mismatch_details.append(
-                            f"{label}: calculated={calc_bbox[i]:.6f}, actual={actual_bbox[i]:.6f}, diff={diff:.7f}"
-                        )
-
-                msg_1 = "The bbox field does not match the bounds of the geometry. The bbox should be the minimum bounding rectangle of the geometry."
-                msg_2 = f"Calculated bbox from geometry: [{calc_bbox_str}]"
-                msg_3 = f"Actual bbox in metadata: [{actual_bbox_str}]"
-
-                messages = [msg_1, msg_2, msg_3]
-                if mismatch_details:
-                    messages.append("Mismatched coordinates:")
-                    messages.extend(mismatch_details)
-                else:
-                    # If we got here but there are no visible differences at 6 decimal places,
-                    # add a note explaining that the differences are too small to matter
-                    messages.append(
-                        "Note: The differences are too small to be visible at 6 decimal places and can be ignored."
-                    )
-
-                best_practices_dict["bbox_geometry_mismatch"] = messages
-            else:
-                msg_1 = "The bbox field does not match the bounds of the geometry. The bbox should be the minimum bounding rectangle of the geometry."
-                best_practices_dict["bbox_geometry_mismatch"] = [msg_1]
-
-        # check to see if there are too many links
-        if (
-            self.check_bloated_links(max_links=max_links)
-            and linting_config["bloated_links"] == True
-        ):
-            msg_1 = f"You have {len(self.data['links'])} links. Please consider using sub-collections or sub-catalogs"
-            best_practices_dict["bloated_links"] = [msg_1]
-
-        # best practices - check for bloated metadata in properties
-        if (
-            self.check_bloated_metadata(max_properties=max_properties)
-            and linting_config["bloated_metadata"] == True
-        ):
-            msg_1 = f"You have {len(self.data['properties'])} properties. Please consider using links to avoid bloated metadata"
-            best_practices_dict["bloated_metadata"] = [msg_1]
-
-        # best practices - ensure thumbnail is a small file size ["png", "jpeg", "jpg", "webp"]
-        if (
-            not self.check_thumbnail()
-            and self.asset_type == "ITEM"
-            and linting_config["check_thumbnail"] == True
-        ):
-            msg_1 = "A thumbnail should have a small file size ie. png, jpeg, jpg, webp"
-            best_practices_dict["check_thumbnail"] = [msg_1]
-
-        # best practices - ensure that links in catalogs and collections include a title field
-        if not self.check_links_title_field() and linting_config["links_title"] == True:
-            msg_1 = (
-                "Links in catalogs and collections should always have a 'title' field"
-            )
-            best_practices_dict["check_links_title"] = [msg_1]
-
-        # best practices - ensure that links in catalogs and collections include self link
-        if not self.check_links_self() and linting_config["links_self"] == True:
-            msg_1 = "A link to 'self' in links is strongly recommended"
-            best_practices_dict["check_links_self"] = [msg_1]
-
-        # best practices - ensure that geometry coordinates are in the correct order
-        if (
-            not self.check_geometry_coordinates_order()
-            and geometry_validation_config["geometry_coordinates_order"] == True
-        ):
-            msg_1 = "Geometry coordinates may be in the wrong order (required order: longitude, latitude)"
-            best_practices_dict["geometry_coordinates_order"] = [msg_1]
-
-        # best practices - check if geometry coordinates contain definite errors
-        definite_errors_result = self.check_geometry_coordinates_definite_errors()
-
-        # Check if we have a separate config entry for definite errors, otherwise use the same as order check
-        config_key = "geometry_coordinates_definite_errors"
-        if config_key not in geometry_validation_config:
-            config_key = "geometry_coordinates_order"
-
-        if (
-            isinstance(definite_errors_result, tuple)
-            and not definite_errors_result[0]
-            and geometry_validation_config[config_key]
-        ):
-            # We have definite errors with invalid coordinates
-            _, invalid_coords = definite_errors_result
-
-            # Base message
-            msg_1 = "Geometry coordinates contain invalid values that violate the GeoJSON specification (latitude must be between -90 and 90, longitude between -180 and 180)"
-
-            # Add details about invalid coordinates (limit to first 5 to avoid excessive output)
-            messages = [msg_1]
-            for i, (lon, lat, reason) in enumerate(invalid_coords[:5]):
-                messages.append(f"Invalid coordinate: [{lon}, {lat}] - {reason}")
-
-            if len(invalid_coords) > 5:
-                messages.append(
-                    f"...and {len(invalid_coords) - 5} more invalid coordinates"
-                )
-
-            best_practices_dict["geometry_coordinates_definite_errors"] = messages
-        elif definite_errors_result is False and geometry_validation_config[config_key]:
-            # Simple case (backward compatibility)
-            msg_1 = "Geometry coordinates contain invalid values that violate the GeoJSON specification (latitude must be between -90 and 90, longitude between -180 and 180)"
-            best_practices_dict["geometry_coordinates_definite_errors"] = [msg_1]
-
-        # Check if a bbox that crosses the antimeridian is correctly formatted
-        if not self.check_bbox_antimeridian() and geometry_validation_config.get(
-            "check_bbox_antimeridian", True
-        ):
-            # Get the bbox values to include in the error message
-            bbox = self.data.get("bbox", [])
-
-            if len(bbox) == 4:  # 2D bbox [west, south, east, north]
-                west, _, east, _ = bbox
-            elif (
-                len(bbox) == 6
-            ):  # 3D bbox [west, south, min_elev, east, north, max_elev]
-                west, _, _, east, _, _ = bbox
-
-            msg_1 = f"BBox crossing the antimeridian should have west longitude > east longitude (found west={west}, east={east})"
-            msg_2 = f"Current bbox format appears to be belting the globe instead of properly crossing the antimeridian. Bbox: {bbox}"
-
-            best_practices_dict["check_bbox_antimeridian"] = [msg_1, msg_2]
-
-        return best_practices_dict
+        return run_rules(self)
 
     def create_best_practices_msg(self) -> List[str]:
         """
-        Generates a list of best practices messages based on the results of the 'create_best_practices_dict' method.
+        Generates a list of best practices messages from the 'best_practices_dict' computed by 'create_best_practices_dict'.
 
         Returns:
             A list of strings, where each string contains a best practice message. Each message starts with the
@@ -1121,18 +1181,9 @@ class Linter:
         if self.fast and not self.fast_linting:
             return best_practices
 
-        best_practices_dict = self.create_best_practices_dict()
-
         # Filter out geometry-related errors as they will be displayed separately
-        geometry_keys = [
-            "geometry_coordinates_order",
-            "geometry_coordinates_definite_errors",
-            "check_bbox_antimeridian",
-            "check_bbox_geometry_match",
-            "bbox_geometry_mismatch",
-        ]
         filtered_dict = {
-            k: v for k, v in best_practices_dict.items() if k not in geometry_keys
+            k: v for k, v in self.best_practices_dict.items() if k not in GEOMETRY_KEYS
         }
 
         for _, v in filtered_dict.items():
@@ -1144,7 +1195,8 @@ class Linter:
 
     def create_geometry_errors_msg(self) -> List[str]:
         """
-        Generates a list of geometry-related error messages based on the results of the 'create_best_practices_dict' method.
+        Generates a list of geometry-related error messages from the 'best_practices_dict' computed by
+        'create_best_practices_dict'.
 
         This separates geometry coordinate validation errors from other best practices for clearer presentation.
 
@@ -1153,8 +1205,8 @@ class Linter:
             'Geometry Validation Errors [BETA]:' base string and is followed by specific details. Each message is indented
             with four spaces, and there is an empty string between each message for readability.
         """
-        # Skip geometry validation in fast mode
-        if self.fast:
+        # Skip geometry validation in fast mode, unless the geometry was already summarized in a batch
+        if self.fast and self.precomputed_geometry is None:
             return []
 
         # Check if geometry validation is enabled
@@ -1166,18 +1218,9 @@ class Linter:
         base_string = "Geometry Validation [BETA]: "
         geometry_errors.append(base_string)
 
-        best_practices_dict = self.create_best_practices_dict()
-
         # Extract only geometry-related errors
-        geometry_keys = [
-            "geometry_coordinates_order",
-            "geometry_coordinates_definite_errors",
-            "check_bbox_antimeridian",
-            "check_bbox_geometry_match",
-            "bbox_geometry_mismatch",
-        ]
         geometry_dict = {
-            k: v for k, v in best_practices_dict.items() if k in geometry_keys
+            k: v for k, v in self.best_practices_dict.items() if k in GEOMETRY_KEYS
         }
 
         if not geometry_dict:
@@ -0,0 +1,234 @@
+"""Local SQLite store of lint results for incremental runs.
+
+Results are keyed by a hash of the content of the linted object, together with the
+stac-valid and stac-check versions, a hash of the linting configuration, the flags
+the result depends on and the path of the object. A later run over unchanged
+objects reuses the stored results instead of validating and linting them again.
+"""
+
+import hashlib
+import importlib.metadata
+import json
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from stac_check import json_backend
+from stac_check.schema_cache import default_cache_dir
+
+# Name of the default database in the stac-check cache directory
+DEFAULT_RESULT_STORE = "results.sqlite"
+
+# Number of stored results written before the transaction is committed
+COMMIT_INTERVAL = 1000
+
+
+def default_result_store_path() -> str:
+    """Return the path of the default result store.
+
+    Returns:
+        str: `results.sqlite` in the stac-check cache directory.
+    """
+    return os.path.join(default_cache_dir(), DEFAULT_RESULT_STORE)
+
+
+def content_digest(data: Any) -> str:
+    """Hash decoded JSON content independently of its formatting and key order.
+
+    Args:
+        data (Any): The decoded JSON content.
+
+    Returns:
+        str: The hex SHA-256 of the canonical JSON encoding of `data`.
+    """
+    # Always the standard library, so keys do not depend on the installed JSON backend
+    encoded = json.dumps(
+        data, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def is_storable(result: Dict) -> bool:
+    """Whether a result only depends on its inputs and can be reused by later runs.
+
+    Failures to fetch or read something, such as a schema, are transient and are
+    checked again by the next run.
+
+    Args:
+        result (Dict): A validation message or lint result.
+
+    Returns:
+        bool: True for valid objects and objects that failed schema validation.
+    """
+    return result.get("valid_stac") is True or str(
+        result.get("error_type") or ""
+    ).endswith("ValidationError")
+
+
+class ResultStore:
+    """A SQLite database of lint results shared by incremental runs.
+
+    The store can be used from several threads. Writes are committed every
+    COMMIT_INTERVAL results and when the store is closed.
+
+    Args:
+        path (Optional[str]): The database file, defaults to default_result_store_path().
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or default_result_store_path()
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.validator_version = importlib.metadata.distribution("stac-valid").version
+        self.linter_version = importlib.metadata.distribution("stac-check").version
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._closed = False
+        self._config_digests: Dict[int, Tuple[Dict, str]] = {}
+        self._connection = sqlite3.connect(
+            self.path, timeout=30, check_same_thread=False
+        )
+        # Let other processes read while a run writes
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, result TEXT NOT NULL)"
+        )
+        self._connection.commit()
+
+    def __enter__(self) -> "ResultStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _config_digest(self, config: Optional[Dict]) -> str:
+        # Every object of a run shares one configuration, hash it once
+        if config is None:
+            return ""
+        cached = self._config_digests.get(id(config))
+        if cached is None or cached[0] is not config:
+            cached = (config, content_digest(config))
+            self._config_digests[id(config)] = cached
+        return cached[1]
+
+    def key(
+        self,
+        kind: str,
+        data: Any,
+        path: Optional[str],
+        flags: Dict[str, Any],
+        config: Optional[Dict] = None,
+    ) -> str:
+        """Build the key of a result.
+
+        Args:
+            kind (str): The kind of result, e.g. "message" for a validation message.
+            data (Any): The decoded content of the object.
+            path (Optional[str]): The file path or URL of the object.
+            flags (Dict[str, Any]): The options the result depends on.
+            config (Optional[Dict]): The linting configuration, when the result depends on it.
+
+        Returns:
+            str: The hex key.
+        """
+        material = [
+            kind,
+            content_digest(data),
+            self.validator_version,
+            self.linter_version,
+            self._config_digest(config),
+            sorted(flags.items()),
+            path,
+        ]
+        return hashlib.sha256(json.dumps(material).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return a stored result.
+
+        Args:
+            key (str): The key of the result.
+
+        Returns:
+            Optional[Dict]: The result, or None if it is not stored.
+        """
+        return self.get_many([key])[0]
+
+    def get_many(self, keys: List[str]) -> List[Optional[Dict]]:
+        """Return stored results.
+
+        Args:
+            keys (List[str]): The keys of the results.
+
+        Returns:
+            List[Optional[Dict]]: The result for each key, None when it is not stored.
+        """
+        found: Dict[str, Dict] = {}
+        # Stay below the default limit of SQLite variables per statement
+        for start in range(0, len(keys), 900):
+            batch = keys[start : start + 900]
+            with self._lock:
+                rows = self._connection.execute(
+                    f"SELECT key, result FROM results WHERE key IN ({','.join('?' * len(batch))})",
+                    batch,
+                ).fetchall()
+            found.update((key, json_backend.loads(result)) for key, result in rows)
+        results = [found.get(key) for key in keys]
+        with self._lock:
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return results
+
+    def put(self, key: str, result: Dict) -> None:
+        """Store a result, unless it is a transient failure.
+
+        Args:
+            key (str): The key of the result.
+            result (Dict): The result, which must be JSON serializable.
+        """
+        self.put_many([(key, result)])
+
+    def put_many(self, entries: Iterable[Any]) -> None:
+        """Store results, skipping transient failures.
+
+        Args:
+            entries (Iterable[Any]): The (key, result) pairs.
+        """
+        rows = [
+            (key, json_backend.dumps(result, default=str))
+            for key, result in entries
+            if is_storable(result)
+        ]
+        if not rows:
+            return
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO results (key, result) VALUES (?, ?)", rows
+            )
+            self._pending += len(rows)
+            if self._pending >= COMMIT_INTERVAL:
+                self._connection.commit()
+                self._pending = 0
+
+    def commit(self) -> None:
+        """Commit the results stored since the last commit."""
+        with self._lock:
+            self._connection.commit()
+            self._pending = 0
+
+    def clear(self) -> None:
+        """Remove every stored result."""
+        with self._lock:
+            self._connection.execute("DELETE FROM results")
+            self._connection.commit()
+            self._pending = 0
+
+    def close(self) -> None:
+        """Commit the stored results and close the database. Closing twice does nothing."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._connection.commit()
+            self._connection.close()
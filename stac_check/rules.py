@@ -0,0 +1,481 @@
+"""Registry of the best practices rules run by the Linter.
+
+Each rule declares the asset types it applies to, the configuration option that
+switches it on or off and the top-level fields it reads. Rules are checked in the
+order they were registered. `execution_plan` selects, once per configuration and
+asset type, the rules that are enabled and apply, so `Linter.create_best_practices_dict`
+never evaluates a rule that is switched off or irrelevant to the object.
+
+Custom rules are registered with the `register_rule` decorator:
+
+    @register_rule("missing_license", asset_types=["COLLECTION"])
+    def missing_license(linter):
+        if "license" not in linter.data:
+            return ["Collections should have a license field"]
+"""
+
+import functools
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from stac_check.lint import Linter
+
+RuleCheck = Callable[["Linter"], Optional[List[str]]]
+
+
+@dataclass(frozen=True)
+class Rule:
+    """A best practices rule.
+
+    Args:
+        key (str): The key of the rule's messages in the best practices dictionary.
+        check (RuleCheck): Returns the messages describing a violation for a Linter,
+            or None when the object follows the rule.
+        options (Tuple[str, ...]): The configuration options switching the rule on or
+            off, the first one present in the section is used.
+        section (str): The configuration section holding the options.
+        asset_types (Optional[FrozenSet[str]]): The asset types the rule applies to,
+            None for every asset type.
+        fields (Tuple[str, ...]): Top-level fields the object must have for the rule
+            to be checked.
+        default (bool): Whether the rule is enabled when none of its options is set.
+    """
+
+    key: str
+    check: RuleCheck
+    options: Tuple[str, ...]
+    section: str = "linting"
+    asset_types: Optional[FrozenSet[str]] = None
+    fields: Tuple[str, ...] = ()
+    default: bool = True
+
+    def enabled(self, config: Dict) -> bool:
+        """Whether the configuration enables the rule.
+
+        A section with `enabled: false`, like geometry_validation, disables all its rules.
+
+        Args:
+            config (Dict): The parsed configuration.
+
+        Returns:
+            bool: True if the rule is enabled.
+        """
+        section = config.get(self.section) or {}
+        if not section.get("enabled", True):
+            return False
+        for option in self.options:
+            if option in section:
+                return section[option] == True
+        return self.default
+
+    def applies_to(self, asset_type: str) -> bool:
+        """Whether the rule applies to an asset type.
+
+        Args:
+            asset_type (str): The asset type, e.g. "ITEM".
+
+        Returns:
+            bool: True if the rule applies.
+        """
+        return self.asset_types is None or asset_type in self.asset_types
+
+
+# Registered rules, in the order they are checked
+_RULES: List[Rule] = []
+
+
+def register_rule(
+    key: str,
+    option: Optional[str] = None,
+    section: str = "linting",
+    asset_types: Optional[Iterable[str]] = None,
+    fields: Iterable[str] = (),
+    default: bool = True,
+    options: Optional[Iterable[str]] = None,
+) -> Callable[[RuleCheck], RuleCheck]:
+    """Register a function as a best practices rule.
+
+    Registering a key again replaces the earlier rule, keeping its position.
+
+    Args:
+        key (str): The key of the rule's messages in the best practices dictionary.
+        option (Optional[str]): The configuration option switching the rule on or off.
+            Defaults to the key.
+        section (str): The configuration section holding the option.
+        asset_types (Optional[Iterable[str]]): The asset types the rule applies to.
+            Defaults to every asset type.
+        fields (Iterable[str]): Top-level fields the object must have for the rule to be
+            checked.
+        default (bool): Whether the rule is enabled when its option is not set.
+        options (Optional[Iterable[str]]): Several options, the first one present in
+            the section is used. Overrides `option`.
+
+    Returns:
+        Callable[[RuleCheck], RuleCheck]: A decorator registering the function, which
+            takes a Linter and returns the messages of a violation or None.
+    """
+
+    def decorator(check: RuleCheck) -> RuleCheck:
+        rule = Rule(
+            key=key,
+            check=check,
+            options=tuple(options) if options is not None else (option or key,),
+            section=section,
+            asset_types=frozenset(asset_types) if asset_types is not None else None,
+            fields=tuple(fields),
+            default=default,
+        )
+        for i, registered in enumerate(_RULES):
+            if registered.key == key:
+                _RULES[i] = rule
+                break
+        else:
+            _RULES.append(rule)
+        _compile_plan.cache_clear()
+        return check
+
+    return decorator
+
+
+def unregister_rule(key: str) -> None:
+    """Remove a registered rule.
+
+    Args:
+        key (str): The key of the rule.
+
+    Raises:
+        KeyError: If no rule is registered under the key.
+    """
+    for i, rule in enumerate(_RULES):
+        if rule.key == key:
+            del _RULES[i]
+            _compile_plan.cache_clear()
+            return
+    raise KeyError(key)
+
+
+def registered_rules() -> Tuple[Rule, ...]:
+    """Return the registered rules.
+
+    Returns:
+        Tuple[Rule, ...]: The rules, in the order they are checked.
+    """
+    return tuple(_RULES)
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_plan(asset_type: str, switches: Tuple[bool, ...]) -> Tuple[Rule, ...]:
+    """Select the enabled rules applying to an asset type, cached per set of switches."""
+    return tuple(
+        rule
+        for rule, enabled in zip(_RULES, switches)
+        if enabled and rule.applies_to(asset_type)
+    )
+
+
+def execution_plan(config: Dict, asset_type: str) -> Tuple[Rule, ...]:
+    """Return the rules to check for objects of an asset type.
+
+    Plans are compiled once per asset type and combination of enabled rules, and
+    shared by every Linter with an equivalent configuration.
+
+    Args:
+        config (Dict): The parsed configuration.
+        asset_type (str): The asset type, e.g. "ITEM", "COLLECTION" or "CATALOG".
+
+    Returns:
+        Tuple[Rule, ...]: The enabled rules applying to the asset type, in order.
+    """
+    switches = tuple(rule.enabled(config) for rule in _RULES)
+    return _compile_plan(asset_type, switches)
+
+
+def run_rules(
+    linter: "Linter", keys: Optional[Iterable[str]] = None
+) -> Dict[str, List[str]]:
+    """Check the rules of the execution plan against a Linter's object.
+
+    Args:
+        linter (Linter): The Linter of the object.
+        keys (Optional[Iterable[str]]): Only check the rules with these keys. Defaults
+            to every rule of the plan.
+
+    Returns:
+        Dict[str, List[str]]: The messages of each violated rule, by rule key.
+    """
+    selected = frozenset(keys) if keys is not None else None
+    violations = {}
+    data = linter.data
+    for rule in execution_plan(linter.config, linter.asset_type):
+        if selected is not None and rule.key not in selected:
+            continue
+        if any(name not in data for name in rule.fields):
+            continue
+        messages = rule.check(linter)
+        if messages:
+            violations[rule.key] = messages
+    return violations
+
+
+# Built-in rules, in the order their messages are reported
+
+
+@register_rule("searchable_identifiers", asset_types=["ITEM"])
+def searchable_identifiers(linter: "Linter") -> Optional[List[str]]:
+    """Item ids should only contain searchable identifiers."""
+    if linter.check_searchable_identifiers():
+        return None
+    return [
+        f"Item name '{linter.object_id}' should only contain Searchable identifiers",
+        "Identifiers should consist of only lowercase characters, numbers, '_', and '-'",
+    ]
+
+
+@register_rule("percent_encoded")
+def percent_encoded(linter: "Linter") -> Optional[List[str]]:
+    """Item ids should not contain ':' or '/' characters."""
+    if not linter.check_percent_encoded():
+        return None
+    return [
+        f"Item name '{linter.object_id}' should not contain ':' or '/'",
+        "https://github.com/radiantearth/stac-spec/blob/master/best-practices.md#item-ids",
+    ]
+
+
+@register_rule("check_item_id", option="item_id_file_name", asset_types=["ITEM"])
+def check_item_id(linter: "Linter") -> Optional[List[str]]:
+    """Item ids should match file names."""
+    if linter.check_item_id_file_name():
+        return None
+    return [
+        f"Item file names should match their ids: '{linter.file_name}' not equal to '{linter.object_id}"
+    ]
+
+
+@register_rule(
+    "check_catalog_id",
+    option="catalog_id_file_name",
+    asset_types=["CATALOG", "COLLECTION"],
+)
+def check_catalog_id(linter: "Linter") -> Optional[List[str]]:
+    """Collection and catalog files should be named collection.json and catalog.json."""
+    if linter.check_catalog_file_name():
+        return None
+    return [
+        f"Object should be called '{linter.asset_type.lower()}.json' not '{linter.file_name}.json'"
+    ]
+
+
+@register_rule("check_summaries", asset_types=["COLLECTION"])
+def check_summaries(linter: "Linter") -> Optional[List[str]]:
+    """Collections should contain summaries."""
+    if linter.check_summaries():
+        return None
+    return [
+        "A STAC collection should contain a summaries field",
+        "It is recommended to store information like eo:bands in summaries",
+    ]
+
+
+@register_rule("datetime_null", option="null_datetime", fields=["properties"])
+def datetime_null(linter: "Linter") -> Optional[List[str]]:
+    """Datetime fields should not be set to null."""
+    if not linter.check_datetime_null():
+        return None
+    return [
+        "Please avoid setting the datetime field to null, many clients search on this field"
+    ]
+
+
+@register_rule("check_unlocated", fields=["geometry"])
+def check_unlocated(linter: "Linter") -> Optional[List[str]]:
+    """Unlocated items should not have a bbox."""
+    if not linter.check_unlocated():
+        return None
+    return [
+        "Unlocated item. Please avoid setting the bbox field when geometry is set to null"
+    ]
+
+
+@register_rule("null_geometry", option="check_geometry", fields=["geometry"])
+def null_geometry(linter: "Linter") -> Optional[List[str]]:
+    """Items should have a geometry."""
+    if not linter.check_geometry_null():
+        return None
+    return [
+        "All items should have a geometry field. STAC is not meant for non-spatial data"
+    ]
+
+
+@register_rule(
+    "bbox_geometry_mismatch",
+    option="check_bbox_geometry_match",
+    section="geometry_validation",
+    fields=["geometry", "bbox"],
+)
+def bbox_geometry_mismatch(linter: "Linter") -> Optional[List[str]]:
+    """The bbox should be the minimum bounding rectangle of the geometry."""
+    result = linter.check_bbox_matches_geometry()
+    msg_1 = "The bbox field does not match the bounds of the geometry. The bbox should be the minimum bounding rectangle of the geometry."
+    if not isinstance(result, tuple):
+        return None if result else [msg_1]
+    if result[0]:
+        return None
+
+    _, calc_bbox, actual_bbox, differences = result
+
+    # Format the bbox values for display
+    calc_bbox_str = ", ".join([f"{v:.6f}" for v in calc_bbox])
+    actual_bbox_str = ", ".join([f"{v:.6f}" for v in actual_bbox])
+
+    # Detail which coordinates differ
+    coordinate_labels = [
+        "min longitude",
+        "min latitude",
+        "max longitude",
+        "max latitude",
+    ]
+    mismatch_details = []
+
+    # Use the same epsilon threshold as in check_bbox_matches_geometry
+    epsilon = 5e-7
+
+    for i, (diff, label) in enumerate(zip(differences, coordinate_labels)):
+        if diff > epsilon:
+            mismatch_details.append(
+                f"{label}: calculated={calc_bbox[i]:.6f}, actual={actual_bbox[i]:.6f}, diff={diff:.7f}"
+            )
+
+    messages = [
+        msg_1,
+        f"Calculated bbox from geometry: [{calc_bbox_str}]",
+        f"Actual bbox in metadata: [{actual_bbox_str}]",
+    ]
+    if mismatch_details:
+        messages.append("Mismatched coordinates:")
+        messages.extend(mismatch_details)
+    else:
+        # The differences are not visible at 6 decimal places
+        messages.append(
+            "Note: The differences are too small to be visible at 6 decimal places and can be ignored."
+        )
+    return messages
+
+
+@register_rule("bloated_links", fields=["links"])
+def bloated_links(linter: "Linter") -> Optional[List[str]]:
+    """Objects should not have too many links."""
+    if not linter.check_bloated_links(max_links=linter.config["settings"]["max_links"]):
+        return None
+    return [
+        f"You have {len(linter.data['links'])} links. Please consider using sub-collections or sub-catalogs"
+    ]
+
+
+@register_rule("bloated_metadata", fields=["properties"])
+def bloated_metadata(linter: "Linter") -> Optional[List[str]]:
+    """Items should not have too many properties."""
+    if not linter.check_bloated_metadata(
+        max_properties=linter.config["settings"]["max_properties"]
+    ):
+        return None
+    return [
+        f"You have {len(linter.data['properties'])} properties. Please consider using links to avoid bloated metadata"
+    ]
+
+
+@register_rule("check_thumbnail", asset_types=["ITEM"], fields=["assets"])
+def check_thumbnail(linter: "Linter") -> Optional[List[str]]:
+    """Thumbnails should have a small file format ["png", "jpeg", "jpg", "webp"]."""
+    if linter.check_thumbnail():
+        return None
+    return ["A thumbnail should have a small file size ie. png, jpeg, jpg, webp"]
+
+
+@register_rule(
+    "check_links_title", option="links_title", asset_types=["COLLECTION", "CATALOG"]
+)
+def check_links_title(linter: "Linter") -> Optional[List[str]]:
+    """Links in catalogs and collections should include a title field."""
+    if linter.check_links_title_field():
+        return None
+    return ["Links in catalogs and collections should always have a 'title' field"]
+
+
+@register_rule("check_links_self", option="links_self")
+def check_links_self(linter: "Linter") -> Optional[List[str]]:
+    """Catalogs and collections should include a self link."""
+    if linter.check_links_self():
+        return None
+    return ["A link to 'self' in links is strongly recommended"]
+
+
+@register_rule(
+    "geometry_coordinates_order",
+    section="geometry_validation",
+    fields=["geometry"],
+)
+def geometry_coordinates_order(linter: "Linter") -> Optional[List[str]]:
+    """Geometry coordinates should be in longitude, latitude order."""
+    if linter.check_geometry_coordinates_order():
+        return None
+    return [
+        "Geometry coordinates may be in the wrong order (required order: longitude, latitude)"
+    ]
+
+
+@register_rule(
+    "geometry_coordinates_definite_errors",
+    section="geometry_validation",
+    # Without its own option, the check follows the coordinate order option
+    options=["geometry_coordinates_definite_errors", "geometry_coordinates_order"],
+    fields=["geometry"],
+)
+def geometry_coordinates_definite_errors(linter: "Linter") -> Optional[List[str]]:
+    """Geometry coordinates should be within the valid longitude and latitude ranges."""
+    result = linter.check_geometry_coordinates_definite_errors()
+    msg_1 = "Geometry coordinates contain invalid values that violate the GeoJSON specification (latitude must be between -90 and 90, longitude between -180 and 180)"
+    if result is False:
+        return [msg_1]
+    if not isinstance(result, tuple) or result[0]:
+        return None
+
+    _, invalid_coords = result
+
+    # Detail the first invalid coordinates, limited to avoid excessive output
+    messages = [msg_1]
+    for lon, lat, reason in invalid_coords[:5]:
+        messages.append(f"Invalid coordinate: [{lon}, {lat}] - {reason}")
+    if len(invalid_coords) > 5:
+        messages.append(f"...and {len(invalid_coords) - 5} more invalid coordinates")
+    return messages
+
+
+@register_rule(
+    "check_bbox_antimeridian", section="geometry_validation", fields=["bbox"]
+)
+def check_bbox_antimeridian(linter: "Linter") -> Optional[List[str]]:
+    """A bbox crossing the antimeridian should have west longitude > east longitude."""
+    if linter.check_bbox_antimeridian():
+        return None
+    bbox = linter.data.get("bbox", [])
+
+    if len(bbox) == 4:  # 2D bbox [west, south, east, north]
+        west, _, east, _ = bbox
+    elif len(bbox) == 6:  # 3D bbox [west, south, min_elev, east, north, max_elev]
+        west, _, _, east, _, _ = bbox
+
+    return [
+        f"BBox crossing the antimeridian should have west longitude > east longitude (found west={west}, east={east})",
+        f"Current bbox format appears to be belting the globe instead of properly crossing the antimeridian. Bbox: {bbox}",
+    ]
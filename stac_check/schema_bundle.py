@@ -0,0 +1,265 @@
+"""Offline schema bundles, so that validation never fetches a schema from the network.
+
+A bundle is a single file holding every schema needed to validate some STAC versions
+and extensions, with all the schemas they reference. It starts with an index of the
+position of each schema in the file, and is memory-mapped when loaded: opening a
+bundle only reads the index, and each schema is decoded from the mapping when it
+is first looked up.
+"""
+
+import contextlib
+import functools
+import mmap
+import os
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+from urllib.parse import urldefrag, urljoin
+
+from stac_validator import fast_validator, utilities
+
+from stac_check import json_backend
+from stac_check.schema_cache import base_schema_url, write_atomic
+
+# First bytes of every schema bundle, followed by the 8-byte length of the index
+BUNDLE_MAGIC = b"STACCHECK-SCHEMA-BUNDLE-1\n"
+
+_active: Optional["SchemaBundle"] = None
+
+
+class SchemaBundle:
+    """A memory-mapped schema bundle.
+
+    Args:
+        path (str): The path of the bundle file.
+
+    Raises:
+        ValueError: If the file is not a schema bundle.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            try:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise ValueError(f"{path} is not a schema bundle")
+        index_start = len(BUNDLE_MAGIC) + 8
+        if self._mmap[: len(BUNDLE_MAGIC)] != BUNDLE_MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a schema bundle")
+        index_length = int.from_bytes(
+            self._mmap[len(BUNDLE_MAGIC) : index_start], "big"
+        )
+        self._index: Dict[str, List[int]] = json_backend.loads(
+            self._mmap[index_start : index_start + index_length]
+        )
+        self._payload_start = index_start + index_length
+
+    def __contains__(self, url: str) -> bool:
+        return urldefrag(url)[0] in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @property
+    def urls(self) -> List[str]:
+        """List[str]: The URLs of the schemas in the bundle."""
+        return list(self._index)
+
+    def get(self, url: str) -> Dict:
+        """Return a schema of the bundle.
+
+        Args:
+            url (str): The schema URL. A fragment is ignored.
+
+        Returns:
+            Dict: The decoded schema.
+
+        Raises:
+            LookupError: If the schema is not in the bundle.
+        """
+        try:
+            offset, length = self._index[urldefrag(url)[0]]
+        except KeyError:
+            raise LookupError(f"Schema {url} is not in the schema bundle {self.path}")
+        start = self._payload_start + offset
+        return json_backend.loads(self._mmap[start : start + length])
+
+    def close(self) -> None:
+        """Unmap the bundle file."""
+        self._mmap.close()
+
+
+def bundle_identity(path: Optional[str]) -> Optional[List[Any]]:
+    """Identify the version of a schema bundle file that results were computed with.
+
+    Args:
+        path (Optional[str]): The path of the bundle file, or None.
+
+    Returns:
+        Optional[List[Any]]: The absolute path, modification time and size of the
+            bundle, which change when it is rebuilt, or None without a bundle.
+    """
+    if path is None:
+        return None
+    path = os.path.abspath(path)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return [path, None, None]
+    return [path, stat.st_mtime_ns, stat.st_size]
+
+
+def load_schema_bundle(path: str) -> SchemaBundle:
+    """Open a schema bundle once per process.
+
+    Args:
+        path (str): The path of the bundle file.
+
+    Returns:
+        SchemaBundle: The bundle, shared by every caller using the same file.
+    """
+    return _open_schema_bundle(os.path.abspath(path))
+
+
+@functools.lru_cache(maxsize=None)
+def _open_schema_bundle(path: str) -> SchemaBundle:
+    return SchemaBundle(path)
+
+
+def _iter_refs(node: Any) -> Iterator[str]:
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key == "$ref" and isinstance(value, str):
+                yield value
+            else:
+                yield from _iter_refs(value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from _iter_refs(value)
+
+
+def bundle_root_urls(
+    stac_versions: Iterable[str], extensions: Iterable[str] = ()
+) -> List[str]:
+    """Return the schema URLs validation starts from for some STAC versions and extensions.
+
+    Args:
+        stac_versions (Iterable[str]): The STAC versions, whose Item, Collection and
+            Catalog schemas are included.
+        extensions (Iterable[str]): The extension schema URLs.
+
+    Returns:
+        List[str]: The URLs used by the fast and the standard validators, without duplicates.
+    """
+    urls = []
+    for version in stac_versions:
+        for stac_type in ("item", "collection", "catalog"):
+            urls.append(base_schema_url(stac_type, version))
+            # Standard validation uses other locations for versions before 1.0.0
+            schema_addr = utilities.set_schema_addr(version, stac_type)
+            if utilities.is_url(schema_addr):
+                urls.append(schema_addr)
+    urls.extend(extensions)
+    return list(dict.fromkeys(urls))
+
+
+def build_schema_bundle(
+    path: str, urls: Iterable[str], fetch: Callable[[str], Dict]
+) -> List[str]:
+    """Write a schema bundle with some schemas and every schema they reference.
+
+    Args:
+        path (str): The path of the bundle file to write.
+        urls (Iterable[str]): The URLs of the schemas to include.
+        fetch (Callable[[str], Dict]): The function fetching a schema by URL.
+
+    Returns:
+        List[str]: The URLs of all the schemas in the bundle.
+
+    Raises:
+        Exception: If a schema cannot be fetched.
+    """
+    schemas: Dict[str, bytes] = {}
+    pending = deque(urldefrag(url)[0] for url in urls)
+    while pending:
+        url = pending.popleft()
+        if url in schemas:
+            continue
+        schema = fetch(url)
+        schemas[url] = json_backend.dumps(schema).encode("utf-8")
+        for ref in _iter_refs(schema):
+            ref_url = urldefrag(urljoin(url, ref))[0]
+            if utilities.is_url(ref_url) and ref_url not in schemas:
+                pending.append(ref_url)
+
+    index = {}
+    offset = 0
+    for url, content in schemas.items():
+        index[url] = [offset, len(content)]
+        offset += len(content)
+    index_bytes = json_backend.dumps(index).encode("utf-8")
+    write_atomic(
+        os.path.abspath(path),
+        BUNDLE_MAGIC
+        + len(index_bytes).to_bytes(8, "big")
+        + index_bytes
+        + b"".join(schemas.values()),
+    )
+    return list(schemas)
+
+
+@contextlib.contextmanager
+def schema_bundle_enabled(bundle: SchemaBundle) -> Iterator[SchemaBundle]:
+    """Resolve every remote schema from a bundle instead of the network.
+
+    Schemas missing from the bundle raise a LookupError, which the validators, in
+    standard and fast mode, report as a failed validation. Entering the bundle that is already active,
+    as nested Linters do, changes nothing.
+
+    Args:
+        bundle (SchemaBundle): The bundle to resolve schemas from.
+
+    Yields:
+        SchemaBundle: The active bundle.
+    """
+    global _active
+    if _active is bundle:
+        yield bundle
+        return
+
+    previous_active = _active
+    # stac-valid looks both fetch functions up on every call
+    previous_fetch = utilities._schema_cache
+    previous_fast_fetch = fast_validator.fetch_schema
+
+    @functools.lru_cache(maxsize=None)
+    def fetch(input_path: str) -> Dict:
+        if utilities.is_url(input_path):
+            return bundle.get(input_path)
+        return previous_fetch(input_path)
+
+    utilities._schema_cache = fetch
+    fast_validator.fetch_schema = bundle.get
+    _active = bundle
+    try:
+        yield bundle
+    finally:
+        utilities._schema_cache = previous_fetch
+        fast_validator.fetch_schema = previous_fast_fetch
+        _active = previous_active
+
+
+def use_schema_bundle(path: Optional[str]) -> contextlib.AbstractContextManager:
+    """Return a context resolving schemas from the bundle at `path`, if given.
+
+    Args:
+        path (Optional[str]): The path of the bundle file, or None.
+
+    Returns:
+        contextlib.AbstractContextManager: schema_bundle_enabled for the bundle, or a
+            context that does nothing when `path` is None.
+    """
+    if path is None:
+        return contextlib.nullcontext()
+    return schema_bundle_enabled(load_schema_bundle(path))
@@ -0,0 +1,404 @@
+"""Persistent on-disk cache of resolved JSON schemas and compiled validators.
+
+Schemas are stored by URL and fast validators as the Python code generated by
+fastjsonschema, under a directory named after the installed stac-valid version,
+so that every stac-check process reuses what an earlier run already fetched
+and compiled.
+"""
+
+import contextlib
+import functools
+import hashlib
+import importlib.metadata
+import json
+import os
+import shutil
+import stat
+import tempfile
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+import fastjsonschema  # type: ignore
+from stac_validator import fast_validator, utilities
+
+from stac_check import json_backend
+
+# Environment variable overriding the cache directory
+CACHE_DIR_ENV = "STAC_CHECK_CACHE_DIR"
+
+# STAC versions whose core validators are compiled by `stac-check cache warm`
+DEFAULT_WARM_VERSIONS = ("1.0.0", "1.1.0")
+
+# Object types with a core schema
+STAC_TYPES = ("Item", "Collection", "Catalog")
+
+# Errors raised when a schema cannot be fetched or its validator cannot be compiled
+COMPILE_ERRORS = (
+    OSError,
+    LookupError,
+    RuntimeError,
+    SyntaxError,
+    ValueError,
+    fastjsonschema.JsonSchemaException,
+)
+
+_active: Optional["SchemaCache"] = None
+
+
+def default_cache_dir() -> str:
+    """Return the directory of the schema cache.
+
+    Returns:
+        str: The value of STAC_CHECK_CACHE_DIR if set, otherwise `stac-check`
+            in the user cache directory (XDG_CACHE_HOME or ~/.cache).
+    """
+    if os.environ.get(CACHE_DIR_ENV):
+        return os.environ[CACHE_DIR_ENV]
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "stac-check")
+
+
+def base_schema_url(stac_type: str, stac_version: str) -> str:
+    """Return the URL of the core schema of a STAC object type.
+
+    Args:
+        stac_type (str): The object type, Item (or Feature), Collection or Catalog.
+        stac_version (str): The STAC version.
+
+    Returns:
+        str: The schema URL, as used by stac-valid's fast validator.
+
+    Raises:
+        ValueError: If the type has no core schema.
+    """
+    stac_type_lower = stac_type.lower()
+    if stac_type_lower == "feature":
+        stac_type_lower = "item"
+    if stac_type_lower not in ("item", "collection", "catalog"):
+        raise ValueError(f"Unknown STAC type for validation: {stac_type}")
+    return f"https://schemas.stacspec.org/v{stac_version}/{stac_type_lower}-spec/json-schema/{stac_type_lower}.json"
+
+
+def _hash_key(key: Any) -> str:
+    return hashlib.sha256(json.dumps(key).encode("utf-8")).hexdigest()
+
+
+def write_atomic(path: str, content: Union[str, bytes]) -> None:
+    """Write a file so that concurrent readers see either the previous or the complete new content.
+
+    Args:
+        path (str): The path of the file.
+        content (Union[str, bytes]): The content, text is encoded as UTF-8.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content.encode("utf-8") if isinstance(content, str) else content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+def is_private(path: Union[str, int]) -> bool:
+    """Check that a file or directory can only have been written by the current user.
+
+    Args:
+        path (Union[str, int]): The path, or a file descriptor opened on it.
+
+    Returns:
+        bool: Whether it is owned by the current user and not writable by group or
+            others. Always True where ownership is not available (Windows).
+    """
+    if not hasattr(os, "getuid"):
+        return True
+    st = os.stat(path)
+    return st.st_uid == os.getuid() and not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+@dataclass
+class SchemaCache:
+    """A directory of resolved schemas and compiled validators shared across processes.
+
+    Args:
+        cache_dir (Optional[str]): The cache directory, defaults to default_cache_dir().
+        validator_version (Optional[str]): The stac-valid version the entries are stored
+            for, defaults to the installed version. Entries of other versions are ignored.
+    """
+
+    cache_dir: Optional[str] = None
+    validator_version: Optional[str] = None
+    _validators: Dict[Tuple, Callable] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def __post_init__(self):
+        if self.cache_dir is None:
+            self.cache_dir = default_cache_dir()
+        if self.validator_version is None:
+            self.validator_version = importlib.metadata.distribution(
+                "stac-valid"
+            ).version
+        self.root = os.path.join(self.cache_dir, f"stac-valid-{self.validator_version}")
+
+    def schema_path(self, url: str) -> str:
+        """Return the file a schema is stored in.
+
+        Args:
+            url (str): The schema URL.
+
+        Returns:
+            str: The path of the cached schema.
+        """
+        return os.path.join(self.root, "schemas", f"{_hash_key(url)}.json")
+
+    def validator_path(
+        self, stac_type: str, stac_version: str, extensions: List[str]
+    ) -> str:
+        """Return the file the compiled validator of an object kind is stored in.
+
+        Args:
+            stac_type (str): The object type.
+            stac_version (str): The STAC version.
+            extensions (List[str]): The extension schema URLs.
+
+        Returns:
+            str: The path of the cached validator code.
+        """
+        key = [
+            stac_type.lower(),
+            stac_version,
+            sorted(extensions),
+            fastjsonschema.VERSION,
+        ]
+        return os.path.join(self.root, "validators", f"{_hash_key(key)}.py")
+
+    def get_schema(self, url: str) -> Optional[Dict]:
+        """Read a schema from the cache.
+
+        Args:
+            url (str): The schema URL.
+
+        Returns:
+            Optional[Dict]: The schema, or None if it is not cached or unreadable.
+        """
+        try:
+            with open(self.schema_path(url), "rb") as f:
+                return json_backend.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put_schema(self, url: str, schema: Dict) -> None:
+        """Store a schema in the cache. Write errors are ignored.
+
+        Args:
+            url (str): The schema URL.
+            schema (Dict): The schema content.
+        """
+        with contextlib.suppress(OSError, TypeError, ValueError):
+            write_atomic(self.schema_path(url), json_backend.dumps(schema))
+
+    def fetch_schema(self, url: str) -> Dict:
+        """Return a schema from the cache, fetching and storing it on a miss.
+
+        Used as the `$ref` handler when compiling fast validators.
+
+        Args:
+            url (str): The schema URL.
+
+        Returns:
+            Dict: The schema content.
+        """
+        schema = self.get_schema(url)
+        if schema is None:
+            schema = fast_validator.fetch_schema(url)
+            self.put_schema(url, schema)
+        return schema
+
+    def wrap_fetch(self, fetch: Callable[[str], Dict]) -> Callable[[str], Dict]:
+        """Put the cache in front of a schema fetch function.
+
+        Local paths are passed through, URLs are read from the cache and fetched
+        with `fetch` only on a miss.
+
+        Args:
+            fetch (Callable[[str], Dict]): The function fetching a schema by path or URL.
+
+        Returns:
+            Callable[[str], Dict]: The cached fetch function, memoized in memory.
+        """
+
+        @functools.lru_cache(maxsize=None)
+        def cached_fetch(input_path: str) -> Dict:
+            if not utilities.is_url(input_path):
+                return fetch(input_path)
+            schema = self.get_schema(input_path)
+            if schema is None:
+                schema = fetch(input_path)
+                self.put_schema(input_path, schema)
+            return schema
+
+        return cached_fetch
+
+    def load_validator(
+        self, stac_type: str, stac_version: str, extensions: List[str]
+    ) -> Tuple[Callable, bool]:
+        """Load a compiled validator from the cache, compiling and storing it on a miss.
+
+        Cached code is only run if it and its directory belong to the current user and
+        are not writable by anyone else, otherwise the validator is compiled again.
+
+        Args:
+            stac_type (str): The object type.
+            stac_version (str): The STAC version.
+            extensions (List[str]): The extension schema URLs.
+
+        Returns:
+            Tuple[Callable, bool]: The validator and whether it was read from the cache.
+
+        Raises:
+            COMPILE_ERRORS: If a schema cannot be fetched or the validator cannot be
+                compiled.
+        """
+        path = self.validator_path(stac_type, stac_version, extensions)
+        try:
+            with open(path, encoding="utf-8") as f:
+                if is_private(os.path.dirname(path)) and is_private(f.fileno()):
+                    return self._exec_validator(f.read(), path), True
+        except (OSError, LookupError, SyntaxError, ValueError):
+            # Missing, unreadable or corrupt entries are compiled again
+            pass
+
+        definition = {
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "allOf": [{"$ref": base_schema_url(stac_type, stac_version)}]
+            + [{"$ref": ext} for ext in extensions],
+        }
+        code = fastjsonschema.compile_to_code(
+            definition, handlers={"http": self.fetch_schema, "https": self.fetch_schema}
+        )
+        validator = self._exec_validator(code, path)
+        with contextlib.suppress(OSError):
+            # Only the current user may write the code that later runs execute
+            os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+            write_atomic(path, code)
+        return validator, False
+
+    @staticmethod
+    def _exec_validator(code: str, path: str) -> Callable:
+        namespace: Dict[str, Any] = {}
+        exec(compile(code, path, "exec"), namespace)
+        return namespace["validate"]
+
+    def get_validator(
+        self, stac_type: str, stac_version: str, extensions: List[str]
+    ) -> Tuple[Callable, bool]:
+        """Return the validator of an object kind, a drop-in for stac-valid's get_validator.
+
+        Validators that fastjsonschema cannot compile are left to stac-valid, which
+        falls back to python-jsonschema.
+
+        Args:
+            stac_type (str): The object type.
+            stac_version (str): The STAC version.
+            extensions (List[str]): The extension schema URLs.
+
+        Returns:
+            Tuple[Callable, bool]: The validator and whether it was already cached.
+        """
+        key = (stac_type, stac_version, tuple(sorted(extensions)))
+        if key in self._validators:
+            return self._validators[key], True
+        try:
+            validator, cached = self.load_validator(stac_type, stac_version, extensions)
+        except COMPILE_ERRORS:
+            return fast_validator.get_validator(stac_type, stac_version, extensions)
+        self._validators[key] = validator
+        return validator, cached
+
+    def clear(self) -> int:
+        """Remove every entry of every stac-valid version from the cache directory.
+
+        Returns:
+            int: The number of files removed.
+        """
+        if not os.path.isdir(self.cache_dir):
+            return 0
+        count = sum(len(files) for _, _, files in os.walk(self.cache_dir))
+        shutil.rmtree(self.cache_dir)
+        return count
+
+
+@contextlib.contextmanager
+def schema_cache_enabled(
+    cache: Optional[SchemaCache] = None,
+) -> Iterator[SchemaCache]:
+    """Route schema fetches and fast validator compilation through a SchemaCache.
+
+    While active, the schemas stac-valid fetches for standard validation and the
+    validators used in fast mode are read from and written to the cache.
+
+    Args:
+        cache (Optional[SchemaCache]): The cache to use, defaults to one in default_cache_dir().
+
+    Yields:
+        SchemaCache: The active cache.
+    """
+    global _active
+    cache = cache or SchemaCache()
+    previous_active = _active
+    # stac-valid looks this fetch function up on every call, see set_schema_cache_size
+    previous_fetch = utilities._schema_cache
+    utilities._schema_cache = cache.wrap_fetch(previous_fetch)
+    _active = cache
+    try:
+        yield cache
+    finally:
+        utilities._schema_cache = previous_fetch
+        _active = previous_active
+
+
+def active_cache_dir() -> Optional[str]:
+    """Return the directory of the active SchemaCache.
+
+    Returns:
+        Optional[str]: The cache directory, or None if no cache is enabled.
+    """
+    return _active.cache_dir if _active is not None else None
+
+
+def init_worker(cache_dir: Optional[str]) -> None:
+    """Enable the parent's schema cache in a worker process, for the life of the process.
+
+    Worker processes are spawned rather than forked, so they do not inherit the cache
+    enabled by schema_cache_enabled() in the parent. Used as a process pool initializer.
+
+    Args:
+        cache_dir (Optional[str]): The value of active_cache_dir() in the parent.
+    """
+    global _active
+    if cache_dir is not None:
+        _active = SchemaCache(cache_dir)
+        utilities._schema_cache = _active.wrap_fetch(utilities._schema_cache)
+
+
+def get_validator(
+    stac_type: str, stac_version: str, extensions: List[str]
+) -> Tuple[Callable, bool]:
+    """Return a fast validator from the active SchemaCache, or from stac-valid's in-memory cache.
+
+    Args:
+        stac_type (str): The object type.
+        stac_version (str): The STAC version.
+        extensions (List[str]): The extension schema URLs.
+
+    Returns:
+        Tuple[Callable, bool]: The validator and whether it was already cached.
+    """
+    if _active is not None:
+        return _active.get_validator(stac_type, stac_version, extensions)
+    return fast_validator.get_validator(stac_type, stac_version, extensions)
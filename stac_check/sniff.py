@@ -0,0 +1,321 @@
+"""Detection of item collections from a bounded prefix of a document.
+
+Whether a document is an item collection only depends on its top-level "type"
+and on whether its "features" array has a first element, which usually appear
+in the first bytes of the document. `sniff_document` reads the source in chunks
+and tokenizes top-level members until it can tell, or until a bounded prefix has
+been read. The bytes read so far are kept, and `load_document` continues from
+them, so detection costs no extra read or download.
+"""
+
+import contextlib
+import json
+import re
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, Optional, Union
+
+import requests
+from stac_validator.utilities import is_valid_url
+
+from stac_check.compression import compression_suffix, map_file, open_binary
+from stac_check.http_client import DEFAULT_TIMEOUT, get_session
+
+# Number of bytes read at a time
+DEFAULT_SNIFF_CHUNK_SIZE = 64 * 1024
+
+# Number of bytes read at most before giving up on detection
+DEFAULT_SNIFF_LIMIT = 1024 * 1024
+
+_WHITESPACE = b" \t\n\r"
+_BOM = b"\xef\xbb\xbf"
+
+# Bytes that open, close or delimit a JSON value, skipped to by _PrefixScanner.skip
+_STRUCTURE = re.compile(rb'["{}\[\]]')
+_QUOTE = re.compile(b'"')
+_SCALAR_END = re.compile(rb"[,}\]\s]")
+
+
+class _Undecided(Exception):
+    """Raised when the prefix ends, or is not JSON the scanner understands."""
+
+
+class _PrefixScanner:
+    """Tokenizes the top-level members of a JSON object from chunks of bytes.
+
+    Every chunk read is kept in `buffer`, so the bytes can be handed to a loader.
+    """
+
+    def __init__(self, chunks: Iterator[bytes], limit: int):
+        self.chunks = chunks
+        self.limit = limit
+        self.buffer = bytearray()
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Read the next chunk, unless the stream or the prefix limit has been reached."""
+        if self.eof or len(self.buffer) >= self.limit:
+            return False
+        chunk = next(self.chunks, b"")
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer += chunk
+        return True
+
+    def peek(self) -> int:
+        """Return the next non-whitespace byte without consuming it.
+
+        Raises:
+            _Undecided: If the prefix ends first.
+        """
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                raise _Undecided()
+
+    def expect(self, chars: bytes) -> int:
+        """Consume the next non-whitespace byte, which must be one of `chars`."""
+        char = self.peek()
+        if char not in chars:
+            raise _Undecided()
+        self.pos += 1
+        return char
+
+    def _find(self, pattern: "re.Pattern[bytes]", start: int) -> "re.Match[bytes]":
+        """Find the next match of a pattern at or after `start`, reading chunks as needed."""
+        while True:
+            match = pattern.search(self.buffer, start)
+            if match is not None:
+                return match
+            # Patterns match single bytes, so the bytes already searched can be skipped
+            start = max(len(self.buffer), start)
+            if not self.fill():
+                raise _Undecided()
+
+    def _string_end(self, start: int) -> int:
+        """Return the index after the closing quote of the string opening at `start`."""
+        end = start + 1
+        while True:
+            end = self._find(_QUOTE, end).start()
+            backslashes = 0
+            while self.buffer[end - 1 - backslashes] == ord("\\"):
+                backslashes += 1
+            end += 1
+            if backslashes % 2 == 0:
+                return end
+
+    def string(self) -> str:
+        """Decode and consume the next string."""
+        if self.peek() != ord('"'):
+            raise _Undecided()
+        end = self._string_end(self.pos)
+        try:
+            value = json.loads(bytes(self.buffer[self.pos : end]))
+        except ValueError:
+            raise _Undecided()
+        self.pos = end
+        return value
+
+    def skip(self) -> None:
+        """Consume the next value without decoding it."""
+        char = self.peek()
+        if char == ord('"'):
+            self.pos = self._string_end(self.pos)
+            return
+        if char not in b"{[":
+            self.pos = self._find(_SCALAR_END, self.pos).start()
+            return
+        depth = 0
+        pos = self.pos
+        while True:
+            match = self._find(_STRUCTURE, pos)
+            token = match.group()
+            if token == b'"':
+                pos = self._string_end(match.start())
+                continue
+            pos = match.end()
+            depth += 1 if token in (b"{", b"[") else -1
+            if depth == 0:
+                self.pos = pos
+                return
+
+
+def _scan(scanner: _PrefixScanner) -> Dict[str, Any]:
+    """Read top-level members until the item collection detection is decided.
+
+    Returns:
+        Dict[str, Any]: The top-level "type", if found, and under "features" whether
+            the "features" array has a first element, if found.
+
+    Raises:
+        _Undecided: If the prefix is not enough to decide.
+    """
+    found: Dict[str, Any] = {}
+    while len(scanner.buffer) < len(_BOM) and scanner.fill():
+        pass
+    if scanner.buffer.startswith(_BOM):
+        scanner.pos = len(_BOM)
+    scanner.expect(b"{")
+    if scanner.peek() == ord("}"):
+        return found
+    while True:
+        key = scanner.string()
+        scanner.expect(b":")
+        if key == "type" and scanner.peek() == ord('"'):
+            found["type"] = scanner.string()
+        elif key == "features":
+            if scanner.peek() != ord("["):
+                found["features"] = False
+                scanner.skip()
+            else:
+                start = scanner.pos
+                scanner.pos += 1
+                found["features"] = scanner.peek() != ord("]")
+                if "type" not in found:
+                    # The type follows the features, which must be skipped to reach it
+                    scanner.pos = start
+                    scanner.skip()
+        else:
+            scanner.skip()
+        if found.get("type", "FeatureCollection") != "FeatureCollection":
+            return found
+        if "type" in found and "features" in found:
+            return found
+        if scanner.expect(b",}") == ord("}"):
+            return found
+
+
+@dataclass
+class SniffedDocument:
+    """A document whose first bytes have been read to detect its kind.
+
+    Pass it to `load_document` to decode the whole document, continuing from the
+    bytes already read, or close it. Uncompressed local files are memory-mapped and
+    scanned in place.
+
+    Args:
+        source (str): The file path or URL of the document.
+        prefix (bytes): The bytes read so far.
+        chunks (Iterator[bytes]): The rest of the document, in chunks.
+        content (Optional[Union[bytes, memoryview]]): The whole document, when it is
+            memory-mapped. It is only valid until the document is closed.
+        type (Optional[str]): The top-level "type", None if not found in the prefix.
+        has_features (Optional[bool]): Whether the top-level "features" is an array
+            with a first element, None if not found in the prefix.
+        decided (bool): Whether the prefix was enough to tell if the document is an
+            item collection.
+        error (Optional[Exception]): An HTTP error returned while fetching the document.
+        closer (Optional[Callable[[], Any]]): Closes the file or response read from.
+    """
+
+    source: str
+    prefix: bytes
+    chunks: Iterator[bytes]
+    content: Optional[Union[bytes, memoryview]] = field(default=None, repr=False)
+    type: Optional[str] = None
+    has_features: Optional[bool] = None
+    decided: bool = False
+    error: Optional[Exception] = None
+    closer: Optional[Callable[[], Any]] = field(default=None, repr=False)
+
+    @property
+    def is_item_collection(self) -> Optional[bool]:
+        """Optional[bool]: Whether the document is a FeatureCollection with features,
+        None when the prefix was not enough to tell."""
+        if not self.decided:
+            return None
+        return self.type == "FeatureCollection" and bool(self.has_features)
+
+    def read(self) -> Union[bytes, memoryview]:
+        """Read the whole document, starting with the bytes already read.
+
+        Returns:
+            Union[bytes, memoryview]: The content of the document, valid until it is closed.
+        """
+        if self.content is not None:
+            return self.content
+        return b"".join([self.prefix, *self.chunks])
+
+    def close(self) -> None:
+        """Close the file or response the document is read from."""
+        closer, self.closer = self.closer, None
+        if closer is not None:
+            closer()
+
+    def __enter__(self) -> "SniffedDocument":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def sniff_document(
+    source: str,
+    headers: Optional[Dict] = None,
+    limit: int = DEFAULT_SNIFF_LIMIT,
+    chunk_size: int = DEFAULT_SNIFF_CHUNK_SIZE,
+) -> SniffedDocument:
+    """Open a document and read just enough of it to tell if it is an item collection.
+
+    Args:
+        source (str): A file path, compressed or not, or a URL.
+        headers (Optional[Dict]): HTTP headers to include in URL requests.
+        limit (int): The number of bytes after which detection gives up.
+        chunk_size (int): The number of bytes read at a time.
+
+    Returns:
+        SniffedDocument: The open document, with what was found in its prefix.
+
+    Raises:
+        requests.exceptions.RequestException: If there is an error making a request to a URL.
+        FileNotFoundError: If the specified file cannot be found.
+    """
+    error: Optional[Exception] = None
+    content: Optional[Union[bytes, memoryview]] = None
+    if is_valid_url(source):
+        resp = get_session().get(
+            source, headers=headers or {}, stream=True, timeout=DEFAULT_TIMEOUT
+        )
+        try:
+            resp.raise_for_status()
+        except requests.exceptions.HTTPError as e:
+            error = e
+        chunks = iter(resp.iter_content(chunk_size=chunk_size))
+        close = resp.close
+    elif compression_suffix(source):
+        f = open_binary(source)
+        chunks = iter(partial(f.read, chunk_size), b"")
+        close = f.close
+    else:
+        stack = contextlib.ExitStack()
+        content = stack.enter_context(map_file(source))
+        # Slices are copied, so no view of the mapping outlives it
+        chunks = (
+            bytes(content[start : start + chunk_size])
+            for start in range(0, len(content), chunk_size)
+        )
+        close = stack.close
+
+    scanner = _PrefixScanner(chunks, limit)
+    try:
+        found = _scan(scanner)
+        decided = True
+    except _Undecided:
+        found = {}
+        decided = False
+    return SniffedDocument(
+        source=source,
+        prefix=bytes(scanner.buffer),
+        chunks=chunks,
+        content=content,
+        type=found.get("type"),
+        has_features=found.get("features"),
+        decided=decided,
+        error=error,
+        closer=close,
+    )
@@ -0,0 +1,203 @@
+"""Incremental reading of FeatureCollections and NDJSON so item collections can be linted with bounded memory."""
+
+import json
+import sys
+from typing import IO, Any, Dict, Generator, Tuple
+
+from stac_check.compression import open_text, strip_compression_suffix
+
+# Characters skipped between JSON tokens
+_WHITESPACE = " \t\n\r"
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# Extensions of newline-delimited JSON files, holding one object per line
+NDJSON_EXTENSIONS = (".ndjson", ".jsonl")
+
+# Source name reading NDJSON from standard input
+STDIN = "-"
+
+_decoder = json.JSONDecoder()
+
+
+class _ChunkedReader:
+    """Decodes JSON values one at a time from a text stream read in chunks.
+
+    Only the unread part of the stream is kept in memory, so the buffer holds at
+    most one chunk plus the value currently being decoded.
+    """
+
+    def __init__(self, stream: IO[str], chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Read the next chunk, dropping everything that has already been consumed.
+
+        The read size grows with the pending data so a single very large value is
+        not re-decoded once per chunk.
+
+        Returns:
+            bool: False if the end of the stream was reached.
+        """
+        if self.eof:
+            return False
+        chunk = self.stream.read(max(self.chunk_size, len(self.buffer) - self.pos))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it, or "" at the end."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer) or not self.fill():
+                return self.buffer[self.pos] if self.pos < len(self.buffer) else ""
+
+    def expect(self, chars: str) -> str:
+        """Consume the next non-whitespace character, which must be one of `chars`.
+
+        Raises:
+            ValueError: If the next character is not one of `chars`.
+        """
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(
+                f"Expected one of {chars!r} but found {char!r} while streaming JSON"
+            )
+        self.pos += 1
+        return char
+
+    def decode(self) -> Any:
+        """Decode and consume the next complete JSON value.
+
+        Raises:
+            json.JSONDecodeError: If the value is malformed or the stream ends early.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # The value may continue in the next chunk
+                if self.fill():
+                    continue
+                raise
+            # A number at the end of the buffer may be cut short by the chunk boundary
+            if end == len(self.buffer) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_stream_features(
+    stream: IO[str], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Generator[Dict, None, None]:
+    """Yield the members of the top-level "features" array of a JSON object stream.
+
+    Other top-level members are decoded one at a time and discarded, so memory use
+    is bounded by the largest single feature rather than by the whole document.
+
+    Args:
+        stream (IO[str]): A text stream containing a GeoJSON FeatureCollection.
+        chunk_size (int): The number of characters read at a time.
+
+    Yields:
+        Dict: Each feature, in document order.
+
+    Raises:
+        ValueError: If the stream is not a JSON object.
+        json.JSONDecodeError: If the JSON is malformed.
+    """
+    reader = _ChunkedReader(stream, chunk_size)
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+    while True:
+        key = reader.decode()
+        reader.expect(":")
+        if key == "features" and reader.peek() == "[":
+            reader.expect("[")
+            if reader.peek() == "]":
+                reader.expect("]")
+            else:
+                while True:
+                    yield reader.decode()
+                    if reader.expect(",]") == "]":
+                        break
+        else:
+            reader.decode()
+        if reader.expect(",}") == "}":
+            return
+
+
+def iter_features(
+    source: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Generator[Dict, None, None]:
+    """Yield the features of a local FeatureCollection file one at a time.
+
+    Args:
+        source (str): The path to the FeatureCollection file.
+        chunk_size (int): The number of characters read at a time.
+
+    Yields:
+        Dict: Each feature, in document order.
+    """
+    with open_text(source) as f:
+        yield from iter_stream_features(f, chunk_size)
+
+
+def is_ndjson(source: Any) -> bool:
+    """Whether a source is a newline-delimited JSON file or standard input.
+
+    Args:
+        source (Any): The source given to a linter.
+
+    Returns:
+        bool: True for paths ending in .ndjson or .jsonl, compressed or not, and for "-"
+            (standard input).
+    """
+    return isinstance(source, str) and (
+        source == STDIN
+        or strip_compression_suffix(source).lower().endswith(NDJSON_EXTENSIONS)
+    )
+
+
+def iter_stream_lines(stream: IO[str]) -> Generator[Tuple[int, str], None, None]:
+    """Yield the non-blank lines of a newline-delimited JSON stream.
+
+    Args:
+        stream (IO[str]): A text stream with one JSON value per line.
+
+    Yields:
+        Tuple[int, str]: The line number, starting at 1, and the undecoded line.
+    """
+    for line_number, line in enumerate(stream, 1):
+        if line.strip():
+            yield line_number, line
+
+
+def iter_ndjson_lines(source: str) -> Generator[Tuple[int, str], None, None]:
+    """Yield the lines of a local NDJSON file, or of standard input, one at a time.
+
+    Lines are left undecoded so they can be parsed where they are linted, in parallel
+    when objects are linted in a process pool.
+
+    Args:
+        source (str): The path to the NDJSON file, or "-" for standard input.
+
+    Yields:
+        Tuple[int, str]: The line number, starting at 1, and the undecoded line.
+    """
+    if source == STDIN:
+        yield from iter_stream_lines(sys.stdin)
+        return
+    with open_text(source) as f:
+        yield from iter_stream_lines(f)
@@ -1,5 +1,5 @@
 import contextlib
-from typing import Callable
+from typing import Any, Callable
 
 import click
 
@@ -42,20 +42,23 @@ def determine_asset_type(data):
 
 
 def handle_output(
-    output_file: str, callback: Callable[[], None], output_path: str = None
-) -> None:
+    output_file: str, callback: Callable[[], Any], output_path: str = None
+) -> Any:
     """Helper function to handle output redirection to a file or stdout.
 
     Args:
         output_file: Path to the output file, or None to use stdout
         callback: Function that performs the actual output generation
         output_path: Optional path to display in the success message
+
+    Returns:
+        The value returned by the callback.
     """
 
     if output_file:
         with open(output_file, "w") as f:
             with contextlib.redirect_stdout(f):
-                callback()
+                result = callback()
         click.secho(
             f"Output written to {output_path or output_file}",
             fg="green",
@@ -63,8 +66,8 @@ def handle_output(
             bold=True,
         )
         click.secho()
-    else:
-        callback()
+        return result
+    return callback()
 
 
 def format_verbose_error(error_data):
@@ -0,0 +1,11 @@
+import pytest
+
+from stac_check.schema_cache import CACHE_DIR_ENV
+
+
+@pytest.fixture(autouse=True)
+def schema_cache_dir(tmp_path, monkeypatch):
+    """Keep the on-disk schema cache of every test out of the user cache directory."""
+    cache_dir = tmp_path / "schema-cache"
+    monkeypatch.setenv(CACHE_DIR_ENV, str(cache_dir))
+    return cache_dir
@@ -0,0 +1,205 @@
+import asyncio
+import threading
+import time
+from unittest import mock
+
+from stac_check.api_lint import ApiLinter
+from stac_check.async_api_lint import AsyncApiLinter
+
+FEATURE_COLLECTION = "sample_files/1.0.0/feature_collection.json"
+
+
+def test_async_lint_all_matches_lint_all():
+    expected = ApiLinter(source=FEATURE_COLLECTION, object_list_key="features")
+    linter = AsyncApiLinter(
+        source=FEATURE_COLLECTION, object_list_key="features", concurrency=4
+    )
+
+    results = asyncio.run(linter.lint_all())
+
+    assert results == expected.lint_all()
+    assert linter.version == expected.version
+    assert linter.total_time > 0
+
+
+def test_async_lint_all_follows_pages():
+    responses = {
+        f"https://example.com/items?page={page}": {
+            "features": [{"id": f"item-{page}-{i}"} for i in range(3)],
+            "links": [
+                {"rel": "next", "href": f"https://example.com/items?page={page + 1}"}
+            ],
+        }
+        for page in range(1, 4)
+    }
+    linter = AsyncApiLinter(
+        source="https://example.com/items?page=1",
+        object_list_key="features",
+        pages=3,
+    )
+
+    with mock.patch.object(
+        linter, "_fetch_and_parse", side_effect=responses.__getitem__
+    ):
+        results = asyncio.run(linter.lint_all())
+
+    assert [result["original_object"]["id"] for result in results] == [
+        f"item-{page}-{i}" for page in range(1, 4) for i in range(3)
+    ]
+    assert [result["path"] for result in results] == [
+        f"https://example.com/items/item-{page}-{i}"
+        for page in range(1, 4)
+        for i in range(3)
+    ]
+
+
+def test_async_lint_all_respects_concurrency():
+    lock = threading.Lock()
+    active = []
+    peak = []
+
+    def lint_object(obj, obj_url, **kwargs):
+        with lock:
+            active.append(obj_url)
+            peak.append(len(active))
+        time.sleep(0.01)
+        with lock:
+            active.remove(obj_url)
+        return {"path": obj_url, "valid_stac": True}
+
+    linter = AsyncApiLinter(
+        source=FEATURE_COLLECTION, object_list_key="features", concurrency=2
+    )
+    with mock.patch("stac_check.async_api_lint._lint_object", side_effect=lint_object):
+        results = asyncio.run(linter.lint_all())
+
+    assert len(results) == 10
+    assert max(peak) <= 2
+
+
+def test_async_lint_all_with_batch_geometry():
+    expected = ApiLinter(
+        source=FEATURE_COLLECTION, object_list_key="features", batch_geometry=True
+    ).lint_all()
+    linter = AsyncApiLinter(
+        source=FEATURE_COLLECTION,
+        object_list_key="features",
+        batch_geometry=True,
+        geometry_batch_size=4,
+    )
+
+    results = asyncio.run(linter.lint_all())
+
+    assert results == expected
+
+
+def catalog_responses(items_per_catalog=3):
+    """A catalog linking to two child catalogs, each linking to its items."""
+    root = "https://example.com/catalog.json"
+    responses = {
+        root: {
+            "type": "Catalog",
+            "id": "root",
+            "stac_version": "1.0.0",
+            "links": [
+                {"rel": "self", "href": root},
+                {"rel": "child", "href": "./a/catalog.json"},
+                {"rel": "child", "href": "./b/catalog.json"},
+            ],
+        }
+    }
+    for name in ("a", "b"):
+        responses[f"https://example.com/./{name}/catalog.json"] = {
+            "type": "Catalog",
+            "id": name,
+            "stac_version": "1.0.0",
+            "links": [
+                {"rel": "root", "href": "../catalog.json"},
+                *(
+                    {"rel": "item", "href": f"./{name}-{i}.json"}
+                    for i in range(items_per_catalog)
+                ),
+            ],
+        }
+        for i in range(items_per_catalog):
+            responses[f"https://example.com/./{name}/./{name}-{i}.json"] = {
+                "type": "Feature",
+                "id": f"{name}-{i}",
+            }
+    return root, responses
+
+
+def test_async_lint_all_follows_catalog_links():
+    root, responses = catalog_responses()
+    linter = AsyncApiLinter(source=root, object_list_key="features", concurrency=4)
+
+    with mock.patch.object(
+        linter, "_fetch_and_parse", side_effect=responses.__getitem__
+    ):
+        results = asyncio.run(linter.lint_all())
+
+    # Children are reported after their catalog, in link order
+    assert [result["original_object"]["id"] for result in results] == [
+        "a",
+        "a-0",
+        "a-1",
+        "a-2",
+        "b",
+        "b-0",
+        "b-1",
+        "b-2",
+    ]
+    # Objects of old STAC versions inherit the version of their catalog
+    assert results[1]["original_object"]["stac_version"] == "1.0.0"
+
+
+def test_async_lint_all_fetches_children_concurrently():
+    root, responses = catalog_responses(items_per_catalog=6)
+    lock = threading.Lock()
+    active = []
+    peak = []
+
+    def fetch(url):
+        with lock:
+            active.append(url)
+            peak.append(len(active))
+        time.sleep(0.02)
+        with lock:
+            active.remove(url)
+        return responses[url]
+
+    linter = AsyncApiLinter(source=root, object_list_key="features", concurrency=3)
+    with mock.patch.object(linter, "_fetch_and_parse", side_effect=fetch):
+        results = asyncio.run(linter.lint_all())
+
+    assert len(results) == 14
+    assert 1 < max(peak) <= 3
+
+
+def test_async_lint_all_bounds_pending_tasks():
+    root, responses = catalog_responses(items_per_catalog=10)
+    fetched = []
+    fetched_when_linted = []
+
+    def fetch(url):
+        fetched.append(url)
+        return responses[url]
+
+    def lint_object(obj, obj_url, **kwargs):
+        fetched_when_linted.append(len(fetched))
+        return {"path": obj_url, "valid_stac": True}
+
+    linter = AsyncApiLinter(
+        source=root, object_list_key="features", concurrency=1, window=2
+    )
+    with (
+        mock.patch.object(linter, "_fetch_and_parse", side_effect=fetch),
+        mock.patch("stac_check.async_api_lint._lint_object", side_effect=lint_object),
+    ):
+        results = asyncio.run(linter.lint_all())
+
+    assert len(results) == 22
+    # Besides the root, at most `window` objects are fetched ahead of those linted
+    assert all(
+        count <= linted + 1 + 2 for linted, count in enumerate(fetched_when_linted)
+    )
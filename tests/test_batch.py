@@ -0,0 +1,133 @@
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from stac_check.batch import discover_files, is_glob, lint_files
+from stac_check.cli import main as cli_main
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """A directory tree of JSON files, with files that are not STAC objects."""
+    for path in [
+        "b.json",
+        "a.geojson",
+        "notes.txt",
+        "sub/c.json",
+        "sub/deeper/d.JSON",
+        ".hidden/e.json",
+        "sub/.f.json",
+    ]:
+        file = tmp_path / path
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text(json.dumps({"id": file.stem}))
+    return tmp_path
+
+
+def relative(paths, root):
+    return [os.path.relpath(path, root) for path in paths]
+
+
+def test_discover_directory(tree):
+    assert relative(discover_files([str(tree)]), tree) == [
+        "a.geojson",
+        "b.json",
+        "sub/c.json",
+        "sub/deeper/d.JSON",
+    ]
+
+
+def test_discover_patterns_and_files(tree):
+    files = list(
+        discover_files(
+            [
+                str(tree / "sub" / "**" / "*.json"),
+                str(tree / "b.json"),
+                str(tree / "sub" / "c.json"),
+                str(tree / "missing.json"),
+                "https://example.com/item.json",
+            ]
+        )
+    )
+
+    # Each file is listed once, paths that do not exist are left to the linter
+    assert relative(files[:-1], tree) == ["sub/c.json", "b.json", "missing.json"]
+    assert files[-1] == "https://example.com/item.json"
+
+
+def test_is_glob(tree):
+    assert is_glob("items/*.json")
+    assert not is_glob("items/item.json")
+    odd = tree / "[odd].json"
+    odd.write_text("{}")
+    assert not is_glob(str(odd))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_lint_files_keeps_order(tree, workers):
+    paths = [str(tree / f"item-{i}.json") for i in range(7)]
+    for path in paths[:-1]:
+        with open(path, "w") as f:
+            f.write("not json")
+
+    results = list(lint_files(paths, workers=workers, chunk_size=2))
+
+    assert [result["path"] for result in results] == paths
+    assert all(result["valid_stac"] is False for result in results)
+
+
+def test_cli_lints_directory(tree):
+    results = [
+        {"path": "a.json", "valid_stac": True, "best_practices": []},
+        {"path": "b.json", "valid_stac": False, "error_message": "Invalid"},
+    ]
+    with patch("stac_check.cli.lint_files", return_value=iter(results)) as lint:
+        result = CliRunner().invoke(cli_main, [str(tree), "--workers", "3"])
+
+    assert result.exit_code == 1
+    assert lint.call_args.kwargs["workers"] == 3
+    assert relative(lint.call_args.args[0], tree)[0] == "a.geojson"
+    assert "Batch: 2 files linted" in result.output
+    assert "Passed: 1/2" in result.output
+
+
+def test_cli_batch_rejects_single_file_modes(tree):
+    result = CliRunner().invoke(
+        cli_main, [str(tree / "a.geojson"), str(tree / "b.json"), "--recursive"]
+    )
+
+    assert result.exit_code == 1
+    assert "take a single FILE" in result.output
+
+
+@pytest.mark.parametrize(
+    "option",
+    [["--pages", "2"], ["--prefetch", "1"], ["--batch-geometry"], ["--max-depth", "1"]],
+)
+def test_cli_batch_rejects_single_file_options(tree, option):
+    with patch("stac_check.cli.lint_files") as lint:
+        result = CliRunner().invoke(
+            cli_main, [str(tree / "a.geojson"), str(tree / "b.json"), *option]
+        )
+
+    assert result.exit_code == 1
+    assert "--pages, --prefetch, --batch-geometry and --max-depth" in result.output
+    lint.assert_not_called()
+
+
+def test_cli_url_with_query_string_is_not_a_pattern():
+    url = "https://example.com/search?collections=x"
+    with (
+        patch("stac_check.cli.lint_files") as lint,
+        patch("stac_check.cli.load_document", side_effect=OSError),
+        patch("stac_check.cli.ApiLinter", side_effect=RuntimeError) as api_linter,
+    ):
+        result = CliRunner().invoke(cli_main, [url, "--item-collection"])
+
+    assert "take a single FILE" not in result.output
+    assert isinstance(result.exception, RuntimeError)
+    assert api_linter.call_args.kwargs["source"] == url
+    lint.assert_not_called()
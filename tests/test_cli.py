@@ -10,6 +10,7 @@ from click.testing import CliRunner
 
 from stac_check.cli import is_item_collection
 from stac_check.cli import main as cli_main
+from stac_check.http_client import DEFAULT_TIMEOUT
 
 
 @pytest.fixture
@@ -80,6 +81,7 @@ def test_cli_collections(runner):
     with (
         patch("stac_check.cli.ApiLinter") as mock_api_linter,
         patch("stac_check.cli.Linter") as mock_linter,
+        patch("stac_check.cli.load_document") as mock_load_document,
     ):
         # Mock ApiLinter instance
         mock_api_instance = MagicMock()
@@ -107,6 +109,13 @@ def test_cli_collections(runner):
             verbose=False,
             fast=False,
             fast_linting=False,
+            document=mock_load_document.return_value,
+            stream=False,
+            workers=1,
+            prefetch=1,
+            batch_geometry=False,
+            schema_bundle=None,
+            result_store=None,
         )
 
 
@@ -115,6 +124,7 @@ def test_cli_item_collection(runner):
     with (
         patch("stac_check.cli.ApiLinter") as mock_api_linter,
         patch("stac_check.cli.Linter") as mock_linter,
+        patch("stac_check.cli.load_document") as mock_load_document,
     ):
         # Mock ApiLinter instance
         mock_api_instance = MagicMock()
@@ -141,9 +151,37 @@ def test_cli_item_collection(runner):
             verbose=False,
             fast=False,
             fast_linting=False,
+            document=mock_load_document.return_value,
+            stream=False,
+            workers=1,
+            prefetch=1,
+            batch_geometry=False,
+            schema_bundle=None,
+            result_store=None,
         )
 
 
+def test_cli_ndjson_is_streamed(runner):
+    """Test that NDJSON input is linted as a streamed item collection."""
+    with (
+        patch("stac_check.cli.ApiLinter") as mock_api_linter,
+        patch("stac_check.cli.load_document") as mock_load_document,
+    ):
+        mock_api_instance = MagicMock()
+        mock_api_instance.lint_all.return_value = [{"valid_stac": True}]
+        mock_api_instance.total_time = 0.0
+        mock_api_instance.fast = True
+        mock_api_linter.return_value = mock_api_instance
+
+        result = runner.invoke(cli_main, ["-", "--fast"], input='{"id": "a"}\n')
+
+        assert result.exit_code == 0
+        mock_load_document.assert_not_called()
+        assert mock_api_linter.call_args.kwargs["source"] == "-"
+        assert mock_api_linter.call_args.kwargs["stream"] is True
+        assert mock_api_linter.call_args.kwargs["object_list_key"] == "features"
+
+
 def test_cli_output_without_required_flags(runner):
     """Test that --output requires --collections, --item-collection, or --recursive."""
     with tempfile.NamedTemporaryFile() as tmp:
@@ -279,16 +317,24 @@ def test_is_item_collection_with_empty_features():
 def test_is_item_collection_with_mock_url():
     """Test is_item_collection with a mocked URL."""
     mock_response = MagicMock()
-    mock_response.json.return_value = {
-        "type": "FeatureCollection",
-        "features": [{"type": "Feature", "properties": {}}],
-    }
+    mock_response.iter_content.return_value = [
+        json.dumps(
+            {
+                "type": "FeatureCollection",
+                "features": [{"type": "Feature", "properties": {}}],
+            }
+        ).encode("utf-8")
+    ]
 
     with (
-        patch("stac_check.cli.requests.get", return_value=mock_response),
-        patch("stac_check.cli.is_valid_url", return_value=True),
+        patch("stac_check.sniff.get_session") as mock_get_session,
+        patch("stac_check.sniff.is_valid_url", return_value=True),
     ):
+        mock_get_session.return_value.get.return_value = mock_response
         assert is_item_collection("https://example.com/items") is True
+        # The request is not left to hang on a stalled server
+        get = mock_get_session.return_value.get
+        assert get.call_args.kwargs["timeout"] == DEFAULT_TIMEOUT
 
 
 def test_cli_auto_detect_item_collection(runner):
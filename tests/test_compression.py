@@ -0,0 +1,97 @@
+import bz2
+import gzip
+import json
+import lzma
+
+import pytest
+
+from stac_check import compression
+from stac_check.api_lint import ApiLinter
+from stac_check.batch import discover_files
+from stac_check.document import load_document
+from stac_check.lint import Linter
+from stac_check.streaming import is_ndjson, iter_features
+
+FEATURE_COLLECTION = "sample_files/1.0.0/feature_collection.json"
+ITEM = "sample_files/1.0.0/core-item.json"
+
+COMPRESSORS = {".gz": gzip.compress, ".bz2": bz2.compress, ".xz": lzma.compress}
+if compression.zstandard is not None:
+    COMPRESSORS[".zst"] = compression.zstandard.ZstdCompressor().compress
+
+
+def compress(source, target):
+    with open(source, "rb") as f:
+        target.write_bytes(COMPRESSORS[target.suffix](f.read()))
+    return str(target)
+
+
+@pytest.mark.parametrize("suffix", list(COMPRESSORS))
+def test_load_compressed_document(tmp_path, suffix):
+    path = compress(ITEM, tmp_path / f"core-item.json{suffix}")
+
+    assert load_document(path).data == load_document(ITEM).data
+    assert Linter(path).file_name == "core-item"
+
+
+@pytest.mark.parametrize("suffix", list(COMPRESSORS))
+def test_stream_compressed_features(tmp_path, suffix):
+    path = compress(FEATURE_COLLECTION, tmp_path / f"items.json{suffix}")
+
+    assert list(iter_features(path, chunk_size=64)) == list(
+        iter_features(FEATURE_COLLECTION)
+    )
+
+
+def test_compressed_ndjson(tmp_path):
+    with open(FEATURE_COLLECTION) as f:
+        features = json.load(f)["features"]
+    path = tmp_path / "items.ndjson.gz"
+    path.write_bytes(
+        gzip.compress("\n".join(json.dumps(f) for f in features).encode("utf-8"))
+    )
+
+    results = ApiLinter(source=str(path), object_list_key="features").lint_all()
+
+    assert is_ndjson(str(path))
+    assert [result["path"] for result in results] == [
+        f"{path}/{feature['id']}" for feature in features
+    ]
+
+
+def test_discover_compressed_files(tmp_path):
+    compress(ITEM, tmp_path / "a.json.gz")
+    (tmp_path / "b.tar.gz").write_bytes(b"")
+
+    assert list(discover_files([str(tmp_path)])) == [str(tmp_path / "a.json.gz")]
+
+
+def test_strip_compression_suffix():
+    assert compression.strip_compression_suffix("items.ndjson.ZST") == "items.ndjson"
+    assert compression.strip_compression_suffix("item.json") == "item.json"
+
+
+def test_zstd_requires_zstandard(tmp_path, monkeypatch):
+    monkeypatch.setattr(compression, "zstandard", None)
+    path = tmp_path / "item.json.zst"
+    path.write_bytes(b"")
+
+    with pytest.raises(ImportError, match="stac-check\\[zstd\\]"):
+        load_document(str(path))
+
+
+def test_map_file(tmp_path):
+    with compression.map_file(ITEM) as content:
+        assert isinstance(content, memoryview)
+        with open(ITEM, "rb") as f:
+            assert content == f.read()
+
+    empty = tmp_path / "empty.json"
+    empty.write_bytes(b"")
+    with compression.map_file(str(empty)) as content:
+        assert content == b""
+
+    path = compress(ITEM, tmp_path / "core-item.json.gz")
+    with compression.map_file(path) as content:
+        assert isinstance(content, bytes)
+        assert json.loads(content) == load_document(ITEM).data
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from stac_check.lint import Linter
 
 
@@ -32,3 +34,24 @@ def test_linter_max_links():
     # Since bloated_links is True in the config and the file has more links than max_links,
     # bloated_links should be in the best practices dict
     assert "bloated_links" in linter.create_best_practices_dict()
+
+
+def test_linter_config_cached():
+    file = "sample_files/1.0.0/core-item.json"
+    Linter.parse_config("tests/test.config.yml")
+
+    # A second parse of the same, unchanged files is served from the cache
+    with patch("stac_check.lint.yaml.load") as mock_load:
+        config = Linter.parse_config("tests/test.config.yml")
+        mock_load.assert_not_called()
+
+    # Modifying the returned config does not leak into the cache
+    config["settings"]["max_links"] = 0
+    assert Linter.parse_config("tests/test.config.yml")["settings"]["max_links"] == 20
+
+    # An already parsed config can be passed in directly
+    with patch.object(Linter, "parse_config") as mock_parse:
+        linter = Linter(file, config=config)
+        mock_parse.assert_not_called()
+    assert linter.config is config
+    assert "bloated_links" in linter.best_practices_dict
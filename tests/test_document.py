@@ -0,0 +1,73 @@
+import json
+
+from stac_check.cli import is_item_collection
+from stac_check.document import StacDocument, load_document
+from stac_check.lint import Linter
+
+
+def test_load_document_file():
+    file = "sample_files/1.0.0/core-item.json"
+    document = load_document(file)
+
+    assert document.source == file
+    assert document.data["id"] == "20201211_223832_CS2"
+    assert document.error is None
+    # An already loaded document is passed through unchanged
+    assert load_document(document) is document
+
+
+def test_load_document_dict():
+    item = {"id": "test-item", "type": "Feature"}
+    document = load_document(item)
+
+    assert document.source is None
+    assert document.data is item
+
+
+def test_linter_uses_loaded_document():
+    with open("sample_files/1.0.0/core-item.json") as f:
+        data = json.load(f)
+
+    # The source path does not exist, so any attempt to re-read it would fail
+    document = StacDocument(source="not/a/real/path/core-item.json", data=data)
+    linter = Linter(document)
+
+    assert linter.data is data
+    assert linter.item == "not/a/real/path/core-item.json"
+    assert linter.file_name == "core-item"
+    assert linter.object_id == "20201211_223832_CS2"
+
+
+def test_is_item_collection_with_document():
+    document = load_document("sample_files/1.0.0/feature_collection.json")
+    assert is_item_collection(document) is True
+
+    document = load_document("sample_files/1.0.0/core-item.json")
+    assert is_item_collection(document) is False
+
+
+def test_linter_resolves_relative_schemas_against_the_document(tmp_path, monkeypatch):
+    (tmp_path / "items").mkdir()
+    (tmp_path / "items" / "extension.json").write_text(
+        json.dumps(
+            {
+                "$schema": "http://json-schema.org/draft-07/schema#",
+                "type": "object",
+                "required": ["properties"],
+                "properties": {
+                    "properties": {"type": "object", "required": ["example:value"]}
+                },
+            }
+        )
+    )
+    with open("sample_files/1.0.0/core-item.json") as f:
+        item = json.load(f)
+    item["stac_extensions"] = ["./extension.json"]
+    (tmp_path / "items" / "item.json").write_text(json.dumps(item))
+    # The schema is not found relative to the working directory
+    monkeypatch.chdir(tmp_path)
+
+    linter = Linter("items/item.json")
+
+    assert linter.valid_stac is False
+    assert "example:value" in linter.error_msg
@@ -0,0 +1,208 @@
+import pytest
+
+from stac_check import geometry
+from stac_check.lint import Linter
+
+np = geometry.np
+requires_numpy = pytest.mark.skipif(np is None, reason="numpy is not installed")
+
+GEOMETRIES = [
+    {"type": "Point", "coordinates": [10.0, 20.0]},
+    {"type": "Point", "coordinates": [10.0, 95.0]},
+    {"type": "LineString", "coordinates": [[10, 20], [200, 20], [30, 100]]},
+    {
+        "type": "Polygon",
+        "coordinates": [
+            [[10, -10], [20.5, -10], [20.5, 10], [10, 10], [10, -10]],
+            [[12, -5], [15, -5], [15, 5], [12, -5]],
+        ],
+    },
+    {
+        "type": "Polygon",
+        "coordinates": [
+            [[-10.0, 120.0], [-10.0, 130.0], [10.0, 130.0], [-10.0, 120.0]]
+        ],
+    },
+    {
+        "type": "Polygon",
+        "coordinates": [[[120.0, 10.0], [130.0, 10.0], [130.0, 20.0], [120.0, 10.0]]],
+    },
+    {
+        "type": "MultiPolygon",
+        "coordinates": [
+            [[[0, 0, 5], [1, 0, 5], [1, 1, 5], [0, 0, 5]]],
+            [[[170, -20, 1], [190, -20, 1], [190, -10, 1], [170, -20, 1]]],
+        ],
+    },
+    {"type": "Polygon", "coordinates": [[[0, 0], [1, 0, 3], [1, 1], [0, 0]]]},
+    {"type": "LineString", "coordinates": [[0, 0], [1], [100, 1], [0, 0]]},
+    {"type": "Polygon", "coordinates": []},
+]
+
+
+def make_item(geometry_dict, bbox):
+    return {
+        "stac_version": "1.0.0",
+        "stac_extensions": [],
+        "type": "Feature",
+        "id": "test-geometry-engine",
+        "bbox": bbox,
+        "geometry": geometry_dict,
+        "properties": {"datetime": "2023-01-01T00:00:00Z"},
+        "links": [],
+        "assets": {},
+    }
+
+
+def run_geometry_checks(linter):
+    return (
+        linter.check_geometry_coordinates_definite_errors(),
+        linter.check_geometry_coordinates_order(),
+        linter.check_bbox_matches_geometry(),
+    )
+
+
+@requires_numpy
+@pytest.mark.parametrize("geometry_dict", GEOMETRIES)
+def test_numpy_engine_matches_python_engine(geometry_dict, monkeypatch):
+    item = make_item(geometry_dict, [10, -10, 20, 10])
+
+    vectorized = run_geometry_checks(Linter(item))
+    monkeypatch.setattr(geometry, "np", None)
+    assert run_geometry_checks(Linter(item)) == vectorized
+
+
+@requires_numpy
+def test_geometry_flattened_once():
+    linter = Linter(make_item(GEOMETRIES[6], [0, -20, 190, 1]))
+    flat = linter.flatten_geometry()
+
+    assert linter.flatten_geometry() is flat
+    assert flat.select(
+        [polygon[0] for polygon in GEOMETRIES[6]["coordinates"]]
+    ).array.shape == (8, 2)
+    assert flat.select([[[0, 0], [1, 1]]]) is None
+
+
+@requires_numpy
+def test_flatten_coordinates():
+    flat = geometry.flatten_coordinates(GEOMETRIES[3]["coordinates"])
+
+    assert flat.array.shape == (9, 2)
+    assert flat.array.dtype == np.float64
+    assert flat.offsets.tolist() == [0, 5]
+    assert flat.position(6) == [15, -5]
+    assert isinstance(flat.position(1)[0], float)
+
+
+@requires_numpy
+def test_flatten_coordinates_falls_back():
+    # Mixed 2D and 3D positions, short positions and non numeric values
+    assert geometry.flatten_coordinates(GEOMETRIES[7]["coordinates"]) is None
+    assert geometry.flatten_coordinates(GEOMETRIES[8]["coordinates"]) is None
+    assert geometry.flatten_coordinates([[[0, "0"], [1, 1]]]) is None
+    assert geometry.flatten_coordinates([[[0, None], [1, 1]]]) is None
+
+
+def test_flatten_coordinates_without_numpy(monkeypatch):
+    monkeypatch.setattr(geometry, "np", None)
+
+    assert geometry.flatten_coordinates([[0, 0], [1, 1]]) is None
+
+
+@requires_numpy
+def test_numpy_engine_reports_original_values():
+    item = make_item(
+        {
+            "type": "Polygon",
+            "coordinates": [[[10, 200], [20.5, 10], [20.5, 100], [10, 200]]],
+        },
+        [10.0, 10.0, 20.0, 100.0],
+    )
+    linter = Linter(item)
+
+    assert linter.check_geometry_coordinates_definite_errors() == (
+        False,
+        [(10, 200, "latitude > ±90°")],
+    )
+    assert linter.check_bbox_matches_geometry() == (
+        False,
+        [10, 10, 20.5, 200],
+        [10.0, 10.0, 20.0, 100.0],
+        [0.0, 0.0, 0.5, 100.0],
+    )
+
+
+@requires_numpy
+def test_numpy_engine_large_polygon():
+    angles = np.linspace(0, 2 * np.pi, 200_000)
+    ring = np.column_stack((np.cos(angles) * 10 + 20, np.sin(angles) * 5)).tolist()
+    ring[-1] = ring[0]
+    item = make_item(
+        {"type": "Polygon", "coordinates": [ring]}, [10.0, -5.0, 30.0, 5.0]
+    )
+    linter = Linter(item)
+
+    assert linter.check_geometry_coordinates_definite_errors() is True
+    assert linter.check_geometry_coordinates_order() is True
+    assert linter.check_bbox_matches_geometry() is True
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+@pytest.mark.parametrize("geometry_dict", GEOMETRIES)
+def test_geometry_summary_matches_separate_checks(
+    geometry_dict, use_numpy, monkeypatch
+):
+    if use_numpy and np is None:
+        pytest.skip("numpy is not installed")
+    if not use_numpy:
+        monkeypatch.setattr(geometry, "np", None)
+    item = make_item(geometry_dict, [10, -10, 20, 10])
+
+    summarized = run_geometry_checks(Linter(item))
+    # Without a summary each check walks the coordinates on its own
+    monkeypatch.setattr(Linter, "geometry_summary", lambda self: None)
+    assert run_geometry_checks(Linter(item)) == summarized
+
+
+def test_geometry_summary_single_pass(monkeypatch):
+    monkeypatch.setattr(geometry, "np", None)
+    linter = Linter(make_item(GEOMETRIES[6], [0, -20, 190, 1]))
+    summary = linter.geometry_summary()
+
+    assert linter.geometry_summary() is summary
+    assert summary == geometry.GeometrySummary(
+        invalid_coordinate=(190, -20, "longitude > ±180°"),
+        reversed_order=True,
+        bbox=[0, -20, 190, 1],
+    )
+
+
+def test_geometry_summary_malformed_coordinates(monkeypatch):
+    monkeypatch.setattr(geometry, "np", None)
+
+    assert geometry.summarize_geometry(GEOMETRIES[7]) is not None
+    assert geometry.summarize_geometry(GEOMETRIES[8]) is None
+    assert (
+        geometry.summarize_geometry(
+            {"type": "Polygon", "coordinates": [[[0, "1"], [1, 1], [0, 0]]]}
+        )
+        is None
+    )
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_summarize_geometries_matches_single_geometries(use_numpy, monkeypatch):
+    if use_numpy and np is None:
+        pytest.skip("numpy is not installed")
+    if not use_numpy:
+        monkeypatch.setattr(geometry, "np", None)
+    geometries = GEOMETRIES + [None, {"type": "Point", "coordinates": [200, -95]}]
+
+    summaries = geometry.summarize_geometries(geometries)
+
+    assert len(summaries) == len(geometries)
+    assert summaries[len(GEOMETRIES)] is None
+    for geometry_dict, summary in zip(geometries, summaries):
+        if isinstance(geometry_dict, dict):
+            assert summary == geometry.summarize_geometry(geometry_dict)
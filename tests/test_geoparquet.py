@@ -0,0 +1,206 @@
+import json
+import struct
+
+import pytest
+
+from stac_check import geoparquet
+from stac_check.api_lint import ApiLinter
+from stac_check.geometry import summarize_geometries
+from stac_check.geoparquet import (
+    is_geoparquet,
+    iter_geoparquet_items,
+    summarize_wkb_geometries,
+    wkb_to_geojson,
+)
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+FEATURE_COLLECTION = "sample_files/1.0.0/feature_collection.json"
+
+
+def wkb_positions(positions, byte_order="<"):
+    return struct.pack(f"{byte_order}I", len(positions)) + b"".join(
+        struct.pack(f"{byte_order}{len(p)}d", *p) for p in positions
+    )
+
+
+def wkb(geometry, byte_order="<"):
+    """Encode a GeoJSON geometry as ISO WKB."""
+    codes = {name: code for code, name in geoparquet.WKB_TYPES.items()}
+    kind = geometry["type"]
+    coordinates = geometry.get("coordinates")
+    first = coordinates
+    while isinstance(first, list) and first and isinstance(first[0], list):
+        first = first[0]
+    z = 1000 if isinstance(first, list) and len(first) == 3 else 0
+    header = struct.pack(f"{byte_order}BI", byte_order == "<", codes[kind] + z)
+    if kind == "Point":
+        return header + struct.pack(f"{byte_order}{len(coordinates)}d", *coordinates)
+    if kind == "LineString":
+        return header + wkb_positions(coordinates, byte_order)
+    if kind == "Polygon":
+        return (
+            header
+            + struct.pack(f"{byte_order}I", len(coordinates))
+            + b"".join(wkb_positions(ring, byte_order) for ring in coordinates)
+        )
+    members = (
+        geometry["geometries"]
+        if kind == "GeometryCollection"
+        else [
+            {"type": kind[len("Multi") :], "coordinates": member}
+            for member in coordinates
+        ]
+    )
+    return (
+        header
+        + struct.pack(f"{byte_order}I", len(members))
+        + b"".join(wkb(member, byte_order) for member in members)
+    )
+
+
+GEOMETRIES = [
+    {"type": "Point", "coordinates": [10.0, 20.0]},
+    {"type": "Point", "coordinates": [10.0, 20.0, 5.0]},
+    {"type": "LineString", "coordinates": [[0.0, 0.0], [1.0, 1.0]]},
+    {
+        "type": "Polygon",
+        "coordinates": [
+            [[0.0, 0.0], [4.0, 0.0], [4.0, 4.0], [0.0, 4.0], [0.0, 0.0]],
+            [[1.0, 1.0], [1.0, 2.0], [2.0, 2.0], [1.0, 1.0]],
+        ],
+    },
+    {"type": "MultiPoint", "coordinates": [[0.0, 0.0], [200.0, 95.0]]},
+    {"type": "MultiLineString", "coordinates": [[[0.0, 0.0], [1.0, 1.0]]]},
+    {
+        "type": "MultiPolygon",
+        "coordinates": [
+            [[[170.0, 0.0], [-170.0, 0.0], [-170.0, 5.0], [170.0, 5.0], [170.0, 0.0]]],
+            [[[0.0, 0.0], [0.0, 1.0], [1.0, 1.0], [0.0, 0.0]]],
+        ],
+    },
+    {
+        "type": "GeometryCollection",
+        "geometries": [{"type": "Point", "coordinates": [1.0, 2.0]}],
+    },
+]
+
+
+@pytest.mark.parametrize("geometry", GEOMETRIES)
+@pytest.mark.parametrize("byte_order", ["<", ">"])
+def test_wkb_to_geojson(geometry, byte_order):
+    assert wkb_to_geojson(wkb(geometry, byte_order)) == geometry
+
+
+def test_ewkb_with_srid_and_m_values():
+    # EWKB Point with SRID 4326 and Z and M values
+    data = struct.pack("<BII4d", 1, 0xE0000001, 4326, 1.0, 2.0, 3.0, 9.0)
+
+    assert wkb_to_geojson(data) == {"type": "Point", "coordinates": [1.0, 2.0, 3.0]}
+
+
+def test_empty_point():
+    data = struct.pack("<BI2d", 1, 1, float("nan"), float("nan"))
+
+    assert wkb_to_geojson(data) == {"type": "Point", "coordinates": []}
+
+
+def test_invalid_wkb():
+    with pytest.raises(ValueError):
+        wkb_to_geojson(b"\x01\x03\x00\x00\x00\x05")
+
+
+def test_summarize_wkb_geometries_matches_geojson():
+    geometries = GEOMETRIES + [
+        {"type": "Point", "coordinates": [float("nan"), 1.0]},
+    ]
+
+    summaries = summarize_wkb_geometries([wkb(g) for g in geometries] + [None])
+
+    assert summaries == summarize_geometries(geometries + [None])
+
+
+def write_items(path, features):
+    rows = []
+    for feature in features:
+        row = {
+            key: value
+            for key, value in feature.items()
+            if key not in ("properties", "geometry")
+        }
+        row.update(feature["properties"])
+        row["geometry"] = wkb(feature["geometry"])
+        rows.append(row)
+    table = pa.Table.from_pylist(rows).replace_schema_metadata(
+        {"geo": json.dumps({"primary_column": "geometry", "columns": {}})}
+    )
+    pq.write_table(table, path, row_group_size=2)
+
+
+@pytest.fixture
+def features():
+    with open(FEATURE_COLLECTION) as f:
+        return json.load(f)["features"]
+
+
+def test_iter_geoparquet_items(tmp_path, features):
+    path = str(tmp_path / "items.parquet")
+    table = pa.table(
+        {
+            "type": ["Feature"],
+            "stac_version": ["1.0.0"],
+            "id": ["a"],
+            "geometry": [wkb(GEOMETRIES[0])],
+            "bbox": [{"xmin": 10.0, "ymin": 20.0, "xmax": 10.0, "ymax": 20.0}],
+            "datetime": pa.array([None], pa.timestamp("us", tz="UTC")),
+            "start_datetime": pa.array(
+                [1577836800000000], pa.timestamp("us", tz="UTC")
+            ),
+            "eo:cloud_cover": [None],
+            "assets": [{"data": {"href": "a.tif", "title": None}}],
+        }
+    )
+    pq.write_table(table, path)
+
+    assert list(iter_geoparquet_items(path)) == [
+        {
+            "type": "Feature",
+            "stac_version": "1.0.0",
+            "id": "a",
+            "geometry": GEOMETRIES[0],
+            "bbox": [10.0, 20.0, 10.0, 20.0],
+            "properties": {
+                "datetime": None,
+                "start_datetime": "2020-01-01T00:00:00Z",
+            },
+            "assets": {"data": {"href": "a.tif"}},
+        }
+    ]
+
+
+@pytest.mark.parametrize("batch_geometry", [False, True])
+def test_api_linter_reads_geoparquet(tmp_path, features, batch_geometry):
+    path = str(tmp_path / "items.geoparquet")
+    write_items(path, features)
+
+    linter = ApiLinter(
+        source=path,
+        object_list_key="features",
+        batch_geometry=batch_geometry,
+        geometry_batch_size=2,
+    )
+    results = linter.lint_all()
+
+    assert is_geoparquet(path)
+    assert linter.stream
+    assert [result["path"] for result in results] == [
+        f"{path}/{feature['id']}" for feature in features
+    ]
+
+
+def test_geoparquet_requires_pyarrow(tmp_path, monkeypatch):
+    monkeypatch.setattr(geoparquet, "pq", None)
+
+    with pytest.raises(ImportError, match="stac-check\\[geoparquet\\]"):
+        list(iter_geoparquet_items(str(tmp_path / "items.parquet")))
@@ -0,0 +1,80 @@
+from unittest.mock import patch
+
+import pytest
+import requests
+import requests_mock
+
+from stac_check import http_client
+from stac_check.api_lint import ApiLinter
+from stac_check.http_client import (
+    configure_session,
+    create_session,
+    fetch_json,
+    get_session,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_session():
+    yield
+    http_client._session = None
+
+
+def test_create_session_pool_sizes():
+    session = create_session(pool_connections=3, pool_maxsize=7)
+    adapter = session.get_adapter("https://example.com")
+
+    assert adapter._pool_connections == 3
+    assert adapter._pool_maxsize == 7
+    assert "gzip" in session.headers["Accept-Encoding"]
+
+
+def test_get_session_is_shared():
+    assert get_session() is get_session()
+
+
+def test_configure_session_replaces_shared_session():
+    session = get_session()
+    configured = configure_session(pool_maxsize=32)
+
+    assert configured is not session
+    assert get_session() is configured
+    assert configured.get_adapter("https://example.com")._pool_maxsize == 32
+
+
+def test_fetch_json():
+    url = "https://example.com/items"
+    with requests_mock.Mocker() as mock:
+        mock.get(url, json={"type": "FeatureCollection", "features": []})
+        mock.get(url + "/missing", status_code=404, json={})
+
+        assert fetch_json(url, {"x-api-key": "key"}) == {
+            "type": "FeatureCollection",
+            "features": [],
+        }
+        assert mock.last_request.headers["x-api-key"] == "key"
+        with pytest.raises(requests.exceptions.HTTPError):
+            fetch_json(url + "/missing")
+
+
+def test_api_linter_pages_share_session_connections():
+    url = "https://example.com/items"
+    linter = ApiLinter(source=url, object_list_key="features", pages=2, prefetch=0)
+    with requests_mock.Mocker() as mock:
+        mock.get(
+            url,
+            json={
+                "features": [{"id": "a"}],
+                "links": [{"rel": "next", "href": url + "?page=2"}],
+            },
+        )
+        mock.get(url + "?page=2", json={"features": [{"id": "b"}], "links": []})
+
+        with patch(
+            "stac_check.http_client.get_session", wraps=get_session
+        ) as mock_get_session:
+            objects = list(linter.iterate_objects())
+
+    assert [obj["id"] for obj, _ in objects] == ["a", "b"]
+    assert mock.call_count == 2
+    assert mock_get_session.call_count == 2
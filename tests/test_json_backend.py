@@ -0,0 +1,81 @@
+import io
+import json
+
+import pytest
+
+from stac_check import json_backend
+from stac_check.document import load_document
+
+ITEM = "sample_files/1.0.0/core-item.json"
+
+
+@pytest.fixture(params=json_backend.available_backends())
+def backend(request):
+    previous = json_backend.backend
+    yield json_backend.set_backend(request.param)
+    json_backend.set_backend(previous)
+
+
+def test_loads_matches_standard_library(backend):
+    with open(ITEM, "rb") as f:
+        data = f.read()
+
+    assert json_backend.loads(data) == json.loads(data)
+    assert json_backend.loads(data.decode("utf-8")) == json.loads(data)
+    assert json_backend.load(io.BytesIO(data)) == json.loads(data)
+    assert load_document(ITEM).data == json.loads(data)
+
+
+def test_loads_accepts_what_the_standard_library_accepts(backend):
+    assert json_backend.loads('{"bbox": [NaN, 1]}')["bbox"][1] == 1
+    assert json_backend.loads(b"[123456789012345678901234567890]") == [
+        pytest.approx(123456789012345678901234567890)
+    ]
+
+
+def test_invalid_json_raises_standard_error(backend):
+    with pytest.raises(json.JSONDecodeError):
+        json_backend.loads('{"id": ')
+
+
+def test_dumps_round_trips(backend):
+    value = {"id": "a", "bbox": [1.5, -2], "nested": {"x": None}, 1: 2**70}
+
+    assert json.loads(json_backend.dumps(value)) == {
+        "id": "a",
+        "bbox": [1.5, -2],
+        "nested": {"x": None},
+        "1": 2**70,
+    }
+    assert json_backend.dumps({"a": {1}}, default=str) == '{"a":"{1}"}'
+
+
+def test_backend_from_environment(monkeypatch):
+    monkeypatch.setenv(json_backend.JSON_BACKEND_ENV, "json")
+    previous = json_backend.backend
+    try:
+        assert json_backend.set_backend() == "json"
+    finally:
+        json_backend.set_backend(previous)
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError, match="Unknown JSON backend"):
+        json_backend.set_backend("yaml")
+
+
+@pytest.mark.parametrize("name", ["yaml", "simdjson"])
+def test_unusable_backend_in_environment_warns(monkeypatch, name):
+    # The simdjson backend is unusable when pysimdjson is not installed
+    monkeypatch.setattr(json_backend, "simdjson", None)
+    monkeypatch.setenv(json_backend.JSON_BACKEND_ENV, name)
+    previous = json_backend.backend
+    try:
+        with pytest.warns(
+            UserWarning, match=f"Ignoring {json_backend.JSON_BACKEND_ENV}"
+        ):
+            json_backend._set_default_backend()
+        assert json_backend.backend == json_backend.available_backends()[0]
+    finally:
+        monkeypatch.undo()
+        json_backend.set_backend(previous)
@@ -1,4 +1,5 @@
 import json
+from unittest.mock import patch
 
 import requests_mock
 
@@ -192,3 +193,29 @@ def test_verbose_error_message():
     verbose_str = str(linter.verbose_error_msg)
     assert "required" in verbose_str
     assert "id" in verbose_str
+
+
+def test_attributes_are_computed_on_first_read():
+    file = "sample_files/1.0.0/core-item.json"
+    message = {"valid_stac": True, "asset_type": "ITEM", "schema": []}
+    with (
+        patch.object(Linter, "_validate_document", return_value=message) as validate,
+        patch.object(Linter, "check_links_assets", return_value=[]) as check,
+        patch.object(Linter, "create_best_practices_dict", return_value={}) as lint,
+    ):
+        linter = Linter(file, assets=True, links=True)
+        validate.assert_not_called()
+
+        assert linter.valid_stac is True
+        assert linter.asset_type == "ITEM"
+        assert linter.object_id == "20201211_223832_CS2"
+        check.assert_not_called()
+        lint.assert_not_called()
+
+        assert linter.invalid_link_format == []
+        assert linter.best_practices_msg == linter.best_practices_msg
+
+    # Each piece of work ran once, when its attribute was first read
+    assert validate.call_count == 1
+    assert check.call_count == 1
+    assert lint.call_count == 1
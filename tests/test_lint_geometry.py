@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from stac_check.lint import Linter
 
 
@@ -349,3 +351,42 @@ def test_bbox_matches_geometry():
     }
     linter = Linter(no_bbox_item)
     assert linter.check_bbox_matches_geometry() is True
+
+
+def test_best_practices_computed_once():
+    """Test that the rule checks run once per Linter and feed both message lists."""
+    item = {
+        "stac_version": "1.0.0",
+        "stac_extensions": [],
+        "type": "Feature",
+        "id": "test-best-practices-once",
+        "bbox": [10.0, -10.0, 20.0, 10.0],
+        "geometry": {
+            "type": "Polygon",
+            "coordinates": [
+                [
+                    [10.0, -10.0],
+                    [120.0, -10.0],
+                    [20.0, 10.0],
+                    [10.0, 10.0],
+                    [10.0, -10.0],
+                ]
+            ],
+        },
+        "properties": {"datetime": None},
+    }
+
+    with patch.object(
+        Linter,
+        "create_best_practices_dict",
+        autospec=True,
+        side_effect=Linter.create_best_practices_dict,
+    ) as mock_create:
+        linter = Linter(item)
+        assert any("datetime field to null" in m for m in linter.best_practices_msg)
+        assert any("wrong order" in m for m in linter.geometry_errors_msg)
+        assert not any("wrong order" in m for m in linter.best_practices_msg)
+
+    assert mock_create.call_count == 1
+    assert "datetime_null" in linter.best_practices_dict
+    assert "geometry_coordinates_order" in linter.best_practices_dict
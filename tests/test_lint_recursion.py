@@ -1,3 +1,9 @@
+import json
+from unittest.mock import patch
+
+from stac_check.crawler import crawl_catalog
+from stac_check.display_messages import recursive_message
+from stac_check.document import load_document
 from stac_check.lint import Linter
 
 
@@ -188,3 +194,135 @@ def test_linter_recursive_100():
             "version": "1.0.0",
         },
     ]
+
+
+def test_recursive_message_does_not_revalidate(capsys):
+    file = "sample_files/1.0.0/catalog-with-bad-item.json"
+    linter = Linter(file, assets=False, links=False, recursive=True)
+    # Attributes are computed when first read, validate before patching
+    linter.validate_all
+
+    with (
+        patch("stac_check.display_messages.Linter") as mock_linter,
+        patch("stac_check.lint.StacValidate") as mock_validate,
+    ):
+        recursive_message(linter)
+
+    mock_linter.assert_not_called()
+    mock_validate.assert_not_called()
+    output = capsys.readouterr().out
+    for msg in linter.validate_all:
+        assert msg["path"] in output
+        assert f"{msg['asset_type']} Passed: {msg['valid_stac']}" in output
+
+
+def test_crawl_catalog_order_and_depth():
+    document = load_document("sample_files/1.0.0/catalog-with-bad-item.json")
+    results = crawl_catalog(document, Linter, workers=4)
+
+    assert [result.path for result in results] == [
+        "sample_files/1.0.0/catalog-with-bad-item.json",
+        "sample_files/1.0.0/./bad-item.json",
+        "sample_files/1.0.0/./collectionless-item.json",
+    ]
+    assert [result.depth for result in results] == [1, 2, 2]
+    assert all(result.message["validation_method"] == "recursive" for result in results)
+
+    results = crawl_catalog(document, Linter, max_depth=1)
+    assert [result.path for result in results] == [
+        "sample_files/1.0.0/catalog-with-bad-item.json"
+    ]
+
+
+def test_crawl_catalog_visits_each_object_once(tmp_path):
+    item = {
+        "type": "Feature",
+        "stac_version": "1.0.0",
+        "id": "item",
+        "geometry": None,
+        "properties": {"datetime": "2020-01-01T00:00:00Z"},
+        "links": [],
+        "assets": {},
+    }
+    catalog = {
+        "type": "Catalog",
+        "stac_version": "1.0.0",
+        "id": "catalog",
+        "description": "A catalog linking the same item twice",
+        "links": [
+            {"rel": "item", "href": "./item.json"},
+            {"rel": "item", "href": "item.json"},
+            {"rel": "item", "href": "./missing.json"},
+        ],
+    }
+    (tmp_path / "item.json").write_text(json.dumps(item))
+    (tmp_path / "catalog.json").write_text(json.dumps(catalog))
+
+    document = load_document(str(tmp_path / "catalog.json"))
+    results = crawl_catalog(document, Linter)
+
+    assert [result.path.rsplit("/", 1)[-1] for result in results] == [
+        "catalog.json",
+        "item.json",
+        "missing.json",
+    ]
+    assert results[1].message["valid_stac"] is True
+    assert results[2].message["valid_stac"] is False
+    assert results[2].best_practices == []
+
+
+def test_recursive_lint_best_practices():
+    file = "sample_files/1.0.0/catalog-with-bad-item.json"
+    linter = Linter(file, assets=False, links=False, recursive=True, workers=2)
+
+    assert len(linter.recursive_lint) == 3
+    assert {msg["path"] for msg in linter.validate_all} <= set(linter.recursive_lint)
+    for lint in linter.recursive_lint.values():
+        assert set(lint) == {"best_practices", "geometry_errors"}
+
+
+def test_recursive_validation_reuses_root_message():
+    file = "sample_files/1.0.0/catalog-with-bad-item.json"
+    linter = Linter(file, assets=False, links=False, recursive=True)
+    validated = []
+    validate_file = Linter.validate_file
+
+    def record(self, document):
+        validated.append(document.source)
+        return validate_file(self, document)
+
+    with patch.object(Linter, "validate_file", autospec=True, side_effect=record):
+        paths = list(linter.recursive_lint)
+
+    # The root is validated once for the Linter, then only its children are crawled
+    assert validated.count(file) == 1
+    assert paths[0] == file
+    assert linter.recursive_lint[file]["best_practices"] == linter.best_practices_msg
+
+
+def test_crawl_catalog_reports_malformed_child(tmp_path):
+    item = {
+        "type": "Feature",
+        "stac_version": "1.0.0",
+        "id": "item",
+        "geometry": None,
+        "properties": [],
+        "links": [],
+        "assets": {},
+    }
+    catalog = {
+        "type": "Catalog",
+        "stac_version": "1.0.0",
+        "id": "catalog",
+        "description": "A catalog linking a malformed item",
+        "links": [{"rel": "item", "href": "./item.json"}],
+    }
+    (tmp_path / "item.json").write_text(json.dumps(item))
+    (tmp_path / "catalog.json").write_text(json.dumps(catalog))
+
+    document = load_document(str(tmp_path / "catalog.json"))
+    results = crawl_catalog(document, Linter)
+
+    assert len(results) == 2
+    assert results[1].message["valid_stac"] is False
+    assert results[1].best_practices == []
@@ -1,3 +1,6 @@
+import json
+import threading
+import time
 from unittest import mock
 
 import pytest
@@ -8,6 +11,7 @@ from stac_check.display_messages import (
     collections_message,
     item_collection_message,
 )
+from stac_check.result_store import ResultStore
 
 
 @pytest.fixture
@@ -271,3 +275,256 @@ def test_pages_parameter_handling(item_collection_url):
     # This test might need to be adjusted if the API doesn't have enough items
     if len(results_2pages) > len(results_explicit_1):
         assert len(results_2pages) > len(results_explicit_1)
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_lint_all_with_workers_matches_serial(stream):
+    """Test that linting in a process pool returns the serial results in order."""
+    source = "sample_files/1.0.0/feature_collection.json"
+    serial = ApiLinter(source=source, object_list_key="features", stream=stream)
+    pooled = ApiLinter(
+        source=source,
+        object_list_key="features",
+        stream=stream,
+        workers=2,
+        chunk_size=3,
+    )
+
+    expected = serial.lint_all()
+    results = pooled.lint_all()
+
+    assert [result["path"] for result in results] == [
+        result["path"] for result in expected
+    ]
+    assert results == expected
+    assert pooled.version == serial.version
+
+
+def _paged_responses(count):
+    """Build `count` pages of one item each, linked by "next" links."""
+    return {
+        f"https://example.com/items?page={page}": {
+            "type": "FeatureCollection",
+            "features": [{"id": f"item-{page}"}],
+            "links": (
+                [
+                    {
+                        "rel": "next",
+                        "href": f"https://example.com/items?page={page + 1}",
+                    }
+                ]
+                if page < count
+                else []
+            ),
+        }
+        for page in range(1, count + 1)
+    }
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+def test_iterate_objects_with_prefetch(prefetch):
+    """Test that prefetching pages keeps the order and respects the page limit."""
+    responses = _paged_responses(6)
+    linter = ApiLinter(
+        source="https://example.com/items?page=1",
+        object_list_key="features",
+        pages=4,
+        prefetch=prefetch,
+    )
+
+    with mock.patch.object(
+        linter, "_fetch_and_parse", side_effect=responses.__getitem__
+    ) as mock_fetch:
+        objects = list(linter.iterate_objects())
+
+    assert [obj["id"] for obj, _ in objects] == [f"item-{i}" for i in range(1, 5)]
+    assert [url for _, url in objects] == [
+        f"https://example.com/items/item-{i}" for i in range(1, 5)
+    ]
+    assert mock_fetch.call_count == 4
+
+
+def test_iterate_objects_prefetch_fetches_ahead():
+    """Test that the next page is fetched while the current page is consumed."""
+    responses = _paged_responses(3)
+    linter = ApiLinter(
+        source="https://example.com/items?page=1",
+        object_list_key="features",
+        pages=3,
+        prefetch=1,
+    )
+    fetched = threading.Event()
+
+    def fetch(url):
+        if url.endswith("page=2"):
+            fetched.set()
+        return responses[url]
+
+    with mock.patch.object(linter, "_fetch_and_parse", side_effect=fetch):
+        objects = linter.iterate_objects()
+        next(objects)
+        # Page 2 is requested without consuming further objects
+        assert fetched.wait(timeout=5)
+        assert [obj["id"] for obj, _ in objects] == ["item-2", "item-3"]
+
+
+@pytest.mark.parametrize("prefetch", [1, 2])
+def test_iterate_objects_prefetch_holds_at_most_prefetch_pages(prefetch):
+    """Test that no more than `prefetch` pages are fetched ahead of the current one."""
+    responses = _paged_responses(6)
+    linter = ApiLinter(
+        source="https://example.com/items?page=1",
+        object_list_key="features",
+        pages=6,
+        prefetch=prefetch,
+    )
+    fetched = []
+    ahead = threading.Event()
+
+    def fetch(url):
+        fetched.append(url)
+        if len(fetched) == 1 + prefetch:
+            ahead.set()
+        return responses[url]
+
+    with mock.patch.object(linter, "_fetch_and_parse", side_effect=fetch):
+        objects = linter.iterate_objects()
+        next(objects)
+        assert ahead.wait(timeout=5)
+        time.sleep(0.3)
+        # The current page and `prefetch` upcoming pages, nothing more
+        assert len(fetched) == 1 + prefetch
+        assert len(list(objects)) == 5
+
+
+def test_iterate_objects_prefetch_raises_fetch_errors():
+    """Test that an error fetching a page in the background reaches the caller."""
+    responses = _paged_responses(2)
+    del responses["https://example.com/items?page=2"]
+    linter = ApiLinter(
+        source="https://example.com/items?page=1",
+        object_list_key="features",
+        pages=2,
+        prefetch=2,
+    )
+
+    with mock.patch.object(
+        linter, "_fetch_and_parse", side_effect=responses.__getitem__
+    ):
+        with pytest.raises(KeyError):
+            list(linter.iterate_objects())
+
+
+def _geometry_feature_collection(tmp_path):
+    """Write a FeatureCollection where the second and fourth items have geometry errors."""
+    rings = [
+        [[10.0, -10.0], [20.0, -10.0], [20.0, 10.0], [10.0, 10.0], [10.0, -10.0]],
+        # Reversed coordinates
+        [[120.0, 10.0], [130.0, 10.0], [130.0, 20.0], [120.0, 10.0]],
+        [[30.0, 40.0], [31.0, 40.0], [31.0, 41.0], [30.0, 40.0]],
+        # A latitude outside of the valid range
+        [[30.0, 40.0], [31.0, 95.0], [31.0, 41.0], [30.0, 40.0]],
+    ]
+    features = [
+        {
+            "stac_version": "1.0.0",
+            "stac_extensions": [],
+            "type": "Feature",
+            "id": f"item-{index}",
+            "bbox": [
+                min(lon for lon, _ in ring),
+                min(lat for _, lat in ring),
+                max(lon for lon, _ in ring),
+                max(lat for _, lat in ring),
+            ],
+            "geometry": {"type": "Polygon", "coordinates": [ring]},
+            "properties": {"datetime": "2023-01-01T00:00:00Z"},
+            "links": [],
+            "assets": {},
+        }
+        for index, ring in enumerate(rings)
+    ]
+    path = tmp_path / "feature_collection.json"
+    path.write_text(json.dumps({"type": "FeatureCollection", "features": features}))
+    return str(path), [feature["id"] for feature in features]
+
+
+@pytest.mark.parametrize("stream,workers", [(False, 1), (True, 1), (False, 2)])
+def test_lint_all_with_batch_geometry_matches_per_item(tmp_path, stream, workers):
+    """Test that checking geometries in batches gives the per item results."""
+    source, _ = _geometry_feature_collection(tmp_path)
+    expected = ApiLinter(source=source, object_list_key="features").lint_all()
+    linter = ApiLinter(
+        source=source,
+        object_list_key="features",
+        stream=stream,
+        workers=workers,
+        batch_geometry=True,
+        geometry_batch_size=3,
+    )
+
+    results = linter.lint_all()
+
+    for result in expected:
+        result.pop("original_object", None)
+    for result in results:
+        result.pop("original_object", None)
+    assert results == expected
+    assert [bool(result["geometry_errors"]) for result in results] == [
+        False,
+        True,
+        False,
+        True,
+    ]
+
+
+def test_fast_lint_all_with_batch_geometry(tmp_path):
+    """Test that geometry errors are attributed to their items in fast mode."""
+    source, ids = _geometry_feature_collection(tmp_path)
+
+    fast_results = ApiLinter(
+        source=source, object_list_key="features", fast=True
+    ).lint_all()
+    results = ApiLinter(
+        source=source, object_list_key="features", fast=True, batch_geometry=True
+    ).lint_all()
+
+    assert all(result["geometry_errors"] == [] for result in fast_results)
+    errors = {
+        result["path"].split("/")[-1]: result["geometry_errors"] for result in results
+    }
+    assert list(errors) == ids
+    assert errors[ids[0]] == [] and errors[ids[2]] == []
+    assert (
+        "Geometry coordinates may be in the wrong order (required order: longitude, latitude)"
+        in errors[ids[1]]
+    )
+    assert "Invalid coordinate: [" in " ".join(errors[ids[3]])
+
+
+def test_fast_lint_objects_with_batch_geometry(tmp_path):
+    """Test that objects linted one by one in fast mode keep their geometry errors."""
+    source, _ = _geometry_feature_collection(tmp_path)
+    expected = ApiLinter(
+        source=source, object_list_key="features", fast=True, batch_geometry=True
+    ).lint_all()
+
+    # With a result store, objects are linted one by one instead of with FastValidator
+    with ResultStore(str(tmp_path / "results.sqlite")) as store:
+        results = ApiLinter(
+            source=source,
+            object_list_key="features",
+            fast=True,
+            batch_geometry=True,
+            result_store=store,
+        ).lint_all()
+
+    assert [result["geometry_errors"] for result in results] == [
+        result["geometry_errors"] for result in expected
+    ]
+    assert [bool(result["geometry_errors"]) for result in results] == [
+        False,
+        True,
+        False,
+        True,
+    ]
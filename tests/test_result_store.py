@@ -0,0 +1,161 @@
+import asyncio
+import json
+from unittest import mock
+
+import pytest
+
+from stac_check.api_lint import ApiLinter
+from stac_check.async_api_lint import AsyncApiLinter
+from stac_check.crawler import crawl_catalog
+from stac_check.document import load_document
+from stac_check.lint import Linter
+from stac_check.result_store import ResultStore, content_digest
+
+FEATURE_COLLECTION = "sample_files/1.0.0/feature_collection.json"
+CATALOG = "sample_files/1.0.0/catalog-with-bad-item.json"
+
+
+@pytest.fixture
+def store(tmp_path):
+    with ResultStore(str(tmp_path / "results.sqlite")) as result_store:
+        yield result_store
+
+
+def lint_object(obj, obj_url, **kwargs):
+    return {"path": obj_url, "valid_stac": True, "version": "1.0.0"}
+
+
+class FakeLinter:
+    """Stands in for Linter in crawls, recording the objects it lints."""
+
+    linted = []
+
+    def __init__(self, document, **kwargs):
+        self.linted.append(document.source)
+        self.message = {"path": document.source, "valid_stac": True}
+        self.best_practices_msg = ["A best practice"]
+        self.geometry_errors_msg = []
+        self.pydantic = False
+
+
+def test_content_digest_ignores_formatting():
+    assert content_digest({"a": 1, "b": [1, 2]}) == content_digest(
+        json.loads('{ "b": [1,2], "a": 1 }')
+    )
+    assert content_digest({"a": 1}) != content_digest({"a": 2})
+
+
+def test_key_depends_on_inputs(store):
+    config = {"linting": {"searchable_identifiers": True}}
+    key = store.key("object", {"id": "a"}, "a.json", {"fast": False}, config)
+
+    assert key == store.key(
+        "object", {"id": "a"}, "a.json", {"fast": False}, dict(config)
+    )
+    assert key != store.key("object", {"id": "b"}, "a.json", {"fast": False}, config)
+    assert key != store.key("object", {"id": "a"}, "b.json", {"fast": False}, config)
+    assert key != store.key("object", {"id": "a"}, "a.json", {"fast": True}, config)
+    assert key != store.key("object", {"id": "a"}, "a.json", {"fast": False}, {})
+    store.validator_version = "0.0.0"
+    assert key != store.key("object", {"id": "a"}, "a.json", {"fast": False}, config)
+
+
+def test_transient_failures_are_not_stored(store, tmp_path):
+    store.put_many(
+        [
+            ("valid", {"valid_stac": True}),
+            (
+                "invalid",
+                {"valid_stac": False, "error_type": "JSONSchemaValidationError"},
+            ),
+            ("fetch-error", {"valid_stac": False, "error_type": "HTTPError"}),
+        ]
+    )
+    store.close()
+
+    with ResultStore(store.path) as reopened:
+        assert reopened.get_many(["valid", "invalid", "fetch-error"]) == [
+            {"valid_stac": True},
+            {"valid_stac": False, "error_type": "JSONSchemaValidationError"},
+            None,
+        ]
+        assert (reopened.hits, reopened.misses) == (2, 1)
+
+
+def test_linter_reuses_stored_message(store):
+    message = {"path": "sample_files/1.0.0/core-item.json", "valid_stac": True}
+    with mock.patch.object(
+        Linter, "_validate_document", return_value=message
+    ) as validate:
+        Linter("sample_files/1.0.0/core-item.json", result_store=store).message
+        linter = Linter("sample_files/1.0.0/core-item.json", result_store=store)
+        linter.message
+        # Other options validate again
+        Linter(
+            "sample_files/1.0.0/core-item.json", links=True, result_store=store
+        ).message
+
+    assert validate.call_count == 2
+    assert linter.message == message
+
+
+def test_crawl_reuses_unchanged_objects(store):
+    document = load_document(CATALOG)
+    FakeLinter.linted = []
+
+    first = crawl_catalog(document, FakeLinter, result_store=store)
+    second = crawl_catalog(document, FakeLinter, result_store=store)
+
+    assert len(FakeLinter.linted) == 3
+    assert [result.path for result in second] == [result.path for result in first]
+    assert [result.message for result in second] == [result.message for result in first]
+    assert all(result.best_practices == ["A best practice"] for result in second)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_api_linter_lints_changed_objects(store, tmp_path, workers):
+    with open(FEATURE_COLLECTION) as f:
+        collection = json.load(f)
+    source = tmp_path / "items.json"
+    source.write_text(json.dumps(collection))
+
+    def run(lint_func):
+        with mock.patch("stac_check.api_lint._lint_object", lint_func):
+            return ApiLinter(
+                source=str(source),
+                object_list_key="features",
+                workers=workers,
+                chunk_size=2,
+                result_store=store,
+            ).lint_all()
+
+    first = run(lint_object)
+    collection["features"][3]["properties"]["changed"] = True
+    source.write_text(json.dumps(collection))
+    second = run(lint_object)
+
+    assert [result["path"] for result in second] == [result["path"] for result in first]
+    assert store.misses == len(first) + 1
+    assert store.hits == len(first) - 1
+
+
+def test_async_api_linter_reuses_results(store):
+    calls = []
+
+    def counting_lint_object(obj, obj_url, **kwargs):
+        calls.append(obj_url)
+        return lint_object(obj, obj_url)
+
+    with mock.patch(
+        "stac_check.async_api_lint._lint_object", side_effect=counting_lint_object
+    ):
+        for _ in range(2):
+            linter = AsyncApiLinter(
+                source=FEATURE_COLLECTION,
+                object_list_key="features",
+                result_store=store,
+            )
+            results = asyncio.run(linter.lint_all())
+
+    assert len(calls) == len(results) == 10
+    assert all("original_object" in result for result in results)
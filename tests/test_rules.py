@@ -0,0 +1,124 @@
+import copy
+from unittest.mock import patch
+
+import pytest
+
+from stac_check.lint import Linter
+from stac_check.rules import (
+    execution_plan,
+    register_rule,
+    registered_rules,
+    unregister_rule,
+)
+
+COLLECTION = "sample_files/1.0.0/collection-no-title.json"
+ITEM = "sample_files/1.0.0/core-item.json"
+
+
+@pytest.fixture
+def config():
+    return Linter.parse_config()
+
+
+def plan_keys(config, asset_type):
+    return [rule.key for rule in execution_plan(config, asset_type)]
+
+
+def test_builtin_rules_keep_report_order():
+    assert [rule.key for rule in registered_rules()] == [
+        "searchable_identifiers",
+        "percent_encoded",
+        "check_item_id",
+        "check_catalog_id",
+        "check_summaries",
+        "datetime_null",
+        "check_unlocated",
+        "null_geometry",
+        "bbox_geometry_mismatch",
+        "bloated_links",
+        "bloated_metadata",
+        "check_thumbnail",
+        "check_links_title",
+        "check_links_self",
+        "geometry_coordinates_order",
+        "geometry_coordinates_definite_errors",
+        "check_bbox_antimeridian",
+    ]
+
+
+def test_plan_depends_on_asset_type(config):
+    item_plan = plan_keys(config, "ITEM")
+    collection_plan = plan_keys(config, "COLLECTION")
+    catalog_plan = plan_keys(config, "CATALOG")
+
+    assert "searchable_identifiers" in item_plan
+    assert "check_thumbnail" in item_plan
+    assert "check_links_title" not in item_plan
+    assert "check_summaries" in collection_plan
+    assert "check_summaries" not in catalog_plan
+    assert "check_item_id" not in catalog_plan
+    assert "check_links_title" in catalog_plan
+
+
+def test_plan_skips_disabled_rules(config):
+    config["linting"]["links_title"] = False
+    config["geometry_validation"]["geometry_coordinates_definite_errors"] = False
+
+    keys = plan_keys(config, "COLLECTION")
+    assert "check_links_title" not in keys
+    assert "geometry_coordinates_definite_errors" not in keys
+    assert "geometry_coordinates_order" in keys
+
+    # The master switch disables every geometry rule
+    config["geometry_validation"]["enabled"] = False
+    keys = plan_keys(config, "COLLECTION")
+    assert "geometry_coordinates_order" not in keys
+    assert "bbox_geometry_mismatch" not in keys
+
+
+def test_plan_is_shared_by_equivalent_configs(config):
+    assert execution_plan(config, "ITEM") is execution_plan(
+        copy.deepcopy(config), "ITEM"
+    )
+
+
+def test_disabled_rule_is_not_checked(config):
+    config["linting"]["links_title"] = False
+    linter = Linter(COLLECTION, config=config)
+
+    with patch.object(Linter, "check_links_title_field") as check:
+        assert "check_links_title" not in linter.best_practices_dict
+        check.assert_not_called()
+
+    assert "check_links_title" in Linter(COLLECTION).best_practices_dict
+
+
+def test_custom_rule():
+    @register_rule("missing_doi", asset_types=["COLLECTION"], fields=["id"])
+    def missing_doi(linter):
+        if "sci:doi" not in linter.data:
+            return [f"Collection '{linter.object_id}' should have a DOI"]
+
+    try:
+        collection = Linter(COLLECTION)
+        item = Linter(ITEM)
+
+        assert list(collection.best_practices_dict)[-1] == "missing_doi"
+        assert (
+            f"Collection '{collection.object_id}' should have a DOI"
+            in collection.best_practices_msg
+        )
+        assert "missing_doi" not in item.best_practices_dict
+
+        # The rule is switched off like the built-in ones
+        config = Linter.parse_config()
+        config["linting"]["missing_doi"] = False
+        assert (
+            "missing_doi" not in Linter(COLLECTION, config=config).best_practices_dict
+        )
+    finally:
+        unregister_rule("missing_doi")
+
+    assert "missing_doi" not in Linter(COLLECTION).best_practices_dict
+    with pytest.raises(KeyError):
+        unregister_rule("missing_doi")
@@ -0,0 +1,221 @@
+import json
+
+import pytest
+from click.testing import CliRunner
+from stac_validator import fast_validator, utilities
+
+from stac_check import schema_bundle
+from stac_check.api_lint import ApiLinter
+from stac_check.cli import cache as cli_cache
+from stac_check.cli import main as cli_main
+from stac_check.lint import Linter
+from stac_check.result_store import ResultStore
+from stac_check.schema_bundle import (
+    SchemaBundle,
+    build_schema_bundle,
+    bundle_root_urls,
+    load_schema_bundle,
+)
+
+ITEM_SCHEMA_URL = "https://schemas.stacspec.org/v1.0.0/item-spec/json-schema/item.json"
+EXTENSION_URL = "https://example.com/extension/v1.0.0/schema.json"
+DRAFT_07 = "http://json-schema.org/draft-07/schema#"
+
+SCHEMAS = {
+    ITEM_SCHEMA_URL: {
+        "$schema": DRAFT_07,
+        "$id": ITEM_SCHEMA_URL,
+        "allOf": [
+            {"$ref": "basics.json#/definitions/id"},
+            {"$ref": "https://geojson.org/schema/Feature.json"},
+        ],
+    },
+    "https://schemas.stacspec.org/v1.0.0/item-spec/json-schema/basics.json": {
+        "$schema": DRAFT_07,
+        "definitions": {"id": {"type": "object", "required": ["id"]}},
+    },
+    "https://geojson.org/schema/Feature.json": {"$schema": DRAFT_07, "type": "object"},
+    EXTENSION_URL: {
+        "$schema": DRAFT_07,
+        "type": "object",
+        "required": ["properties"],
+        "properties": {"properties": {"type": "object", "required": ["example:value"]}},
+    },
+}
+
+
+def fetch(url):
+    # Core schemas that are not listed above accept any object
+    return SCHEMAS.get(url, {"$schema": DRAFT_07, "type": "object"})
+
+
+def offline(url):
+    raise AssertionError(f"{url} was fetched during validation")
+
+
+def make_item(item_id="item", extensions=(EXTENSION_URL,), value=True):
+    properties = {"datetime": "2023-01-01T00:00:00Z"}
+    if value:
+        properties["example:value"] = 1
+    return {
+        "type": "Feature",
+        "stac_version": "1.0.0",
+        "stac_extensions": list(extensions),
+        "id": item_id,
+        "geometry": None,
+        "properties": properties,
+        "links": [],
+        "assets": {},
+    }
+
+
+@pytest.fixture
+def bundle_path(tmp_path, monkeypatch):
+    """Build a bundle of the schemas above, then forbid any other schema fetch."""
+    path = str(tmp_path / "schemas.bundle")
+    build_schema_bundle(path, bundle_root_urls(["1.0.0"], [EXTENSION_URL]), fetch)
+    monkeypatch.setattr(fast_validator, "fetch_schema", offline)
+    monkeypatch.setattr(utilities, "_schema_cache", offline)
+    return path
+
+
+def test_build_schema_bundle_follows_refs(tmp_path):
+    path = str(tmp_path / "schemas.bundle")
+
+    urls = build_schema_bundle(path, [ITEM_SCHEMA_URL, EXTENSION_URL], fetch)
+
+    assert sorted(urls) == sorted(SCHEMAS)
+    bundle = SchemaBundle(path)
+    assert len(bundle) == 4
+    assert f"{ITEM_SCHEMA_URL}#/definitions/id" in bundle
+    assert bundle.get(EXTENSION_URL) == SCHEMAS[EXTENSION_URL]
+    with pytest.raises(LookupError, match="is not in the schema bundle"):
+        bundle.get("https://example.com/missing.json")
+
+
+def test_schema_bundle_rejects_other_files(tmp_path):
+    for content in (b"", b'{"type": "Feature"}'):
+        path = tmp_path / "other.json"
+        path.write_bytes(content)
+        with pytest.raises(ValueError, match="is not a schema bundle"):
+            SchemaBundle(str(path))
+
+
+def test_load_schema_bundle_once(bundle_path, monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+
+    assert load_schema_bundle(bundle_path) is load_schema_bundle("schemas.bundle")
+
+
+def test_linter_resolves_schemas_from_bundle(bundle_path):
+    valid = Linter(make_item(), schema_bundle=bundle_path)
+    invalid = Linter(make_item(value=False), schema_bundle=bundle_path)
+
+    assert valid.valid_stac is True
+    assert invalid.valid_stac is False
+    assert "example:value" in invalid.error_msg
+    # The previous fetch functions are restored
+    assert utilities._schema_cache is offline
+    assert schema_bundle._active is None
+
+
+def test_linter_reports_schemas_missing_from_bundle(bundle_path):
+    linter = Linter(
+        make_item(extensions=["https://example.com/other/v1.0.0/schema.json"]),
+        schema_bundle=bundle_path,
+    )
+
+    assert linter.valid_stac is False
+    assert "is not in the schema bundle" in linter.error_msg
+
+
+@pytest.mark.parametrize("fast", [False, True])
+def test_api_linter_resolves_schemas_from_bundle(bundle_path, tmp_path, fast):
+    source = tmp_path / "items.json"
+    source.write_text(
+        json.dumps(
+            {
+                "type": "FeatureCollection",
+                "features": [make_item("a"), make_item("b", value=False)],
+            }
+        )
+    )
+
+    results = ApiLinter(
+        source=str(source),
+        object_list_key="features",
+        fast=fast,
+        schema_bundle=bundle_path,
+    ).lint_all()
+
+    assert [result["valid_stac"] for result in results] == [True, False]
+
+
+def test_cli_builds_and_uses_schema_bundle(tmp_path, monkeypatch):
+    monkeypatch.setattr(fast_validator, "fetch_schema", fetch)
+    path = str(tmp_path / "schemas.bundle")
+    source = tmp_path / "item.json"
+    source.write_text(json.dumps(make_item()))
+    runner = CliRunner()
+
+    result = runner.invoke(cli_cache, ["bundle", path, str(source)])
+
+    assert result.exit_code == 0, result.output
+    assert f"Bundled 6 schemas in {path}" in result.output
+
+    monkeypatch.setattr(fast_validator, "fetch_schema", offline)
+    monkeypatch.setattr(utilities, "_schema_cache", offline)
+    result = runner.invoke(cli_main, [str(source), "--schema-bundle", path])
+
+    assert result.exit_code == 0, result.output
+
+
+@pytest.mark.parametrize("item_collection", [False, True])
+def test_cli_fast_reports_schemas_missing_from_bundle(
+    bundle_path, tmp_path, item_collection
+):
+    item = make_item(extensions=["https://example.com/other/v1.0.0/schema.json"])
+    source = tmp_path / "item.json"
+    source.write_text(
+        json.dumps(
+            {"type": "FeatureCollection", "features": [item]}
+            if item_collection
+            else item
+        )
+    )
+
+    result = CliRunner().invoke(
+        cli_main, [str(source), "--fast", "--schema-bundle", bundle_path]
+    )
+
+    assert isinstance(result.exception, SystemExit)
+    assert result.exit_code == 1, result.output
+    assert "is not in the schema bundle" in result.output
+
+
+def test_stored_results_depend_on_the_schema_bundle(bundle_path, tmp_path):
+    item = make_item(value=False)
+
+    with ResultStore(str(tmp_path / "results.sqlite")) as store:
+        assert Linter(item, result_store=store).valid_stac is False
+        assert (
+            Linter(item, schema_bundle=bundle_path, result_store=store).valid_stac
+            is False
+        )
+        assert store.hits == 0
+
+        # A bundle rebuilt without the extension requirement is a different bundle
+        schemas = dict(SCHEMAS)
+        schemas[EXTENSION_URL] = {"$schema": DRAFT_07, "type": "object"}
+        build_schema_bundle(
+            bundle_path,
+            bundle_root_urls(["1.0.0"], [EXTENSION_URL]),
+            lambda url: schemas.get(url, {"$schema": DRAFT_07, "type": "object"}),
+        )
+        schema_bundle._open_schema_bundle.cache_clear()
+
+        assert (
+            Linter(item, schema_bundle=bundle_path, result_store=store).valid_stac
+            is True
+        )
+        assert store.hits == 0
@@ -0,0 +1,286 @@
+import json
+import os
+
+import fastjsonschema
+import pytest
+from click.testing import CliRunner
+from stac_validator import fast_validator, utilities
+
+from stac_check import schema_cache
+from stac_check.cli import cache as cli_cache
+from stac_check.cli import main as cli_main
+from stac_check.fast_validator_wrapper import (
+    fast_validation_message,
+    translate_fast_error,
+)
+from stac_check.lint import Linter
+from stac_check.schema_cache import SchemaCache, schema_cache_enabled
+
+ITEM_SCHEMA_URL = "https://schemas.stacspec.org/v1.0.0/item-spec/json-schema/item.json"
+EXTENSION_URL = "https://example.com/extension/v1.0.0/schema.json"
+
+SCHEMAS = {
+    ITEM_SCHEMA_URL: {
+        "type": "object",
+        "required": ["id", "geometry"],
+        "properties": {"id": {"$ref": "https://example.com/id.json"}},
+    },
+    "https://example.com/id.json": {"type": "string"},
+    EXTENSION_URL: {"type": "object", "required": ["properties"]},
+}
+
+
+@pytest.fixture
+def fetched(monkeypatch):
+    """Serve the schemas above instead of fetching them, recording each fetch."""
+    urls = []
+
+    def fetch_schema(uri):
+        urls.append(uri)
+        return SCHEMAS[uri]
+
+    monkeypatch.setattr(fast_validator, "fetch_schema", fetch_schema)
+    return urls
+
+
+def test_schema_roundtrip_keyed_by_version(schema_cache_dir):
+    cache = SchemaCache()
+    cache.put_schema(EXTENSION_URL, SCHEMAS[EXTENSION_URL])
+
+    assert cache.root.startswith(str(schema_cache_dir))
+    assert SchemaCache().get_schema(EXTENSION_URL) == SCHEMAS[EXTENSION_URL]
+    assert SchemaCache(validator_version="0.0.0").get_schema(EXTENSION_URL) is None
+    assert cache.get_schema("https://example.com/missing.json") is None
+
+
+def test_compiled_validator_reused_across_instances(fetched):
+    validator, cached = SchemaCache().load_validator("Item", "1.0.0", [EXTENSION_URL])
+
+    assert cached is False
+    assert sorted(fetched) == sorted(SCHEMAS)
+    with pytest.raises(fastjsonschema.JsonSchemaValueException):
+        validator({"id": 1, "geometry": None, "properties": {}})
+
+    # A new process reads the compiled code and fetches nothing
+    fetched.clear()
+    validator, cached = SchemaCache().load_validator("Item", "1.0.0", [EXTENSION_URL])
+
+    assert cached is True
+    assert fetched == []
+    assert validator({"id": "a", "geometry": None, "properties": {}})
+    with pytest.raises(fastjsonschema.JsonSchemaValueException):
+        validator({"id": "a", "geometry": None})
+
+
+def test_corrupt_validator_is_compiled_again(fetched):
+    cache = SchemaCache()
+    path = cache.validator_path("Item", "1.0.0", [])
+    cache.load_validator("Item", "1.0.0", [])
+    with open(path, "w") as f:
+        f.write("def validate(:")
+
+    validator, cached = SchemaCache().load_validator("Item", "1.0.0", [])
+
+    assert cached is False
+    assert validator({"id": "a", "geometry": None})
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions")
+@pytest.mark.parametrize("shared", ["file", "directory"])
+def test_shared_validator_is_not_run(fetched, shared):
+    cache = SchemaCache()
+    path = cache.validator_path("Item", "1.0.0", [])
+    cache.load_validator("Item", "1.0.0", [])
+    with open(path, "w") as f:
+        f.write("raise RuntimeError('untrusted code')")
+    os.chmod(path if shared == "file" else os.path.dirname(path), 0o777)
+
+    validator, cached = SchemaCache().load_validator("Item", "1.0.0", [])
+
+    assert cached is False
+    assert validator({"id": "a", "geometry": None})
+
+
+def test_uncompilable_validator_falls_back_to_stac_valid(monkeypatch):
+    def compile_to_code(definition, handlers):
+        raise fastjsonschema.JsonSchemaDefinitionException("unsupported")
+
+    monkeypatch.setattr(fastjsonschema, "compile_to_code", compile_to_code)
+    fallback = object()
+    monkeypatch.setattr(
+        fast_validator,
+        "get_validator",
+        lambda stac_type, stac_version, extensions: (fallback, False),
+    )
+
+    assert SchemaCache().get_validator("Item", "1.0.0", []) == (fallback, False)
+
+    monkeypatch.setattr(fastjsonschema, "compile_to_code", None)
+    with pytest.raises(TypeError):
+        SchemaCache().get_validator("Item", "1.0.0", [])
+
+
+def test_translate_fast_error():
+    def error(message, name, value=None):
+        return fastjsonschema.JsonSchemaValueException(message, value, name)
+
+    assert translate_fast_error(error("data.id must be string", "data.id")) == (
+        "data.id must be string"
+    )
+    assert translate_fast_error(
+        error(
+            "data.collection must not be valid by disallowed definition",
+            "data.collection",
+        )
+    ) == ("STAC Spec Violation: Missing {'rel': 'collection'} in links array.")
+    assert translate_fast_error(
+        error("data.bbox must not be valid by disallowed definition", "data.bbox", [])
+    ) == ("data.bbox violated a 'not' rule. Value: []")
+
+
+def test_fast_validation_uses_active_cache(fetched):
+    item = {"type": "Feature", "stac_version": "1.0.0", "id": 1, "geometry": None}
+
+    with schema_cache_enabled() as cache:
+        result = fast_validation_message(item)
+
+    assert result["invalid_objects"] == 1
+    assert result["errors"][0]["error_message"] == "data.id must be string"
+    assert result["setup_time_ms"] > 0
+    assert cache.get_schema(ITEM_SCHEMA_URL) == SCHEMAS[ITEM_SCHEMA_URL]
+    assert schema_cache._active is None
+
+
+def test_schema_cache_enabled_wraps_stac_valid_fetch(monkeypatch):
+    urls = []
+
+    def fetch(input_path):
+        urls.append(input_path)
+        return SCHEMAS[input_path]
+
+    monkeypatch.setattr(utilities, "_schema_cache", fetch)
+
+    with schema_cache_enabled():
+        assert utilities.fetch_and_parse_schema(EXTENSION_URL) == SCHEMAS[EXTENSION_URL]
+    assert utilities._schema_cache is fetch
+
+    # Another run is served from disk
+    with schema_cache_enabled():
+        assert utilities.fetch_and_parse_schema(EXTENSION_URL) == SCHEMAS[EXTENSION_URL]
+    assert urls == [EXTENSION_URL]
+
+
+def test_init_worker_enables_parent_cache(monkeypatch, schema_cache_dir):
+    monkeypatch.setattr(utilities, "_schema_cache", utilities._schema_cache)
+    monkeypatch.setattr(schema_cache, "_active", None)
+
+    schema_cache.init_worker(None)
+    assert schema_cache.active_cache_dir() is None
+
+    with schema_cache_enabled():
+        cache_dir = schema_cache.active_cache_dir()
+    schema_cache.init_worker(cache_dir)
+
+    assert cache_dir == str(schema_cache_dir)
+    assert schema_cache.active_cache_dir() == cache_dir
+
+
+def test_cli_cache_warm_and_clear(fetched, tmp_path):
+    source = tmp_path / "item.json"
+    source.write_text(
+        json.dumps(
+            {
+                "type": "Feature",
+                "stac_version": "1.0.0",
+                "stac_extensions": [EXTENSION_URL],
+                "id": "a",
+            }
+        )
+    )
+    runner = CliRunner()
+
+    result = runner.invoke(cli_cache, ["warm", str(source)])
+
+    assert result.exit_code == 0, result.output
+    assert "Cached 1 validators" in result.output
+    assert SchemaCache().load_validator("Item", "1.0.0", [EXTENSION_URL])[1] is True
+
+    result = runner.invoke(cli_cache, ["clear"])
+
+    assert result.exit_code == 0
+    assert "Removed 4 files" in result.output
+    assert SchemaCache().get_schema(EXTENSION_URL) is None
+
+
+def test_cli_cache_warm_reports_failures(monkeypatch):
+    def fetch_schema(uri):
+        raise RuntimeError(f"Could not resolve schema: {uri}")
+
+    monkeypatch.setattr(fast_validator, "fetch_schema", fetch_schema)
+
+    result = CliRunner().invoke(cli_cache, ["warm", "--stac-version", "1.0.0"])
+
+    assert result.exit_code == 1
+    assert "Could not compile Item 1.0.0" in result.output
+    assert "Cached 0 validators" in result.output
+
+
+def test_cli_lints_file_named_cache(fetched, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "cache").write_text(
+        json.dumps(
+            {
+                "type": "Feature",
+                "stac_version": "1.0.0",
+                "id": "a",
+                "geometry": None,
+            }
+        )
+    )
+
+    result = CliRunner().invoke(cli_main, ["cache", "--fast"])
+
+    assert result.exit_code == 0, result.output
+    assert "Passed: 1/1" in result.output
+
+
+def test_cli_schema_cache_is_opt_in(fetched, schema_cache_dir, tmp_path):
+    source = tmp_path / "item.json"
+    source.write_text(
+        json.dumps(
+            {
+                "type": "Feature",
+                "stac_version": "1.0.0",
+                "id": "a",
+                "geometry": None,
+            }
+        )
+    )
+    runner = CliRunner()
+
+    result = runner.invoke(cli_main, [str(source), "--fast"])
+
+    assert result.exit_code == 0, result.output
+    assert not schema_cache_dir.exists()
+
+    result = runner.invoke(cli_main, [str(source), "--fast", "--schema-cache"])
+
+    assert result.exit_code == 0, result.output
+    assert SchemaCache().load_validator("Item", "1.0.0", [])[1] is True
+
+
+def test_fast_linter_reports_setup_time(fetched, tmp_path):
+    source = tmp_path / "item.json"
+    source.write_text(
+        json.dumps(
+            {"type": "Feature", "stac_version": "1.0.0", "id": 1, "geometry": None}
+        )
+    )
+
+    with schema_cache_enabled():
+        linter = Linter(str(source), fast=True)
+        assert linter.valid_stac is False
+
+    assert linter.error_msg == "data.id must be string"
+    assert linter.fast_setup_time > 0
+    assert linter.fast_exec_time > 0
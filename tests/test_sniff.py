@@ -0,0 +1,84 @@
+import gzip
+import json
+
+import pytest
+
+from stac_check.cli import is_item_collection
+from stac_check.document import load_document
+from stac_check.sniff import sniff_document
+
+FEATURE_COLLECTION = "sample_files/1.0.0/feature_collection.json"
+
+
+def write(tmp_path, text, name="doc.json"):
+    path = tmp_path / name
+    path.write_text(text)
+    return str(path)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ('{"type": "FeatureCollection", "features": [{"id": "a"}]}', True),
+        ('﻿{"type":"FeatureCollection","features":[1]}', True),
+        ('{"type": "FeatureCollection", "features": [ ]}', False),
+        ('{"type": "FeatureCollection", "features": {}}', False),
+        ('{"type": "FeatureCollection"}', False),
+        ('{"type": "Feature", "features": [1]}', False),
+        ('{"type": "Collection", "id": "x"', False),
+        (
+            '{"links": [{"href": "a\\"]}"}], "n": -1.5e3, "ok": true,'
+            ' "features": [{"x": "[{"}], "type": "FeatureCollection"}',
+            True,
+        ),
+        ("{}", False),
+    ],
+)
+def test_sniff_item_collection(tmp_path, text, expected):
+    with sniff_document(write(tmp_path, text), chunk_size=4) as sniffed:
+        assert sniffed.is_item_collection is expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    ['["not", "an", "object"]', '{"type": "FeatureCollection", "features": [', ""],
+)
+def test_sniff_undecided(tmp_path, text):
+    with sniff_document(write(tmp_path, text), chunk_size=4) as sniffed:
+        assert sniffed.is_item_collection is None
+
+
+def test_sniff_reads_a_bounded_prefix(tmp_path):
+    features = [{"id": str(i), "properties": {"x": "y" * 100}} for i in range(1000)]
+    path = write(
+        tmp_path, json.dumps({"features": features, "type": "FeatureCollection"})
+    )
+
+    with sniff_document(path, limit=1024, chunk_size=256) as sniffed:
+        # The type follows a large features array, beyond the prefix
+        assert sniffed.is_item_collection is None
+        assert len(sniffed.prefix) == 1024
+    assert is_item_collection(path) is True
+
+
+def test_load_continues_from_prefix(tmp_path):
+    path = tmp_path / "items.json.gz"
+    with open(FEATURE_COLLECTION, "rb") as f:
+        path.write_bytes(gzip.compress(f.read()))
+
+    sniffed = sniff_document(str(path), chunk_size=64)
+    document = load_document(sniffed)
+
+    assert sniffed.is_item_collection is True
+    assert len(sniffed.prefix) < 1024
+    assert document.source == str(path)
+    assert document.data == load_document(FEATURE_COLLECTION).data
+
+
+def test_sniff_url(requests_mock):
+    url = "https://example.com/items"
+    requests_mock.get(url, content=b'{"type": "FeatureCollection", "features": [{}]}')
+
+    with sniff_document(url) as sniffed:
+        assert sniffed.is_item_collection is True
+        assert sniffed.error is None
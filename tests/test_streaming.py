@@ -0,0 +1,189 @@
+import io
+import json
+import sys
+
+import pytest
+from click.testing import CliRunner
+
+from stac_check.api_lint import ApiLinter
+from stac_check.cli import main as cli_main
+from stac_check.display_messages import stream_item_collection_message
+from stac_check.streaming import (
+    is_ndjson,
+    iter_features,
+    iter_ndjson_lines,
+    iter_stream_features,
+)
+
+FEATURE_COLLECTION = "sample_files/1.0.0/feature_collection.json"
+
+
+def test_iter_features_matches_json_load():
+    with open(FEATURE_COLLECTION) as f:
+        expected = json.load(f)["features"]
+
+    assert list(iter_features(FEATURE_COLLECTION)) == expected
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64])
+def test_iter_stream_features_small_chunks(chunk_size):
+    data = {
+        "type": "FeatureCollection",
+        "links": [{"rel": "self", "href": "https://example.com"}],
+        "features": [{"id": "a", "bbox": [1.5, -2, 3e10]}, {"id": "b"}],
+        "numberMatched": 12345,
+    }
+    stream = io.StringIO(json.dumps(data, indent=2))
+
+    assert list(iter_stream_features(stream, chunk_size)) == data["features"]
+
+
+@pytest.mark.parametrize("text", ["{}", '{"features": []}', '{"features": null}'])
+def test_iter_stream_features_no_features(text):
+    assert list(iter_stream_features(io.StringIO(text))) == []
+
+
+@pytest.mark.parametrize("text", ["[]", '{"features": [{"id": "a"}'])
+def test_iter_stream_features_invalid(text):
+    with pytest.raises(ValueError):
+        list(iter_stream_features(io.StringIO(text), 4))
+
+
+def test_api_linter_stream_matches_regular_lint():
+    regular = ApiLinter(source=FEATURE_COLLECTION, object_list_key="features")
+    streamed = ApiLinter(
+        source=FEATURE_COLLECTION, object_list_key="features", stream=True
+    )
+
+    expected = regular.lint_all()
+    results = streamed.lint_all()
+
+    assert len(results) == len(expected)
+    assert all("original_object" not in result for result in results)
+    for result, expected_result in zip(results, expected):
+        expected_result.pop("original_object")
+        assert result == expected_result
+    assert streamed.version == regular.version
+
+
+@pytest.mark.parametrize("fast", [False, True])
+def test_stream_display_consumes_results_lazily(capsys, fast):
+    linter = ApiLinter(
+        source=FEATURE_COLLECTION, object_list_key="features", stream=True, fast=fast
+    )
+    output_before_read = []
+
+    def results():
+        for msg in linter.iter_results():
+            output_before_read.append(capsys.readouterr().out)
+            yield msg
+
+    assert stream_item_collection_message(linter, results()) is True
+
+    summary = capsys.readouterr().out
+    assert len(output_before_read) == 10
+    assert "Passed: 10/10" in summary
+    if not fast:
+        # Each asset is displayed before the next one is linted
+        for number, output in enumerate(output_before_read[1:], start=1):
+            assert f"Asset {number}: {FEATURE_COLLECTION}/" in output
+        assert "All 10 Assets Checked" in summary
+
+
+@pytest.fixture
+def ndjson_file(tmp_path):
+    with open(FEATURE_COLLECTION) as f:
+        features = json.load(f)["features"]
+    path = tmp_path / "items.ndjson"
+    lines = [json.dumps(feature) for feature in features]
+    # Blank lines are skipped, invalid lines are reported by their line number
+    lines[2:2] = ["", "not json", "[1, 2]"]
+    path.write_text("\n".join(lines) + "\n")
+    return path, features
+
+
+def test_iter_ndjson_lines(ndjson_file):
+    path, features = ndjson_file
+
+    lines = list(iter_ndjson_lines(str(path)))
+
+    assert [number for number, _ in lines][:5] == [1, 2, 4, 5, 6]
+    assert json.loads(lines[0][1]) == features[0]
+    assert is_ndjson(str(path)) and is_ndjson("-") and is_ndjson("items.JSONL")
+    assert not is_ndjson(FEATURE_COLLECTION)
+
+
+@pytest.mark.parametrize(
+    "options", [{}, {"workers": 2, "chunk_size": 3}, {"batch_geometry": True}]
+)
+def test_api_linter_ndjson_matches_stream(ndjson_file, options):
+    path, _ = ndjson_file
+    expected = ApiLinter(
+        source=FEATURE_COLLECTION, object_list_key="features", stream=True
+    ).lint_all()
+
+    linter = ApiLinter(source=str(path), object_list_key="features", **options)
+    results = linter.lint_all()
+
+    assert linter.stream
+    assert [result["path"] for result in results[2:4]] == [
+        f"{path}:4",
+        f"{path}:5",
+    ]
+    assert all(result["valid_stac"] is False for result in results[2:4])
+    del results[2:4]
+    for result, expected_result in zip(results, expected):
+        expected_result["path"] = expected_result["path"].replace(
+            FEATURE_COLLECTION, str(path)
+        )
+        if not options.get("batch_geometry"):
+            assert result == expected_result
+    assert len(results) == len(expected)
+
+
+def test_api_linter_ndjson_from_stdin(ndjson_file, monkeypatch):
+    path, features = ndjson_file
+    monkeypatch.setattr("sys.stdin", io.StringIO(path.read_text()))
+
+    results = ApiLinter(source="-", object_list_key="features").lint_all()
+
+    assert len(results) == len(features) + 2
+    assert results[0]["path"] == f"-/{features[0]['id']}"
+
+
+class LineReader(io.RawIOBase):
+    """Standard input that hands out one line per read, recording the output so far."""
+
+    def __init__(self, lines):
+        self.lines = [line.encode("utf-8") for line in lines]
+        self.output_before_read = []
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if not self.lines or not len(buffer):
+            return 0
+        sys.stdout.flush()
+        self.output_before_read.append(sys.stdout.buffer.getvalue().decode("utf-8"))
+        line, self.lines[0] = self.lines[0][: len(buffer)], self.lines[0][len(buffer) :]
+        if not self.lines[0]:
+            self.lines.pop(0)
+        buffer[: len(line)] = line
+        return len(line)
+
+
+def test_cli_displays_ndjson_from_stdin_as_read(ndjson_file):
+    path, _ = ndjson_file
+    lines = path.read_text().splitlines(keepends=True)
+    stdin = LineReader(lines)
+
+    result = CliRunner().invoke(cli_main, ["-"], input=stdin)
+
+    assert result.exit_code == 1, result.output
+    assert "Passed: 10/12" in result.output
+    # Every object is displayed before the next line is read
+    assert len(stdin.output_before_read) == len(lines)
+    for number, output in enumerate(stdin.output_before_read):
+        read = sum(1 for line in lines[:number] if line.strip())
+        assert output.count(" Asset ") == read